@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+
+from playwright.async_api import Page, expect
+from config import BASE_URL, ARTIFACTS_DIR
+from base.base_page import _is_upload_response
+from utils.wait_telemetry import flow_telemetry, network_tracker
+
+
+class AsyncBasePage:
+    """BasePage for playwright.async_api pages: the same navigation and wait engine, awaited,
+    so many page objects can share one event loop. Waits are timed per flow (flow_telemetry)."""
+
+    _race_winners = {}   # (page object class, race key) -> winning candidate index
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.network = network_tracker(page)
+
+    async def navigate(self, path: str = "", retries: int = 3):
+        """Navigate to BASE_URL + path with retry logic"""
+        url = BASE_URL.rstrip("/") + "/" + path.lstrip("/")
+        for attempt in range(retries):
+            try:
+                await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                return
+            except Exception:
+                if attempt == retries - 1:
+                    raise
+                await asyncio.sleep(2)
+
+    # ----------------- Wait engine -----------------
+    async def wait_until(self, predicate, timeout: int = 10000, interval: float = 0.1, kind: str = "condition"):
+        """Poll predicate() (sync or async) until it returns something truthy and return that value"""
+        deadline = time.monotonic() + timeout / 1000
+        with flow_telemetry().timed(kind):
+            while True:
+                value = predicate()
+                if asyncio.iscoroutine(value):
+                    value = await value
+                if value:
+                    return value
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{kind} not met within {timeout} ms")
+                await asyncio.sleep(interval)
+
+    async def wait_for_upload(self, upload, timeout: int = 30000):
+        """Await upload() (e.g. set_input_files) and wait until the POST/PUT it triggers has answered"""
+        async with self.page.expect_response(_is_upload_response, timeout=timeout) as response_info:
+            await upload()
+            started = time.monotonic()
+        flow_telemetry().add("upload", time.monotonic() - started)
+        return await response_info.value
+
+    async def wait_for_enabled(self, locator, timeout: int = 10000):
+        with flow_telemetry().timed("enabled"):
+            await expect(locator).to_be_enabled(timeout=timeout)
+        return locator
+
+    async def wait_for_network_quiet(self, quiet_ms: int = 500, timeout: int = 15000):
+        """Wait until no request has started or settled for quiet_ms"""
+        await self.wait_until(lambda: self.network.quiet_for() * 1000 >= quiet_ms, timeout, interval=0.05,
+                              kind="network quiet")
+
+    async def race_locators(self, candidates, key: str = None, timeout: int = 10000):
+        """Wait for whichever candidate attaches first and return it (winner kept per class and key)"""
+        slot = (type(self).__name__, key)
+        cached = self._race_winners.get(slot)
+        if cached is not None and await candidates[cached].count():
+            return candidates[cached]
+        combined = candidates[0]
+        for candidate in candidates[1:]:
+            combined = combined.or_(candidate)
+        with flow_telemetry().timed("locator race"):
+            await expect(combined.first).to_be_attached(timeout=timeout)
+        for index, candidate in enumerate(candidates):
+            if await candidate.count():
+                if key is not None:
+                    self._race_winners[slot] = index
+                return candidate
+        return combined
+
+    async def take_screenshot(self, name: str = None):
+        """Take screenshot and save in ARTIFACTS_DIR"""
+        os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
+        path = os.path.join(ARTIFACTS_DIR, filename)
+        await self.page.screenshot(path=path)
+        return path
@@ -1,11 +1,20 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 from config import BASE_URL, ARTIFACTS_DIR
+from utils.auth_cache import auth_cache
+from utils.context_pool import clocked_contexts
+from utils.wait_telemetry import network_tracker, wait_telemetry
+import math
 import os
 import time
 
 class BasePage:
+    PAUSE_AHEAD = 1   # seconds pause_clock jumps past the page's clock
+    # (page object class, race key) -> index of the candidate that won last time in this session
+    _race_winners = {}
+
     def __init__(self, page: Page):
         self.page = page
+        self.network = network_tracker(page)
 
     def navigate(self, path: str = "", retries: int = 3):
         """Navigate to BASE_URL + path with retry logic"""
@@ -13,12 +22,115 @@ class BasePage:
         for attempt in range(retries):
             try:
                 self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                self._check_cached_session()
                 return
             except Exception as e:
                 if attempt == retries - 1:
                     raise
                 time.sleep(2)
 
+    def _check_cached_session(self):
+        """Invalidate the cached login if a navigation landed back on the login tab"""
+        email = auth_cache.tracked_email(self.page)
+        if email and self.page.get_by_role("tab", name="Login/Signin").is_visible():
+            auth_cache.invalidate(email)
+
+    # ----------------- Clock control -----------------
+    def install_clock(self):
+        """Install Playwright's fake clock; call before navigate so every app timer is faked.
+        The context is marked so a context pool closes it instead of reusing it."""
+        clocked_contexts.add(self.page.context)
+        self.page.clock.install()
+
+    def pause_clock(self):
+        """Freeze virtual time a little ahead of the page's Date.now() and return it (seconds).
+
+        Playwright fast-forwards to the pause point and refuses to go backwards, and the fake
+        clock keeps running in real time until it is paused; PAUSE_AHEAD whole seconds covers
+        the round trip. Pause before starting the countdown under test (seconds_until_enabled
+        counts from its own first check), so the jump lands before the countdown exists.
+        """
+        pause_at = math.ceil(self.page.evaluate("Date.now()") / 1000) + self.PAUSE_AHEAD
+        self.page.clock.pause_at(pause_at)
+        return pause_at
+
+    def advance_clock(self, seconds: float):
+        """Run virtual time forward, firing every timer due on the way"""
+        self.page.clock.run_for(int(seconds * 1000))
+        # let renders scheduled by those timers (MessageChannel tasks) land before asserting
+        self.page.evaluate(
+            "() => new Promise(r => { const c = new MessageChannel(); c.port1.onmessage = () => r(); c.port2.postMessage(null); })"
+        )
+
+    def seconds_until_enabled(self, locator, limit: int):
+        """Step the paused clock one virtual second at a time; return the second the locator
+        became enabled, or None if it was still disabled after `limit` seconds"""
+        for second in range(limit + 1):
+            if locator.is_enabled():
+                return second
+            if second < limit:
+                self.advance_clock(1)
+        return None
+
+    # ----------------- Wait engine -----------------
+    def wait_until(self, predicate, timeout: int = 10000, interval: float = 0.1, kind: str = "condition"):
+        """Poll predicate() until it returns something truthy and return that value.
+
+        Sleeps through page.wait_for_timeout: the sync API only dispatches page events (which
+        feed self.network) while a Playwright call is running, so time.sleep would starve them.
+        """
+        deadline = time.monotonic() + timeout / 1000
+        with wait_telemetry.timed(kind):
+            while True:
+                value = predicate()
+                if value:
+                    return value
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{kind} not met within {timeout} ms")
+                self.page.wait_for_timeout(interval * 1000)
+
+    def wait_for_upload(self, upload, timeout: int = 30000):
+        """Run upload() (e.g. set_input_files) and wait until the POST/PUT it triggers has answered"""
+        with self.page.expect_response(_is_upload_response, timeout=timeout) as response_info:
+            upload()
+            started = time.monotonic()
+        wait_telemetry.add("upload", time.monotonic() - started)
+        return response_info.value
+
+    def wait_for_row_count_change(self, rows, before: int, timeout: int = 10000):
+        """Wait until rows.count() differs from `before`; return the new count"""
+        self.wait_until(lambda: rows.count() != before, timeout, kind="row count")
+        return rows.count()
+
+    def wait_for_enabled(self, locator, timeout: int = 10000):
+        with wait_telemetry.timed("enabled"):
+            expect(locator).to_be_enabled(timeout=timeout)
+        return locator
+
+    def wait_for_network_quiet(self, quiet_ms: int = 500, timeout: int = 15000):
+        """Wait until no request has started or settled for quiet_ms"""
+        self.wait_until(lambda: self.network.quiet_for() * 1000 >= quiet_ms, timeout, interval=0.05,
+                        kind="network quiet")
+
+    def race_locators(self, candidates, key: str = None, timeout: int = 10000):
+        """Wait for whichever candidate attaches first and return it; the winner is remembered
+        per page object class under key (e.g. one per wizard step), so the next race checks it first"""
+        slot = (type(self).__name__, key)
+        cached = self._race_winners.get(slot)
+        if cached is not None and candidates[cached].count():
+            return candidates[cached]
+        combined = candidates[0]
+        for candidate in candidates[1:]:
+            combined = combined.or_(candidate)
+        with wait_telemetry.timed("locator race"):
+            expect(combined.first).to_be_attached(timeout=timeout)
+        for index, candidate in enumerate(candidates):
+            if candidate.count():
+                if key is not None:
+                    self._race_winners[slot] = index
+                return candidate
+        return combined
+
     def take_screenshot(self, name: str = None):
         """Take screenshot and save in ARTIFACTS_DIR"""
         if not os.path.exists(ARTIFACTS_DIR):
@@ -29,3 +141,8 @@ class BasePage:
         self.page.screenshot(path=path)
         print(f"Screenshot saved: {path}")
         return path
+
+
+def _is_upload_response(response):
+    request = response.request
+    return request.method in ("POST", "PUT") and request.resource_type in ("fetch", "xhr")
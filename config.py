@@ -1,12 +1,77 @@
 # config.py
 import os
 
-BASE_URL = "http://192.168.1.8:5173/"
+# Backend under test: "real" (shared dev server), "stub" (local stand-in server)
+# or "route" (stand-in answered in-browser through context.route)
+BACKEND_MODE = os.environ.get("PB_BACKEND", "real")
+REAL_BASE_URL = "http://192.168.1.8:5173/"
+STUB_HOST = "127.0.0.1"
+# one stand-in server per xdist worker (gw0 -> 5180, gw1 -> 5181, ...)
+STUB_PORT = int(os.environ.get("PB_STUB_PORT", "5180")) + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+BASE_URL = REAL_BASE_URL if BACKEND_MODE == "real" else f"http://{STUB_HOST}:{STUB_PORT}/"
 BROWSER = "chromium"      # chromium | firefox | webkit
 TIMEOUT = 60000           # ms
 
 CSV_FILE = "data/testdata.csv"  # ✅ CSV with credentials
+EXCEL_FILE = "data/testdata.xlsx"  # country sheet
 ARTIFACTS_DIR = "artifacts"
 REPORTS_DIR = "reports"
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-UPLOADS_DIR = os.path.join(BASE_DIR, "Uploads")
+UPLOADS_DIR = os.path.join(BASE_DIR, "uploads")
+UPLOAD_CACHE_BYTES = 64 * 1024 * 1024  # in-memory upload payloads kept per process
+
+# Login storage-state cache (one UI login per BASE_URL + email per worker)
+AUTH_CACHE_ENABLED = True
+AUTH_STATE_DIR = os.path.join(ARTIFACTS_DIR, "auth")
+AUTH_STATE_TTL = 30 * 60  # seconds
+
+# Pre-warmed browser contexts reused between tests (pytest --context-pool=N; 0 = a new context per test)
+CONTEXT_POOL_SIZE = 0
+CONTEXT_POOL_MAX_USES = 25  # tests one context serves before it is replaced
+
+# Route-level resource blocking for form-only tests (@pytest.mark.block_resources("<profile>"));
+# "allow" URL globs are never blocked, for pages that need visuals (map tiles, media previews)
+RESOURCE_BLOCK_PROFILES = {
+    "fast": {
+        "types": ("image", "media", "font"),
+        "patterns": ("**/*.{png,jpg,jpeg,gif,svg,webp,ico,woff,woff2,ttf,mp4,webm}",),
+        "allow": (),
+    },
+    "visual": {
+        "types": ("image", "media", "font"),
+        "patterns": (),
+        "allow": ("**/uploads/**", "**/media/**", "**tile*/**", "**/*tile*.png"),
+    },
+}
+RESOURCE_SIZES_FILE = os.path.join(ARTIFACTS_DIR, "resource_sizes.json")  # learned bytes per blocked URL
+
+# HAR record/replay (pytest --har=record|replay|refresh), one HAR per TC ID
+HAR_DIR = os.path.join(ARTIFACTS_DIR, "har")
+HAR_MAX_AGE = 7 * 24 * 3600  # seconds before a recording counts as stale
+
+# Wizard CSV templates, stored by checksum (pytest --templates=once|always|skip)
+TEMPLATE_DIR = os.path.join(ARTIFACTS_DIR, "templates")
+
+# Synthetic state/district/city uploads for scale runs (utils/hierarchy_generator.py)
+GENERATED_DIR = os.path.join(ARTIFACTS_DIR, "generated")
+
+# Add Country wizard checkpoints: COUNTRY11-13 resume one draft instead of replaying the upload prefix
+CHECKPOINT_TTL = 60 * 60  # seconds
+
+# Simplified geofence variants (utils/geometry.complexity_ladder)
+GEOFENCE_DIR = os.path.join(ARTIFACTS_DIR, "geofence")
+
+# Unique codes/emails/phones for created records (utils/random_utils.py): one run number per
+# session (seconds since IDENTITY_EPOCH), a fixed block of ids per worker and kind inside it
+IDENTITY_EPOCH = 1767225600  # 2026-01-01T00:00:00Z
+IDENTITY_DIR = os.path.join(ARTIFACTS_DIR, "identities")
+IDENTITY_MAX_WORKERS = 32
+IDENTITY_PER_WORKER = 100  # ids of one kind a worker may take in one run
+
+# Per-test duration history (utils/duration_history.py) that pytest --shards balances workers with
+HISTORY_DB = os.path.join(ARTIFACTS_DIR, "durations.sqlite")
+HISTORY_WINDOW = 5             # latest runs of a TC ID its estimate is the median of
+HISTORY_DEFAULT_SECONDS = 30   # estimate when nothing comparable has run yet
+
+# Per-worker result journals, merged into CSV_FILE / testdata.xlsx at session end
+RESULTS_DIR = os.path.join(ARTIFACTS_DIR, "results")
@@ -0,0 +1,306 @@
+"""Async twins of the page objects, for running many independent flows on one event loop.
+
+Each twin reuses its sync page's locator definitions (locator construction does not await in
+either API) and mirrors the sync actions with awaited calls.
+"""
+import asyncio
+import os
+import re
+import time
+
+from playwright.async_api import expect
+from base.async_base_page import AsyncBasePage
+from pages.country_page import CountryLocators, TEMPLATE_FIXTURES
+from pages.forgot_password_page import ForgotPasswordLocators
+from pages.governance_page import GovernanceLocators, GOVERNANCE_FIXTURES
+from pages.login_page import LoginLocators
+from pages.party_page import PartyLocators
+from pages.personnel_page import PersonnelLocators
+from utils.assets import asset_path, asset_payload
+from utils.template_cache import template_cache
+
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+    async def login(self, email: str, password: str):
+        """UI login; contexts opened with a cached storage_state skip it by not calling this"""
+        await self.tab_login.click()
+        await self.input_email.fill(email)
+        await self.input_password.fill(password)
+        await self.btn_next.click()
+
+        await expect(self.btn_next).to_be_enabled(timeout=10000)
+        await asyncio.sleep(1)
+        await self.btn_next.click()
+
+        await expect(self.otp_message).to_be_visible(timeout=10000)
+        otp_value = (await self.otp_message.inner_text()).strip().split(":")[-1].strip()
+        for idx, char in enumerate(otp_value):
+            await self.otp_inputs.nth(idx).fill(char)
+
+        await expect(self.btn_login).to_be_visible(timeout=10000)
+        await self.btn_login.click()
+        await expect(self.tab_login).to_be_hidden(timeout=10000)
+
+
+class AsyncForgotPasswordPage(ForgotPasswordLocators, AsyncBasePage):
+    async def click_login_tab(self):
+        await self.page.get_by_role("tab", name="Login/Signin").click()
+
+    async def click_forgot_password_button(self):
+        await self.page.get_by_role("button", name="Forgot Password?").click()
+
+    async def is_heading_visible(self) -> bool:
+        locator = self.page.get_by_text("Forgot Password", exact=True)
+        await expect(locator).to_be_visible(timeout=5000)
+        return await locator.is_visible()
+
+    async def click_cross_button(self):
+        await self.page.get_by_role("button").first.click()
+
+    async def is_mobile_input_visible(self) -> bool:
+        locator = self.page.locator(self.MOBILE_INPUT)
+        await expect(locator).to_be_visible(timeout=5000)
+        return await locator.is_visible()
+
+    async def is_email_input_visible(self) -> bool:
+        locator = self.page.locator(self.EMAIL_INPUT)
+        await expect(locator).to_be_visible(timeout=5000)
+        return await locator.is_visible()
+
+    async def is_or_separator_visible(self) -> bool:
+        locator = self.page.get_by_text("Or", exact=True)
+        await expect(locator).to_be_visible(timeout=5000)
+        return await locator.is_visible()
+
+    async def enter_mobile_number(self, mobile: str):
+        locator = self.page.locator(self.MOBILE_INPUT)
+        await expect(locator).to_be_visible(timeout=5000)
+        await locator.fill(mobile)
+
+    async def enter_email(self, email: str):
+        locator = self.page.locator(self.EMAIL_INPUT)
+        await expect(locator).to_be_visible(timeout=5000)
+        await locator.fill(email)
+
+    async def click_next_button(self):
+        locator = self.page.locator(self.NEXT_BUTTON)
+        await expect(locator).to_be_visible(timeout=5000)
+        await locator.click()
+
+    async def is_next_button_disabled(self):
+        return await self.page.locator("button:has-text('Next')[disabled]").count() == 1
+
+    async def is_resend_disabled(self):
+        return await self.page.locator(self.RESEND_BUTTON).get_attribute("disabled") is not None
+
+    async def is_resend_enabled(self):
+        return await self.page.locator(self.RESEND_OTP_BUTTON).is_enabled()
+
+    async def click_back_button(self):
+        await self.page.locator(self.BACK_BUTTON).click()
+
+    async def enter_new_password(self, password):
+        await self.page.locator(self.NEW_PASSWORD_INPUT).fill(password)
+
+    async def toggle_password_visibility(self):
+        await self.page.locator(self.PASSWORD_EYE_ICON).first.click(force=True)
+
+    async def enter_confirm_password(self, password: str):
+        await self.page.locator(self.CONFIRM_PASSWORD_INPUT).fill(password)
+
+    async def is_register_button_enabled(self) -> bool:
+        return await self.page.locator(self.REGISTER_BUTTON).is_enabled()
+
+
+class AsyncPartyPage(PartyLocators):
+    async def navigate_party_section(self):
+        await self.get_started_btn.click()
+        await self.party_btn.click()
+
+    async def add_party(self, logo_file, party_name, party_code, country, state, district, city=None):
+        await self.add_party_btn.click()
+        await self.logo_input.set_input_files(asset_payload(logo_file))
+        await self.name_input.fill(party_name)
+        await self.code_input.fill(str(party_code))
+
+        await self.next_btn.click()
+        await self.page.get_by_role("combobox").click()
+        await self.page.get_by_role("option", name=country).click()
+        await self.page.get_by_role("combobox").nth(1).click()
+        await self.page.get_by_role("option", name=state).click()
+        await self.page.get_by_role("combobox").nth(2).click()
+        await self.page.get_by_role("option", name=district).click()
+
+        await self.next_btn.click()
+        await self.next_btn.click()
+        await self.back_to_home_btn.click()
+
+    async def edit_party(self, search_text: str, updated_name: str):
+        await self.search_party_input.click()
+        await self.search_party_input.fill(search_text)
+        await self.edit_icon_btn.click()
+        await self.name_input.click()
+        await self.name_input.press("ArrowRight")
+        await self.name_input.fill(updated_name)
+        await self.edit_party_btn.click()
+
+    async def view_party(self):
+        await self.view_icon.click()
+        await self.close_button.click()
+
+
+class AsyncPersonnelPage(PersonnelLocators, AsyncBasePage):
+    async def navigate_to_personnel(self):
+        await self.btn_get_started.click()
+        await self.btn_personnel.click()
+        await self.btn_add_personnel.click()
+
+    async def select_org_type(self):
+        await self.dropdown_org_type.click()
+        await self.option_governance.click()
+        await self.btn_next.click()
+
+    async def select_location(self):
+        for combobox, option in ((self.cmb_country, self.option_india), (self.cmb_state, self.option_telangana),
+                                 (self.cmb_city, self.option_hyderabad), (self.cmb_area, self.option_hydcity)):
+            await combobox.click()
+            await option.click()
+        await self.btn_next.click()
+
+    async def fill_personnel_details(self, first_name, last_name, phone, email, empid, address):
+        await self.input_first_name.fill(first_name)
+        await self.input_last_name.fill(last_name)
+        await self.input_phone.fill(phone)
+        await self.input_email.fill(email)
+        await self.input_empid.fill(empid)
+        await self.input_address.fill(address)
+
+        await self.btn_next.click()
+        await self.wait_for_enabled(self.btn_next)
+        await self.btn_next.click()
+        await self.btn_done.click()
+
+    async def add_personnel(self, firstname, lastname, phone, email, empid, address):
+        await self.navigate_to_personnel()
+        await self.select_org_type()
+        await self.select_location()
+        await self.fill_personnel_details(firstname, lastname, phone, email, empid, address)
+
+    async def view_personnel(self, search_name: str):
+        await self.btn_get_started.click()
+        await self.btn_personnel.click()
+        await self.input_search_personnel.click()
+        await self.input_search_personnel.fill(search_name)
+        await self.btn_view_personnel.click()
+        await self.btn_close_view.click()
+
+
+class AsyncGovernancePage(GovernanceLocators):
+    async def navigate_to_governance(self):
+        await self.get_started_btn.click()
+        await self.governance_btn.click()
+        await expect(self.comboboxes.first).to_be_visible(timeout=10000)
+
+    async def select_location(self, country, state, district, city):
+        for index, name in enumerate((country, state, district, city)):
+            await self.comboboxes.nth(index).click()
+            await self.page.get_by_role("option", name=name).click()
+
+    async def upload_file(self, relative_path: str, template: str = None):
+        await template_cache.fetch_async(self.page, self.download_btn, key=template and f"governance:{template}",
+                                         fixture=GOVERNANCE_FIXTURES.get(template, relative_path))
+        await self.file_input.set_input_files(asset_path(relative_path))
+        await self.next_btn.click()
+
+    async def upload_ministry_file(self, file_path: str):
+        await self.upload_file(file_path, template="ministry")
+
+    async def upload_roles_file(self, file_path: str):
+        await self.upload_file(file_path, template="roles")
+
+    async def upload_officers_file(self, file_path: str):
+        await self.upload_file(file_path, template="officers")
+
+    async def map_roles_to_personnel(self, roles_assignments: str):
+        pairs = [x.strip() for x in (roles_assignments or "").split(";") if "|" in x]
+        for idx, pair in enumerate(pairs):
+            role, person = pair.split("|", 1)
+            await self.dropdowns.nth(idx * 2).click()
+            await self.page.get_by_role("option", name=role, exact=True).click()
+            await self.dropdowns.nth(idx * 2 + 1).click()
+            await self.page.get_by_role("option", name=person, exact=True).click()
+        if pairs:
+            await self.next_btn.click()
+            await self.submit_btn.click()
+
+    async def view_governance(self):
+        await self.apply_btn.click()
+        await self.view_icon_btn.first.click()
+        await self.close_btn.click()
+
+
+class AsyncCountryPage(CountryLocators, AsyncBasePage):
+    async def open_country_page(self):
+        await self.btn_get_started.click()
+        await expect(self.btn_active).to_be_visible(timeout=10000)
+
+    async def click_add_country_and_fill_form(self, name: str = "Japan", code: str = "JPN"):
+        await expect(self.btn_add_country).to_be_visible(timeout=2000)
+        await self.btn_add_country.click()
+        await expect(self.input_country_name).to_be_visible(timeout=5000)
+        await self.input_country_name.fill(name)
+        await self.input_country_code.fill(code)
+        await self.btn_next_form.click()
+
+    async def fetch_template(self, step: str):
+        return await template_cache.fetch_async(self.page, self.btn_download, key=f"country:{step}",
+                                                fixture=TEMPLATE_FIXTURES[step])
+
+    async def upload_file_robustly(self, file_path: str, step: str = "csv"):
+        file_path = asset_path(file_path)
+        await self.wait_for_upload(lambda: self._set_upload_file(file_path, step))
+        return True
+
+    async def _set_upload_file(self, file_path: str, step: str = "csv"):
+        await self.page.evaluate(
+            """() => {
+                const input = document.getElementById('csv-upload');
+                if (input) {
+                    input.style.display = 'block';
+                    input.style.visibility = 'visible';
+                    input.removeAttribute('hidden');
+                }
+            }"""
+        )
+        try:
+            target = await self.race_locators([self.input_upload, self.input_upload_alt1], key=f"csv-upload:{step}")
+        except AssertionError:
+            if not await self.input_upload_alt2.count():
+                raise
+            target = self.input_upload_alt2
+        await target.first.set_input_files(file_path)
+
+    async def jurisdiction_and_fill_form(self, name: str = "Tajikistan", code: str = "TJK", hierarchy: dict = None):
+        """COUNTRY10 flow; returns per-step upload and preview seconds like CountryPage"""
+        files = dict(TEMPLATE_FIXTURES, **(hierarchy or {}))
+        timings = []
+        await self.click_add_country_and_fill_form(name, code)
+        for step, next_button in (
+            ("hierarchy", self.btn_next_form),
+            ("state", self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button")),
+            ("district", self.btn_next_form.first),
+            ("city", self.btn_next_form.first),
+        ):
+            await self.fetch_template(step)
+            started = time.monotonic()
+            await self.upload_file_robustly(files[step], step=step)
+            uploaded = time.monotonic()
+            await self.wait_for_enabled(self.btn_next_form.first, timeout=120000)
+            timings.append({
+                "step": step,
+                "file": os.path.basename(files[step]),
+                "upload_s": round(uploaded - started, 3),
+                "preview_s": round(time.monotonic() - uploaded, 3),
+            })
+            await next_button.click()
+        return timings
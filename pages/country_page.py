@@ -614,12 +614,61 @@
 
 from playwright.sync_api import Page, expect
 from base.base_page import BasePage
-import time
-import re
+from utils.assets import asset_path, asset_payload
+from utils.auth_cache import auth_cache
+from utils.geofence_index import hierarchy_rows, load_geofence_index
+from utils.random_utils import identities
+from utils.template_cache import template_cache
+from utils.wizard_checkpoint import wizard_checkpoints
+from contextlib import contextmanager
 import os
+import re
+import time
 
+# wizard step -> the uploads/ fixture whose header the downloaded template must match
+TEMPLATE_FIXTURES = {
+    "hierarchy": "ProblemBolo_hierarchy.csv",
+    "state": "stateV5.csv",
+    "district": "districtV5.csv",
+    "city": "cityV5.csv",
+}
+
+# COUNTRY11 geofence row -> default uploads/ file
+GEOFENCE_FIXTURES = {
+    "country": "JAMMU & KASHMIR_STATE.geojson",
+    "state": "Anantapur.kml",
+    "city": "AP.kml",
+}
+
+# COUNTRY11 geofence row -> the hierarchy row it geofences
+GEOFENCE_ROWS = {"state": "AndhraPradesh", "city": "NelloreCity"}
+
+def geofence_plan(hierarchy: dict = None) -> dict:
+    """{"country"/"state"/"city": file} COUNTRY11 uploads: the geofence utils.geofence_index assigns
+    each GEOFENCE_ROWS row of the uploaded hierarchy, GEOFENCE_FIXTURES where none is indexed.
+    The scale ladders build their variants from the same plan.
+
+    Fails before any browser work when a child row's geofence lies outside its parent's.
+    """
+    hierarchy = hierarchy or TEMPLATE_FIXTURES
+    index = load_geofence_index()
+    problems = index.check_nesting([(name, parent) for _, name, parent in hierarchy_rows(hierarchy)])
+    assert not problems, "geofences outside their parent: " + ", ".join(
+        f"{child} ({child_file}) not in {parent} ({parent_file})" for child, parent, child_file, parent_file in problems)
+    assignment = index.assign(hierarchy, default=GEOFENCE_FIXTURES)
+    plan = dict(GEOFENCE_FIXTURES)
+    plan.update({kind: os.path.basename(assignment[kind][row])
+                 for kind, row in GEOFENCE_ROWS.items() if assignment.get(kind, {}).get(row)})
+    return plan
+
+
+# Add Country wizard steps after the shared upload prefix, in order
+WIZARD_STEPS = ("geofence", "media", "summary")
+
+
+class CountryLocators:
+    """Locators shared by CountryPage and its async twin AsyncCountryPage"""
 
-class CountryPage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
         self.page = page
@@ -647,6 +696,8 @@ class CountryPage(BasePage):
             has_text="Add CountryName"
         ).nth(1).locator("input[type='file']")
 
+
+class CountryPage(CountryLocators, BasePage):
     def open_country_page(self):
         """Navigate to country dashboard page"""
         self.btn_get_started.click()
@@ -655,29 +706,28 @@ class CountryPage(BasePage):
     def click_active_tab(self):
         """Click on Active tab"""
         self.btn_active.click()
-        time.sleep(2)
+        self.wait_for_network_quiet()
 
     def click_inactive_tab(self):
         """Click on Inactive tab"""
         self.btn_inactive.click()
-        time.sleep(2)
+        self.wait_for_network_quiet()
 
     def click_draft_tab(self):
         """Click on Draft tab"""
         self.btn_draft.click()
-        time.sleep(2)
+        self.wait_for_network_quiet()
 
     def click_archive_tab(self):
         """Click on Archive tab"""
         self.btn_archive.click()
-        time.sleep(2)
+        self.wait_for_network_quiet()
 
     def click_add_country_button(self):
         """Click + Add Country"""
         expect(self.btn_add_country).to_be_visible(timeout=2000)
-        time.sleep(1)
         self.btn_add_country.click()
-        time.sleep(3)
+        self.wait_for_network_quiet()
         try:
             self.page.context.close()
         except Exception:
@@ -694,7 +744,7 @@ class CountryPage(BasePage):
 
         self.page.get_by_text("Country NameCountry Code").click()
         self.btn_next_form.click()
-        time.sleep(2)
+        self.wait_for_network_quiet()
 
     def hierarchy_and_fill_form(self, csv_path: str):
         """COUNTRY09: Fill form, download template, upload CSV"""
@@ -706,23 +756,23 @@ class CountryPage(BasePage):
         self.input_country_code.fill("ROM")
         self.btn_next_form.click()
 
-        with self.page.expect_download() as download_info:
-            self.btn_download.click()
-        _ = download_info.value
+        self.fetch_template("hierarchy")
 
-        file_path = self.get_file_path_with_fallback(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ProblemBolo_hierarchy.csv",
-            ["data/ProblemBolo_hierarchy.csv", "ProblemBolo_hierarchy.csv"],
-        )
+        file_path = asset_path("ProblemBolo_hierarchy.csv")
 
-        self.upload_file_robustly(file_path)
-        time.sleep(3)
+        self.upload_file_robustly(file_path, step="hierarchy")
 
-        self.btn_next_form.click()
-        time.sleep(2)
+        self.wait_for_enabled(self.btn_next_form).click()
+        self.wait_for_network_quiet()
 
-    def jurisdiction_and_fill_form(self, csv_path: str):
-        """COUNTRY10: Multiple CSV uploads for jurisdiction"""
+    def jurisdiction_and_fill_form(self, csv_path: str, hierarchy: dict = None):
+        """COUNTRY10: Multiple CSV uploads for jurisdiction.
+
+        hierarchy maps step -> CSV (e.g. HierarchyGenerator.write()) to replace the uploads/
+        fixtures; per-step upload and preview seconds are kept in self.upload_timings.
+        """
+        files = dict(TEMPLATE_FIXTURES, **(hierarchy or {}))
+        self.upload_timings = []
         expect(self.btn_add_country).to_be_visible(timeout=2000)
         self.btn_add_country.click()
 
@@ -732,406 +782,279 @@ class CountryPage(BasePage):
         self.btn_next_form.click()
 
         # Hierarchy upload
-        with self.page.expect_download() as download_info:
-            self.btn_download.click()
-        _ = download_info.value
-        file_path1 = self.get_file_path_with_fallback(
-             r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ProblemBolo_hierarchy.csv",
-            ["data/ProblemBolo_hierarchy.csv", "ProblemBolo_hierarchy.csv"],
-        )
-        self.upload_file_robustly(file_path1)
-        time.sleep(3)
+        self.fetch_template("hierarchy")
+        self._timed_upload("hierarchy", files["hierarchy"])
         self.btn_next_form.click()
 
         # State upload
-        with self.page.expect_download() as download1_info:
-            self.btn_download.click()
-        _ = download1_info.value
-        file_path2 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\stateV5.csv"
-        self.upload_file_robustly(file_path2)
-        time.sleep(3)
+        self.fetch_template("state")
+        self._timed_upload("state", files["state"])
         self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button").click()
 
         # District upload
-        with self.page.expect_download() as download2_info:
-            self.btn_download.click()
-        _ = download2_info.value
-        file_path3 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\districtV5.csv"
-        self.upload_file_robustly(file_path3)
-        time.sleep(3)
+        self.fetch_template("district")
+        self._timed_upload("district", files["district"])
         self.btn_next_form.first.click()
 
         # City upload
-        with self.page.expect_download() as download3_info:
-            self.btn_download.click()
-        _ = download3_info.value
-        file_path4 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\cityV5.csv"
-        self.upload_file_robustly(file_path4)
-        time.sleep(3)
+        self.fetch_template("city")
+        self._timed_upload("city", files["city"])
         self.btn_next_form.first.click()
-
-    def get_file_path_with_fallback(self, preferred_path: str, fallback_paths: list = None) -> str:
-        """Get a file path with fallback options"""
-        if fallback_paths is None:
-            fallback_paths = [
-                "data/testdata.csv",
-                "data/ProblemBolo_hierarchy.csv",
-                "ProblemBolo_hierarchy.csv",
-            ]
-
-        if os.path.exists(preferred_path):
-            return preferred_path
-
-        for fallback_path in fallback_paths:
-            if os.path.exists(fallback_path):
-                return fallback_path
-
-        raise FileNotFoundError(f"None of the following files exist: {preferred_path}, {fallback_paths}")
-
-    def upload_file_robustly(self, file_path: str):
-        """Upload files with fallback locators"""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        try:
-            self.page.wait_for_selector("input[type='file']", timeout=10000)
-        except:
-            pass
-
-        try:
-            try:
-                self.page.evaluate("document.getElementById('csv-upload').style.display = 'block';")
-                self.page.evaluate("document.getElementById('csv-upload').style.visibility = 'visible';")
-                self.page.evaluate("document.getElementById('csv-upload').removeAttribute('hidden');")
-            except:
-                pass
-
-            expect(self.input_upload).to_be_attached(timeout=10000)
-            self.input_upload.set_input_files(file_path)
-            return True
-        except Exception as e1:
-            try:
-                expect(self.input_upload_alt1).to_be_attached(timeout=5000)
-                self.input_upload_alt1.set_input_files(file_path)
-                return True
-            except Exception as e2:
-                try:
-                    expect(self.input_upload_alt2).to_be_attached(timeout=5000)
-                    self.input_upload_alt2.set_input_files(file_path)
-                    return True
-                except Exception as e3:
-                    try:
-                        file_inputs = self.page.locator("input[type='file']").all()
-                        if file_inputs:
-                            file_inputs[0].set_input_files(file_path)
-                            return True
-                    except:
-                        pass
-
-                    try:
-                        debug_info = self.page.evaluate(
-                            """
-                            const input = document.getElementById('csv-upload');
-                            if (input) {
-                                return {
-                                    display: input.style.display,
-                                    visibility: input.style.visibility,
-                                    hidden: input.hidden,
-                                    type: input.type,
-                                    accept: input.accept,
-                                    id: input.id,
-                                    offsetWidth: input.offsetWidth,
-                                    offsetHeight: input.offsetHeight
-                                };
-                            }
-                            return 'Element not found';
-                            """
-                        )
-                        raise Exception(f"Failed to upload file {file_path}. Debug info: {debug_info}. Errors: {e1}, {e2}, {e3}")
-                    except:
-                        raise Exception(f"Failed to upload file {file_path}. Errors: {e1}, {e2}, {e3}")
-
-    def Geofence_and_fill_form(self):
-        """COUNTRY11: Full flow with geofence uploads"""
-        expect(self.btn_add_country).to_be_visible(timeout=2000)
-        self.btn_add_country.click()
-
-        expect(self.input_country_name).to_be_visible(timeout=5000)
-        self.input_country_name.fill("Thailand")
-        self.input_country_code.fill("THA")
-        self.btn_next_form.click()
-
-        # Hierarchy upload
-        with self.page.expect_download() as download_info:
-            self.btn_download.click()
-        _ = download_info.value
-        file_path1 = self.get_file_path_with_fallback(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ProblemBolo_hierarchy.csv",
-            ["data/ProblemBolo_hierarchy.csv", "ProblemBolo_hierarchy.csv"],
+        return self.upload_timings
+
+    def _timed_upload(self, step: str, file_path: str):
+        """Upload one step's CSV; record seconds until the upload answered and until the preview let Next on"""
+        started = time.monotonic()
+        self.upload_file_robustly(file_path, step=step)
+        uploaded = time.monotonic()
+        self.wait_for_enabled(self.btn_next_form.first, timeout=120000)
+        self.upload_timings.append({
+            "step": step,
+            "file": os.path.basename(file_path),
+            "upload_s": round(uploaded - started, 3),
+            "preview_s": round(time.monotonic() - uploaded, 3),
+        })
+
+    def fetch_template(self, step: str):
+        """Download the step's CSV template unless this session already has it"""
+        return template_cache.fetch(self.page, self.btn_download, key=f"country:{step}",
+                                    fixture=TEMPLATE_FIXTURES[step])
+
+    def upload_file_robustly(self, file_path: str, step: str = "csv"):
+        """Upload files with fallback locators and wait for the upload request to finish"""
+        file_path = asset_path(file_path)
+        self.wait_for_upload(lambda: self._set_upload_file(file_path, step))
+        return True
+
+    def _set_upload_file(self, file_path: str, step: str = "csv"):
+        """Set file_path on whichever CSV file input of the wizard step is attached first"""
+        self.page.evaluate(
+            """() => {
+                const input = document.getElementById('csv-upload');
+                if (input) {
+                    input.style.display = 'block';
+                    input.style.visibility = 'visible';
+                    input.removeAttribute('hidden');
+                }
+            }"""
         )
-        self.upload_file_robustly(file_path1)
-        time.sleep(3)
-        self.btn_next_form.click()
-
-        # State upload
-        with self.page.expect_download() as download1_info:
-            self.btn_download.click()
-        _ = download1_info.value
-        file_path2 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\stateV5.csv"
-        self.upload_file_robustly(file_path2)
-        time.sleep(3)
-        self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button").click()
-
-        # District upload
-        with self.page.expect_download() as download2_info:
-            self.btn_download.click()
-        _ = download2_info.value
-        file_path3 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\districtV5.csv"
-        self.upload_file_robustly(file_path3)
-        time.sleep(3)
-        self.btn_next_form.first.click()
-
-        # City upload
-        with self.page.expect_download() as download3_info:
-            self.btn_download.click()
-        _ = download3_info.value
-        file_path4 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\cityV5.csv"
-        self.upload_file_robustly(file_path4)
-        time.sleep(3)
-        self.btn_next_form.first.click()
-
-        # Geofence - GeoJSON
-        self.page.get_by_role("row", name="Thailand Add GeoFence Draw on Map", exact=True).get_by_role("button").first.click()
-       
-        geojson_path = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\JAMMU & KASHMIR_STATE.geojson"
-        geojson_file_input = self.page.locator("input[type='file']").last
-        expect(geojson_file_input).to_be_attached(timeout=5000)
-        geojson_file_input.set_input_files(geojson_path)
-        time.sleep(2)
-        self.page.get_by_role("row", name="Thailand JAMMU &").get_by_role("button").nth(2).click()
-        self.page.get_by_role("button", name="View").click()
-        time.sleep(3)
-        self.page.get_by_role("button", name="Close").click()
-
-        # Geofence - KML (State)
-        self.page.get_by_role("row", name="AndhraPradesh Thailand").get_by_role("button").first.click()
-      
-        kml_path_1 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\Anantapur.kml"
-        kml_file_input_1 = self.page.locator("input[type='file']").last
-        expect(kml_file_input_1).to_be_attached(timeout=5000)
-        kml_file_input_1.set_input_files(kml_path_1)
-        time.sleep(2)
-        self.page.get_by_role("row", name="AndhraPradesh Thailand").get_by_role("button").nth(2).click()
-        self.page.get_by_role("button", name="View").click()
-        time.sleep(3)
-        self.page.get_by_role("button", name="Close").click()
-
-        # Geofence - KML (City)
-        self.page.get_by_role("row", name="NelloreCity Nellore Add").get_by_role("button").first.click()
-       
-        kml_path_2 = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\AP.kml"
-        kml_file_input_2 = self.page.locator("input[type='file']").last
-        expect(kml_file_input_2).to_be_attached(timeout=5000)
-        kml_file_input_2.set_input_files(kml_path_2)
-        time.sleep(2)
-        self.page.get_by_role("row", name="NelloreCity Nellore AP.kml Re").get_by_role("button").nth(2).click()
-        self.page.get_by_role("button", name="View").click()
-        time.sleep(3)
-        self.page.get_by_role("button", name="Close").click()
-
-        self.page.get_by_role("button", name="Next").click()
-
-    def media_and_fill_form(self):
-        
+        try:
+            target = self.race_locators([self.input_upload, self.input_upload_alt1], key=f"csv-upload:{step}")
+        except AssertionError as e:
+            # a bare file input matches any uploader on the page, so it never races; last resort only
+            if not self.input_upload_alt2.count():
+                raise Exception(f"Failed to upload file {file_path}: no file input attached. {e}") from e
+            target = self.input_upload_alt2
+        target.first.set_input_files(file_path)
+        return True
+
+    # ----------------- Add Country wizard pipeline -----------------
+    def wizard_step_marker(self, step: str):
+        """Locator that only shows once the wizard is on step"""
+        return {
+            "geofence": self.page.get_by_text("Draw on Map").first,
+            "media": self.page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeLarge").first,
+            "summary": self.page.get_by_role("button", name="Submit"),
+        }[step]
+
+    def start_wizard(self, name: str, code: str):
+        """Add Country details and the hierarchy/state/district/city uploads; leaves the wizard on the geofence step"""
         expect(self.btn_add_country).to_be_visible(timeout=2000)
         self.btn_add_country.click()
 
         expect(self.input_country_name).to_be_visible(timeout=5000)
-        self.input_country_name.fill("Turkey")
-        self.input_country_code.fill("TUR")
+        self.input_country_name.fill(name)
+        self.input_country_code.fill(code)
         self.btn_next_form.click()
 
-        # Hierarchy upload
-        with self.page.expect_download() as download_info:
-            self.btn_download.click()
-        _ = download_info.value
-        self.upload_file_robustly(r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ProblemBolo_hierarchy.csv")
-        self.btn_next_form.click()
-
-        # State upload
-        with self.page.expect_download() as download1_info:
-            self.btn_download.click()
-        _ = download1_info.value
-        self.upload_file_robustly(r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\stateV5.csv")
-        self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button").click()
-
-        # District upload
-        with self.page.expect_download() as download2_info:
-            self.btn_download.click()
-        _ = download2_info.value
-        self.upload_file_robustly(r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\districtV5.csv")
-        self.btn_next_form.first.click()
-
-        # City upload
-        with self.page.expect_download() as download3_info:
-            self.btn_download.click()
-        _ = download3_info.value
-        self.upload_file_robustly(r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\cityV5.csv")
-        self.btn_next_form.first.click()
+        for step, next_button in (
+            ("hierarchy", self.btn_next_form),
+            ("state", self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button")),
+            ("district", self.btn_next_form.first),
+            ("city", self.btn_next_form.first),
+        ):
+            self.fetch_template(step)
+            self.upload_file_robustly(TEMPLATE_FIXTURES[step], step=step)
+            next_button.click()
+
+    def resume_wizard(self, checkpoint):
+        """Reopen a checkpointed draft from the country list and click Next until its step shows"""
+        auth_cache.restore(self.page, checkpoint.storage_state)
+        self.open_draft_row(f"DRAFT {checkpoint.draft} {checkpoint.code}")
+        marker = self.wizard_step_marker(checkpoint.step)
+        for _ in range(len(TEMPLATE_FIXTURES) + len(WIZARD_STEPS)):
+            if marker.is_visible():
+                return
+            self.wait_for_enabled(self.btn_next_form.first, timeout=60000).click()
+            self.wait_for_network_quiet()
+        expect(marker).to_be_visible(timeout=10000)
+
+    def wizard_at(self, step: str, name: str, code: str, checkpoint: bool = False) -> str:
+        """Bring the Add Country wizard to step and return the country name its rows are labelled with.
+
+        Without checkpoint the whole prefix is replayed as name/code. With it, the first call in the
+        worker runs the prefix once under a unique draft name and checkpoints it; later calls reopen
+        that draft. Steps between the draft's and step get the default geofence/media uploads.
+        """
+        saved = wizard_checkpoints.get("country") if checkpoint else None
+        if saved is not None and WIZARD_STEPS.index(saved.step) <= WIZARD_STEPS.index(step):
+            self.resume_wizard(saved)
+            name, current = saved.draft, saved.step
+        else:
+            if checkpoint:
+                name += "".join(chr(ord("A") + int(d)) for d in identities.code(kind="country"))
+            self.start_wizard(name, code)
+            current = WIZARD_STEPS[0]
+            if checkpoint:
+                wizard_checkpoints.save("country", self.page, name, code, current)
+
+        for index in range(WIZARD_STEPS.index(current), WIZARD_STEPS.index(step)):
+            if WIZARD_STEPS[index] == "geofence":
+                self._default_geofence(name)
+            else:
+                self._fill_media()
+            self.page.get_by_role("button", name="Next").click()
+            if checkpoint:
+                wizard_checkpoints.advance("country", WIZARD_STEPS[index + 1])
+        return name
+
+    @contextmanager
+    def wizard_step(self, step: str, name: str, code: str, checkpoint: bool = False):
+        """Run one step from wizard_at(step); on success the checkpoint moves past it, on failure it is dropped"""
+        try:
+            yield self.wizard_at(step, name, code, checkpoint)
+        except BaseException:
+            if checkpoint:
+                wizard_checkpoints.invalidate("country")
+            raise
+        if checkpoint:
+            following = WIZARD_STEPS.index(step) + 1
+            if following < len(WIZARD_STEPS):
+                wizard_checkpoints.advance("country", WIZARD_STEPS[following])
+            else:
+                wizard_checkpoints.invalidate("country")
+
+    def _default_geofence(self, name: str):
+        """Upload india_district.geojson on the country row, as COUNTRY12/13 do"""
+        self.page.get_by_role("row", name=f"{name} Add GeoFence Draw on Map", exact=True).get_by_role("button").first.click()
 
-        # Geofence - GeoJSON (do NOT click the upload button, just set the file directly)
-        self.page.get_by_role("row", name="Turkey Add GeoFence Draw on Map", exact=True).get_by_role("button").first.click()
-      
         file_input = self.page.locator("input[type='file']").last
         expect(file_input).to_be_attached(timeout=5000)
-        file_input.set_input_files(r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\india_district.geojson")
-        time.sleep(2)
-        self.page.get_by_role("row", name="Turkey india_district.").get_by_role("button").nth(2).click()
+        self.wait_for_upload(lambda: file_input.set_input_files(asset_path("india_district.geojson")))
+        self.page.get_by_role("row", name=f"{name} india_district.").get_by_role("button").nth(2).click()
         self.page.get_by_role("button", name="View").click()
         self.page.get_by_role("button", name="Close").click()
 
-        self.page.get_by_role("button", name="Next").click()
-
-        # Media uploads (upload images for all image fields)
+    def _fill_media(self):
+        """Upload images and videos for every media field"""
         self.page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeLarge").first.click()
 
         image_files = [
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\Modern_Liberal_Party_symbol.png",
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ghmclogo.png",
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\T State Police Logo for Police Staff.png"
+            asset_payload("Modern_Liberal_Party_symbol.png"),
+            asset_payload("ghmclogo.png"),
+            asset_payload("T State Police Logo for Police Staff.png")
         ]
-        video_file = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\gP5dbROSGk_5Hxoz.mp4"
-       
+        video_file = asset_payload("gP5dbROSGk_5Hxoz.mp4")
 
         # Upload images for all image fields
         image_inputs = self.page.locator("input[type='file'][accept='image/*']")
         image_count = image_inputs.count()
         for i in range(image_count):
             file_path = image_files[i % len(image_files)]
-            image_inputs.nth(i).set_input_files(file_path)
-            time.sleep(2)
+            self.wait_for_upload(lambda: image_inputs.nth(i).set_input_files(file_path))
 
         # Upload video for all video fields
         video_inputs = self.page.locator("input[type='file'][accept='video/mp4']")
         video_count = video_inputs.count()
         for i in range(video_count):
-            video_inputs.nth(i).set_input_files(video_file)
-            time.sleep(2)
-
-        self.page.get_by_role("button", name="Next").click()
-
-    def summary_data(self):
-        """COUNTRY13: Complete country creation flow with all steps"""
-        # No login code needed here as it should be called after login in test
-        self.page.get_by_role("button", name="+ Add Country").click()
-        expect(self.page.get_by_role("textbox", name="Enter Country Name")).to_be_visible(timeout=5000)
-        self.page.get_by_role("textbox", name="Enter Country Name").fill("Ukraine")
-        self.page.get_by_role("textbox", name="Enter Country Code").fill("UKR")
-        self.page.get_by_role("button", name="Next").click()
-
-        # Hierarchy upload
-        with self.page.expect_download() as download_info:
-            self.page.get_by_role("button", name="Download").click()
-        _ = download_info.value
-        self.page.get_by_text("Upload", exact=True).click()
-        self.page.locator("div").filter(has_text="Add CountryName").nth(1).locator("input[type='file']").set_input_files(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ProblemBolo_hierarchy.csv"
-        )
-        time.sleep(3)
-        self.page.get_by_role("button", name="Next").click()
-
-        # State upload
-        with self.page.expect_download() as download1_info:
-            self.page.get_by_role("button", name="Download").click()
-        _ = download1_info.value
-        self.page.get_by_text("Upload", exact=True).click()
-        self.page.locator("div").filter(has_text="Add CountryName").nth(1).locator("input[type='file']").set_input_files(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\stateV5.csv"
-        )
-        self.page.locator("div").filter(has_text=re.compile(r"^Next$")).get_by_role("button").click()
-
-        # District upload
-        with self.page.expect_download() as download2_info:
-            self.page.get_by_role("button", name="Download").click()
-        _ = download2_info.value
-        self.page.get_by_text("Upload", exact=True).click()
-        self.page.locator("div").filter(has_text="Add CountryName").nth(1).locator("input[type='file']").set_input_files(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\districtV5.csv"
-        )
-        self.page.get_by_role("button", name="Next").first.click()
-
-        # City upload
-        with self.page.expect_download() as download3_info:
-            self.page.get_by_role("button", name="Download").click()
-        _ = download3_info.value
-        self.page.get_by_text("Upload", exact=True).click()
-        self.page.locator("div").filter(has_text="Add CountryName").nth(1).locator("input[type='file']").set_input_files(
-           r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\cityV5.csv"
-        )
-        self.page.get_by_role("button", name="Next").first.click()
-         # Geofence - GeoJSON
-        self.page.get_by_role("row", name="Ukraine Add GeoFence Draw on Map", exact=True).get_by_role("button").first.click()
-        geojson_input = self.page.locator("input[type='file']").last
-        geojson_input.set_input_files(
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\india_district.geojson"
-        )
-        self.page.get_by_role("row", name="Ukraine india_district.").get_by_role("button").nth(2).click()
+            self.wait_for_upload(lambda: video_inputs.nth(i).set_input_files(video_file))
+
+    def Geofence_and_fill_form(self, geofences: dict = None, checkpoint: bool = False):
+        """COUNTRY11: Full flow with geofence uploads.
+
+        Uploads the files geofence_plan() picks for each row; geofences maps
+        "country"/"state"/"city" to replacement files (e.g. utils.geometry.complexity_ladder
+        variants); per-upload upload and map-render seconds are kept in self.geofence_timings.
+        checkpoint resumes the worker's wizard draft instead of replaying the upload prefix.
+        """
+        files = dict(geofence_plan(), **(geofences or {}))
+        self.geofence_timings = []
+        with self.wizard_step("geofence", "Thailand", "THA", checkpoint) as name:
+            # Geofence - GeoJSON
+            self.page.get_by_role("row", name=f"{name} Add GeoFence Draw on Map", exact=True).get_by_role("button").first.click()
+            self._timed_geofence("country", files["country"], self.page.get_by_role("row", name=f"{name} JAMMU &"))
+
+            # Geofence - KML (State)
+            self.page.get_by_role("row", name=f"AndhraPradesh {name}").get_by_role("button").first.click()
+            self._timed_geofence("state", files["state"], self.page.get_by_role("row", name=f"AndhraPradesh {name}"))
+
+            # Geofence - KML (City)
+            self.page.get_by_role("row", name="NelloreCity Nellore Add").get_by_role("button").first.click()
+            city_row = f"NelloreCity Nellore {os.path.basename(files['city'])} Re"
+            self._timed_geofence("city", files["city"], self.page.get_by_role("row", name=city_row))
+
+            self.page.get_by_role("button", name="Next").click()
+        return self.geofence_timings
+
+    def _timed_geofence(self, kind: str, file_path: str, row):
+        """Upload one geofence file, open it on the map and close it again; record upload and render seconds"""
+        file_input = self.page.locator("input[type='file']").last
+        expect(file_input).to_be_attached(timeout=5000)
+        started = time.monotonic()
+        self.wait_for_upload(lambda: file_input.set_input_files(asset_path(file_path)))
+        uploaded = time.monotonic()
+        row.get_by_role("button").nth(2).click()
         self.page.get_by_role("button", name="View").click()
+        self.wait_for_network_quiet()
+        self.geofence_timings.append({
+            "kind": kind,
+            "file": file_path,
+            "bytes": os.path.getsize(asset_path(file_path)),
+            "upload_s": round(uploaded - started, 3),
+            "render_s": round(time.monotonic() - uploaded, 3),
+        })
         self.page.get_by_role("button", name="Close").click()
 
-        self.page.get_by_role("button", name="Next").click()
-
-        # Media uploads (images & video for all fields)
-        self.page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeLarge").first.click()
-        image_files = [
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\Modern_Liberal_Party_symbol.png",
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ghmclogo.png",
-            r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\T State Police Logo for Police Staff.png"
-        ]
-        video_file = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\gP5dbROSGk_5Hxoz.mp4"
-        # Upload images for all image fields
-        image_inputs = self.page.locator("input[type='file'][accept='image/*']")
-        image_count = image_inputs.count()
-        for i in range(image_count):
-            file_path = image_files[i % len(image_files)]
-            image_inputs.nth(i).set_input_files(file_path)
-            time.sleep(2)
-
-        # Upload video for all video fields
-        video_inputs = self.page.locator("input[type='file'][accept='video/mp4']")
-        video_count = video_inputs.count()
-        for i in range(video_count):
-            video_inputs.nth(i).set_input_files(video_file)
-            time.sleep(2)
+    def media_and_fill_form(self, checkpoint: bool = False):
+        """COUNTRY12: Media uploads, from the worker's wizard draft when checkpoint is set"""
+        with self.wizard_step("media", "Turkey", "TUR", checkpoint):
+            self._fill_media()
+            self.page.get_by_role("button", name="Next").click()
 
-        self.page.get_by_role("button", name="Next").click()
-        time.sleep(4)
-        self.page.get_by_role("button", name="Submit").click()
+    def summary_data(self, checkpoint: bool = False):
+        """COUNTRY13: Complete country creation flow with all steps"""
+        # No login code needed here as it should be called after login in test
+        with self.wizard_step("summary", "Ukraine", "UKR", checkpoint):
+            self.wait_for_enabled(self.page.get_by_role("button", name="Submit"), timeout=60000).click()
+
+    def open_draft_row(self, row_name: str):
+        """Page through the country list to row_name and open it for editing"""
+        for _ in range(10):
+            if self.page.get_by_role("row", name=row_name).count() > 0:
+                self.page.get_by_role("row", name=row_name).get_by_role("button").nth(1).click()
+                return True
+            next_btn = self.page.get_by_role("button", name="Go to next page")
+            if next_btn.is_enabled():
+                first_row = self.page.get_by_role("row").nth(1).inner_text()
+                next_btn.click()
+                self.wait_until(lambda: self.page.get_by_role("row").nth(1).inner_text() != first_row,
+                                kind="next page")
+            else:
+                break
+        raise Exception(f"Row '{row_name}' not found")
 
     def click_edit_modify_data(self, tc_id):
         """COUNTRY15/16: Edit existing country data"""
-        police_logo = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\T State Police Logo for Police Staff.png"
-        party_logo = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\Modern_Liberal_Party_symbol.png"
-        ghmc_logo = r"C:\Users\ramal\Desktop\Problem_Bolo_Automation\Problem_Bolo\uploads\ghmclogo.png"
-        
-        def find_and_click_row(row_name):
-            for _ in range(10):
-                if self.page.get_by_role("row", name=row_name).count() > 0:
-                   self.page.get_by_role("row", name=row_name).get_by_role("button").nth(1).click()
-                   return True
-                next_btn = self.page.get_by_role("button", name="Go to next page")
-                if next_btn.is_enabled():
-                   next_btn.click()
-                   time.sleep(1)
-                else:
-                  break
-            raise Exception(f"Row '{row_name}' not found")
+        # in-memory payloads: the same logos are pushed into several inputs per run
+        police_logo = asset_payload("T State Police Logo for Police Staff.png")
+        party_logo = asset_payload("Modern_Liberal_Party_symbol.png")
+        ghmc_logo = asset_payload("ghmclogo.png")
         
         if tc_id == "COUNTRY15":
-           find_and_click_row("DRAFT Japan JPN 15/09/")
+           self.open_draft_row("DRAFT Japan JPN 15/09/")
 
         elif tc_id == "COUNTRY16":
-             find_and_click_row("DRAFT Japan JPN 15/09/")
+             self.open_draft_row("DRAFT Japan JPN 15/09/")
              self.page.get_by_role("button", name="Next").click()
              self.page.get_by_role("button", name="Next").click()
              self.page.get_by_role("button", name="Next").nth(1).click()
@@ -1161,7 +1084,7 @@ class CountryPage(BasePage):
             view_btn = self.page.get_by_role("button", name="View")
             if view_btn.is_visible():
                 view_btn.click()
-                time.sleep(2)
+                self.wait_for_network_quiet()
         except Exception:
             pass
         
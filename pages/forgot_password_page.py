@@ -1,8 +1,8 @@
 from base.base_page import BasePage
 from playwright.sync_api import expect
 
-class ForgotPasswordPage(BasePage):
-    """Page object for Forgot Password functionality"""
+class ForgotPasswordLocators:
+    """Selectors shared by ForgotPasswordPage and its async twin AsyncForgotPasswordPage"""
 
     # ----------------- Locators -----------------
     LOGIN_TAB = "tab[name='Login/Signin']"
@@ -31,6 +31,48 @@ class ForgotPasswordPage(BasePage):
     OTP_INPUTS = "input[type='text'][maxlength='1']"  # 4 OTP inputs
     BACK_TO_HOME_BUTTON = "button:has-text('Back to Home')"
 
+
+class ForgotPasswordPage(ForgotPasswordLocators, BasePage):
+    """Page object for Forgot Password functionality"""
+
+    # (step, open method, reopen method, parameters) for utils.prefix_scheduler, in flow order
+    PREFIX_STEPS = (
+        ("modal", "open_modal", "reopen_modal", ()),
+        ("otp", "open_otp_tab", "reopen_otp_tab", ("email",)),
+        ("new_password", "open_new_password_tab", "reopen_new_password_tab", ()),
+    )
+
+    # ----------------- Prefix steps -----------------
+    def open_modal(self):
+        """Login screen -> Forgot Password modal on the Details tab"""
+        self.navigate()
+        self.click_login_tab()
+        self.click_forgot_password_button()
+
+    def reopen_modal(self):
+        """Close the modal if it is still open and open it again with an empty Details tab"""
+        cross = self.page.locator(self.CROSS_BUTTON)
+        if cross.is_visible():
+            cross.click()
+        self.click_forgot_password_button()
+
+    def open_otp_tab(self, email: str):
+        self.enter_email(email)
+        self.click_next_button()
+
+    def reopen_otp_tab(self, email: str):
+        """Back to the Details tab and Next again, for a fresh OTP tab"""
+        self.click_back_button()
+        self.open_otp_tab(email)
+
+    def open_new_password_tab(self):
+        self.click_next_button()
+
+    def reopen_new_password_tab(self):
+        """Back to the OTP tab and Next again, which clears both password fields"""
+        self.click_back_button()
+        self.click_next_button()
+
     # ----------------- Actions -----------------
     def click_login_tab(self):
         self.page.get_by_role("tab", name="Login/Signin").click()
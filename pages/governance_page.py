@@ -1,8 +1,18 @@
 import time
 from playwright.sync_api import Page
-import os
+from utils.assets import asset_path
+from utils.template_cache import template_cache
+
+# governance template -> fixture its downloaded header is checked against
+GOVERNANCE_FIXTURES = {
+    "ministry": "governanceV5/ministryV5.csv",
+    "roles": "governanceV5/rolesV5.csv",
+    "officers": "governanceV5/officersV5.csv",
+}
+
+class GovernanceLocators:
+    """Locators shared by GovernancePage and its async twin AsyncGovernancePage"""
 
-class GovernancePage:
     def __init__(self, page: Page):
         self.page = page
 
@@ -27,6 +37,9 @@ class GovernancePage:
         self.edit_icon_btn = page.get_by_role("button", name="primaryEditIcon").first
         self.view_icon_btn = self.page.get_by_role("button", name="primaryEyeIcon")
         self.close_btn = self.page.get_by_role("button", name="Close")
+
+
+class GovernancePage(GovernanceLocators):
     # ---------- Functions ----------
 
     def navigate_to_governance(self):
@@ -51,14 +64,13 @@ class GovernancePage:
         self.comboboxes.nth(3).click()
         self.page.get_by_role("option", name=city).click()
 
-    def upload_file(self, relative_path: str):
+    def upload_file(self, relative_path: str, template: str = None):
         """Generic upload method (handles download + file upload)"""
-        abs_path = os.path.abspath(relative_path)
+        abs_path = asset_path(relative_path)
 
-        # Download sample
-        with self.page.expect_download() as download_info:
-            self.download_btn.click()
-        download = download_info.value
+        # Download sample (once per session per template)
+        template_cache.fetch(self.page, self.download_btn, key=template and f"governance:{template}",
+                             fixture=GOVERNANCE_FIXTURES.get(template, relative_path))
 
         # Upload file
         self.file_input.set_input_files(abs_path)
@@ -67,13 +79,13 @@ class GovernancePage:
         self.next_btn.click()
 
     def upload_ministry_file(self, file_path: str):
-        self.upload_file(file_path)
+        self.upload_file(file_path, template="ministry")
 
     def upload_roles_file(self, file_path: str):
-        self.upload_file(file_path)
+        self.upload_file(file_path, template="roles")
 
     def upload_officers_file(self, file_path: str):
-        self.upload_file(file_path)
+        self.upload_file(file_path, template="officers")
 
     def map_roles_to_personnel(self, roles_assignments: str):
         """
@@ -118,13 +130,13 @@ class GovernancePage:
         # Click the edit icon to modify governance body
         self.edit_icon_btn.click()
 
-        self.page.set_input_files("input[type='file']", updated_ministry_file)
+        self.page.set_input_files("input[type='file']", asset_path(updated_ministry_file))
         self.next_btn.click()
 
     def update_roles_file(self, roles_file: str):
         """Update governance roles with updated roles file."""
         
-        self.page.set_input_files("input[type='file']", roles_file)
+        self.page.set_input_files("input[type='file']", asset_path(roles_file))
 
     # Wait for next section or Next button to appear again (if applicable)
         self.next_btn.wait_for(state="visible", timeout=10000)
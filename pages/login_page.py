@@ -1,9 +1,12 @@
 from playwright.sync_api import Page, expect
 from base.base_page import BasePage
+from utils.auth_cache import auth_cache
 import time
 
 
-class LoginPage(BasePage):
+class LoginLocators:
+    """Locators shared by LoginPage and its async twin AsyncLoginPage"""
+
     def __init__(self, page: Page):
         super().__init__(page)
         self.tab_login = page.get_by_role("tab", name="Login/Signin")
@@ -25,8 +28,13 @@ class LoginPage(BasePage):
         self.btn_logout = page.get_by_role("button", name="Click here to Logout")
         self.error_message = page.locator("div.MuiAlert-message")
 
-    def login(self, email: str, password: str):
-        
+
+class LoginPage(LoginLocators, BasePage):
+    def login(self, email: str, password: str, use_cache: bool = True):
+        """Log in through the UI, or reuse this worker's cached session for the email"""
+        if use_cache and self.restore_session(email):
+            return
+
         self.tab_login.click()
 
        
@@ -49,3 +57,28 @@ class LoginPage(BasePage):
 
         expect(self.btn_login).to_be_visible(timeout=10000)
         self.btn_login.click()
+
+        # Cache the authenticated storage state once the login tab is gone
+        if auth_cache.enabled:
+            expect(self.tab_login).to_be_hidden(timeout=10000)
+            auth_cache.save(self.page, email)
+
+    def restore_session(self, email: str) -> bool:
+        """Apply the cached storage state; False (and invalidated) if it lands on the login tab"""
+        state = auth_cache.load(email)
+        if state is None:
+            return False
+
+        auth_cache.restore(self.page, state)
+        self.page.reload(wait_until="domcontentloaded")
+        expect(self.tab_login.or_(self.btn_get_started)).to_be_visible(timeout=10000)
+        if self.tab_login.is_visible():
+            auth_cache.invalidate(email)
+            return False
+
+        auth_cache.track(self.page, email)
+        return True
+
+    def forget_session(self, email: str):
+        """Drop the cached session, e.g. after logging out"""
+        auth_cache.invalidate(email)
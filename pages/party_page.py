@@ -1,6 +1,9 @@
 from playwright.sync_api import Page
+from utils.assets import asset_payload
+
+class PartyLocators:
+    """Locators shared by PartyPage and its async twin AsyncPartyPage"""
 
-class PartyPage:
     def __init__(self, page: Page):
         self.page = page
         self.get_started_btn = page.get_by_role("button", name="Get Started")
@@ -22,6 +25,7 @@ class PartyPage:
         self.close_button = page.get_by_role("button", name="Close")
 
 
+class PartyPage(PartyLocators):
     def navigate_party_section(self):
         self.get_started_btn.click()
         self.party_btn.click()
@@ -29,7 +33,7 @@ class PartyPage:
     def add_party(self, logo_file, party_name, party_code, country, state, district, city):
         self.add_party_btn.click()
 
-        self.logo_input.set_input_files(logo_file)
+        self.logo_input.set_input_files(asset_payload(logo_file))
 
         self.name_input.fill(party_name)
         self.code_input.fill(str(party_code))
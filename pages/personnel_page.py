@@ -3,7 +3,9 @@ from playwright.sync_api import Page
 from base.base_page import BasePage
 
 
-class PersonnelPage(BasePage):
+class PersonnelLocators:
+    """Locators shared by PersonnelPage and its async twin AsyncPersonnelPage"""
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -53,6 +55,8 @@ class PersonnelPage(BasePage):
         self.btn_view_personnel = page.get_by_role("button", name="primaryEyeIcon")
         self.btn_close_view = page.get_by_role("button", name="Close")
 
+
+class PersonnelPage(PersonnelLocators, BasePage):
     # ---------------- ACTION METHODS ----------------
     def navigate_to_personnel(self):
         self.btn_get_started.click()
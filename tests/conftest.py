@@ -1,14 +1,484 @@
 # tests/conftest.py
 import pytest
-from config import ARTIFACTS_DIR
+from config import ARTIFACTS_DIR, BACKEND_MODE, BASE_URL, CONTEXT_POOL_SIZE, STUB_HOST, STUB_PORT
+from pages.country_page import TEMPLATE_FIXTURES
+from utils.assets import load_assets
+from utils.auth_cache import auth_cache
+from utils.context_pool import ContextPool
+from utils.duration_history import duration_history, lpt_shards
+from utils.har_store import HAR_MODES, HarStore
+from utils.hierarchy_check import check_hierarchy
+from utils.prefix_scheduler import EFFECTS, PrefixScheduler
+from utils.random_utils import identities
+from utils.resource_blocker import ResourceBlocker, learn_sizes, resource_sizes
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data, tc_id_for_item
+from utils.template_cache import TEMPLATE_MODES, template_cache
+from utils.stub_backend import StubBackend, StubServer, install_routes, install_routes_async
+from utils.wait_telemetry import wait_telemetry
 import os
 import time
 
+# country wizard tests that upload the state/district/city fixtures
+HIERARCHY_TCS = ("COUNTRY10", "COUNTRY11", "COUNTRY12", "COUNTRY13")
+# wizard steps forked from one checkpointed draft; kept on one worker, in order, under --dist loadgroup
+WIZARD_CHECKPOINT_TCS = ("COUNTRY11", "COUNTRY12", "COUNTRY13")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Drive the full UI login in every test instead of reusing cached sessions",
+    )
+    parser.addoption(
+        "--fresh-auth-cache",
+        action="store_true",
+        default=False,
+        help="Discard this worker's cached sessions before the run",
+    )
+    parser.addoption(
+        "--har",
+        choices=HAR_MODES,
+        default="off",
+        help="record: capture a HAR per TC ID; replay: serve fresh HARs, run the rest live; "
+             "refresh: replay fresh HARs and re-record missing or stale ones",
+    )
+    parser.addoption(
+        "--scale-rows",
+        default="",
+        help="Comma-separated row counts (e.g. 1000,100000,1000000) for the generated-hierarchy "
+             "country onboarding scale test; it is skipped when empty",
+    )
+    parser.addoption(
+        "--governance-rows",
+        default="",
+        help="Comma-separated row counts (e.g. 10,1000,100000) for the generated governance upload and "
+             "mapping scale test; it is skipped when empty",
+    )
+    parser.addoption(
+        "--async-flows",
+        default="",
+        help="Comma-separated flow counts (e.g. 20,50) for the in-process async concurrency tests; "
+             "they are skipped when empty",
+    )
+    parser.addoption(
+        "--geofence-formats",
+        default="",
+        help="Comma-separated geofence formats (kml,geojson) to run COUNTRY11 in, every file converted "
+             "to each; it is skipped when empty",
+    )
+    parser.addoption(
+        "--geofence-tolerances",
+        default="",
+        help="Comma-separated simplification tolerances in degrees (e.g. 0,0.001,0.01,0.05) for the "
+             "COUNTRY11 geofence complexity ladder; it is skipped when empty",
+    )
+    parser.addoption(
+        "--identity-seed",
+        type=int,
+        default=None,
+        help="Run number for generated party codes, emails, phones and emp IDs; reuse an earlier "
+             "run's number to replay its ids (default: seconds since config.IDENTITY_EPOCH)",
+    )
+    parser.addoption(
+        "--context-pool",
+        type=int,
+        default=CONTEXT_POOL_SIZE,
+        help="Keep N pre-warmed browser contexts per worker and reset them between tests instead of "
+             "opening a new context per test (0: off; --har runs always use fresh contexts)",
+    )
+    parser.addoption(
+        "--no-resource-blocking",
+        action="store_true",
+        help="Ignore @pytest.mark.block_resources and load every image, font and media asset",
+    )
+    parser.addoption(
+        "--shards",
+        type=int,
+        default=0,
+        help="Split the tests into N xdist groups of about equal recorded duration (longest first); "
+             "run with -n N --dist loadgroup",
+    )
+    parser.addoption(
+        "--no-prefix-sharing",
+        action="store_true",
+        help="Give @pytest.mark.prefix_step tests their own page and replay their whole step prefix",
+    )
+    parser.addoption(
+        "--templates",
+        choices=TEMPLATE_MODES,
+        default="once",
+        help="once: download each wizard template once per session; always: on every step; "
+             "skip: reuse templates an earlier session already checked",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "block_resources(profile='fast', allow=(), types=None, patterns=None): abort the "
+        "config.RESOURCE_BLOCK_PROFILES resource types/URL globs this test does not need",
+    )
+    config.addinivalue_line(
+        "markers",
+        "prefix_step(step, effect='read'): start from the page object's PREFIX_STEPS step on the "
+        "module's shared page; effect read/write/leave says what the test does to that step",
+    )
+    # registered here too so runs without pytest-xdist accept the prefix/wizard/shard pins
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run every test of the group on the same xdist worker (--dist loadgroup)",
+    )
+    if config.getoption("--no-auth-cache"):
+        auth_cache.enabled = False
+    if config.getoption("--fresh-auth-cache"):
+        auth_cache.clear()
+    config.har_store = HarStore(config.getoption("--har"))
+    template_cache.mode = config.getoption("--templates")
+    if not hasattr(config, "workerinput"):
+        result_journal.reset()
+        identities.start_run(config.getoption("--identity-seed"))
+        duration_history.recording = True
+
+
+def pytest_generate_tests(metafunc):
+    """Scale tests take their ladder from the command line and are skipped without one"""
+    for argname, option, cast in (("scale_rows", "--scale-rows", int),
+                                  ("governance_rows", "--governance-rows", int),
+                                  ("async_flows", "--async-flows", int),
+                                  ("geofence_tolerance", "--geofence-tolerances", float),
+                                  ("geofence_format", "--geofence-formats", str.strip)):
+        if argname in metafunc.fixturenames:
+            values = [cast(v) for v in metafunc.config.getoption(option).split(",") if v.strip()]
+            metafunc.parametrize(argname, values or [pytest.param(0, marks=pytest.mark.skip(reason=f"{option} not set"))])
+
+
+def pytest_sessionstart(session):
+    load_assets()  # one scan of uploads/ per process; page objects resolve names against it
+
+
+def pytest_sessionfinish(session):
+    """Workers only close their journal; the controller merges all of them once"""
+    identities.close()
+    resource_sizes.save()
+    if hasattr(session.config, "workerinput"):
+        result_journal.close()
+        return
+    duration_history.save()
+    for path in result_journal.merge():
+        print(f"\nResults merged into {path}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Compile every collected test's Test Data (and check the hierarchy CSVs the country wizard
+    tests upload) now, so a bad row fails before any browser work. Runs first so the xdist_group
+    pins below are on the items before pytest-xdist turns them into loadgroup node IDs."""
+    registry = load_tc_data()
+    config.tc_data_errors = {}
+    _schedule_prefix_steps(items)
+    hierarchy_errors = None
+    for item in items:
+        tc_id = tc_id_for_item(item, registry)
+        item.user_properties.append(("tc_id", tc_id))
+        record = registry.get(tc_id)
+        errors = list(record.params.errors) if record is not None else []
+        if tc_id in WIZARD_CHECKPOINT_TCS and item.name.startswith("test_country_filters"):
+            item.add_marker(pytest.mark.xdist_group("country-wizard"))
+        if tc_id in HIERARCHY_TCS:
+            if hierarchy_errors is None:
+                hierarchy_errors = check_hierarchy(TEMPLATE_FIXTURES).errors()
+            errors += hierarchy_errors
+        if errors:
+            config.tc_data_errors[item.nodeid] = (tc_id, errors)
+    config.shard_plan = _shard_items(items, config.getoption("--shards"))
+
+
+def _shard_items(items, shards: int):
+    """Put every test in an xdist_group "shard-<k>" chosen longest-processing-time-first from its
+    recorded duration; tests already grouped (prefix sharing, wizard checkpoints) move together.
+    Every worker computes the same plan: the history is only written at session end."""
+    if shards < 1:
+        return []
+    tests = [(dict(item.user_properties)["tc_id"], item.nodeid) for item in items]
+    estimates = duration_history.estimates(tests)
+    units = {}
+    for item, test in zip(items, tests):
+        group = item.get_closest_marker("xdist_group")
+        key = group.args[0] if group else item.nodeid
+        seconds, members = units.get(key, (0.0, []))
+        units[key] = (seconds + estimates[test], members + [item])
+    plan = lpt_shards(units.values(), shards)
+    for index, (_, members) in enumerate(plan):
+        for unit in members:
+            for item in unit:
+                item.add_marker(pytest.mark.xdist_group(f"shard-{index}"), append=False)
+    return [(seconds, sum(len(unit) for unit in members)) for seconds, members in plan]
+
+
+def _schedule_prefix_steps(items):
+    """Run each module's prefix_step tests grouped by step (in order of first use), readers before
+    writers before leavers, in the slots they were collected in; one worker gets the whole module"""
+    slots = [i for i, item in enumerate(items) if item.get_closest_marker("prefix_step")]
+    first_use = {}
+    for i in slots:
+        marker = items[i].get_closest_marker("prefix_step")
+        first_use.setdefault((items[i].module.__name__, marker.args[0]), len(first_use))
+        items[i].add_marker(pytest.mark.xdist_group(f"prefix:{items[i].module.__name__}"))
+
+    def key(item):
+        marker = item.get_closest_marker("prefix_step")
+        return first_use[(item.module.__name__, marker.args[0])], EFFECTS.index(marker.kwargs.get("effect", "read"))
+
+    for i, item in zip(slots, sorted((items[i] for i in slots), key=key)):
+        items[i] = item
+
+
+def pytest_report_collectionfinish(config, items):
+    lines = [f"Invalid Test Data for {tc_id} ({nodeid}): {'; '.join(errors)}"
+             for nodeid, (tc_id, errors) in config.tc_data_errors.items()]
+    lines.append(f"identity run {identities.run} (replay its ids with --identity-seed {identities.run})")
+    lines += [f"shard-{index}: {count} tests, ~{seconds:.0f}s"
+              for index, (seconds, count) in enumerate(config.shard_plan)]
+    return lines
+
+
+def pytest_runtest_logreport(report):
+    duration_history.add_report(report)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    invalid = item.config.tc_data_errors.get(item.nodeid)
+    if invalid:
+        pytest.fail(f"Invalid Test Data for {invalid[0]}: {'; '.join(invalid[1])}", pytrace=False)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    wait_telemetry.reset()
+
+
+def pytest_terminal_summary(terminalreporter):
+    _wait_summary(terminalreporter)
+    _blocked_summary(terminalreporter)
+    _prefix_summary(terminalreporter)
+
+
+def _wait_summary(terminalreporter):
+    """Seconds each test spent in BasePage waits vs. acting (collected from every worker)"""
+    rows = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            props = dict(getattr(report, "user_properties", ()))
+            if getattr(report, "when", None) == "call" and "wait_seconds" in props:
+                rows.append((report.nodeid, props["wait_seconds"], report.duration - props["wait_seconds"]))
+    if not rows:
+        return
+    terminalreporter.write_sep("-", "wait telemetry (seconds)")
+    for nodeid, waited, acted in sorted(rows, key=lambda r: r[1], reverse=True):
+        terminalreporter.write_line(f"{waited:8.2f} waiting {acted:8.2f} acting  {nodeid}")
+    terminalreporter.write_line(f"{sum(r[1] for r in rows):8.2f} waiting {sum(r[2] for r in rows):8.2f} acting  total")
+
+
+def _blocked_summary(terminalreporter):
+    """Requests and (learned) bytes @pytest.mark.block_resources saved per test"""
+    rows = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            props = dict(getattr(report, "user_properties", ()))
+            if getattr(report, "when", None) == "teardown" and props.get("blocked_requests"):
+                rows.append((report.nodeid, props["blocked_requests"], props["blocked_bytes"]))
+    if not rows:
+        return
+    terminalreporter.write_sep("-", "blocked resources")
+    for nodeid, requests, size in sorted(rows, key=lambda r: r[2], reverse=True):
+        terminalreporter.write_line(f"{requests:6d} requests {size / 1024:10.1f} KiB  {nodeid}")
+    terminalreporter.write_line(f"{sum(r[1] for r in rows):6d} requests {sum(r[2] for r in rows) / 1024:10.1f} KiB  total")
+
+
+def _prefix_summary(terminalreporter):
+    """How @pytest.mark.prefix_step tests got to their step: shared, reopened, extended or built"""
+    counts = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            how = dict(getattr(report, "user_properties", ())).get("prefix")
+            if getattr(report, "when", None) == "teardown" and how:
+                counts[how] = counts.get(how, 0) + 1
+    if counts:
+        terminalreporter.write_sep("-", "prefix sharing")
+        terminalreporter.write_line(", ".join(f"{n} {how}" for how, n in sorted(counts.items())))
+
+
+@pytest.fixture(scope="session")
+def stub_backend():
+    """Shared in-memory backend for PB_BACKEND=stub|route runs"""
+    backend = StubBackend()
+    if BACKEND_MODE != "stub":
+        yield backend
+        return
+    server = StubServer(backend, STUB_HOST, STUB_PORT).start()
+    yield backend
+    server.stop()
+
+
+@pytest.fixture
+def flow_routes(stub_backend):
+    """routes= for utils.async_runner.run_flows: the stand-in backend's routes in route mode, else
+    None (requesting stub_backend has already started the stub server in stub mode)"""
+    if BACKEND_MODE != "route":
+        return None
+
+    async def routes(context):
+        await install_routes_async(context, stub_backend, BASE_URL)
+    return routes
+
+
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig, browser, browser_context_args, stub_backend):
+    """Per-worker ring of warm contexts (--context-pool); empty when the pool is off. Depends on
+    stub_backend so the stub server is up before contexts warm; route mode routes every context."""
+    size = 0 if pytestconfig.har_store.enabled else pytestconfig.getoption("--context-pool")
+    routes = None
+    if BACKEND_MODE == "route":
+        def routes(context):
+            install_routes(context, stub_backend, BASE_URL)
+    pool = ContextPool(browser, size, browser_context_args, routes=routes)
+    pool.fill()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="module")
+def prefix_scheduler(browser, browser_context_args):
+    """The module's shared page for @pytest.mark.prefix_step tests, opened on first use"""
+    scheduler = PrefixScheduler(browser, browser_context_args)
+    yield scheduler
+    scheduler.close()
+
+
+def _shares_prefix(request) -> bool:
+    return (request.node.get_closest_marker("prefix_step") is not None
+            and not request.config.har_store.enabled
+            and not request.config.getoption("--no-prefix-sharing"))
+
+
+@pytest.fixture
+def shared_prefix(request, page):
+    """shared_prefix(page_obj, **params) brings page_obj to the test's prefix_step step, replaying as
+    little as the module's earlier tests allow"""
+    step = request.node.get_closest_marker("prefix_step")
+    effect = step.kwargs.get("effect", "read")
+    scheduler = request.getfixturevalue("prefix_scheduler") if _shares_prefix(request) else PrefixScheduler()
+    reached = []
+
+    def reach(page_obj, **params):
+        reached.append(scheduler.reach(page_obj, step.args[0], **params))
+        return page_obj
+
+    yield reach
+    rep_call = getattr(request.node, "rep_call", None)
+    scheduler.finish(effect, failed=rep_call is None or rep_call.failed)
+    if reached:
+        request.node.user_properties.append(("prefix", reached[0]))
+
+
+@pytest.fixture
+def context(request, context_pool):
+    """The shared prefix context, a pooled context when the pool is on, otherwise pytest-playwright's fresh one"""
+    if _shares_prefix(request):
+        scheduler = request.getfixturevalue("prefix_scheduler")
+        scheduler.open()
+        yield scheduler.context
+        return
+    if not context_pool.size:
+        yield request.getfixturevalue("new_context")()
+        return
+    lease = context_pool.checkout()
+    yield lease.context
+    rep_call = getattr(request.node, "rep_call", None)
+    context_pool.checkin(lease, discard=rep_call is None or rep_call.failed)
+
+
+@pytest.fixture
+def page(request, context, context_pool):
+    if _shares_prefix(request):
+        return request.getfixturevalue("prefix_scheduler").page
+    return context_pool.page_for(context) or context.new_page()
+
+
+@pytest.fixture(autouse=True)
+def _stand_in_backend(request):
+    """Point the page at the stand-in backend unless running against the real one"""
+    if BACKEND_MODE == "real" or "page" not in request.fixturenames:
+        yield
+        return
+    backend = request.getfixturevalue("stub_backend")
+    if BACKEND_MODE == "route":
+        context = request.getfixturevalue("context")
+        if request.getfixturevalue("context_pool").page_for(context) is not None:
+            yield   # pooled contexts keep the pool's routes through resets
+            return
+        handler = install_routes(context, backend, BASE_URL)
+        yield
+        # shared prefix contexts outlive the test; don't stack a route per test on them
+        context.unroute(BASE_URL.rstrip("/") + "/**", handler)
+        return
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _har(request):
+    """Record or replay this test's traffic when --har is set"""
+    store = request.config.har_store
+    if not store.enabled or "page" not in request.fixturenames:
+        yield
+        return
+    tc_id = store.tc_id(request.node)
+    action = store.action(tc_id)
+    store.attach(request.getfixturevalue("context"), tc_id, action)
+    yield
+    rep_call = getattr(request.node, "rep_call", None)
+    failed = rep_call is None or rep_call.failed
+    if action == "record" and not failed:
+        store.mark_recorded(tc_id, request.node.nodeid)
+    elif action == "replay" and failed:
+        store.mark_stale(tc_id)
+
+
+@pytest.fixture(autouse=True)
+def _resource_blocking(request):
+    """Block what @pytest.mark.block_resources names; other tests only teach resource sizes.
+    Defined after the backend and HAR fixtures so its route is consulted first."""
+    if "page" not in request.fixturenames:
+        yield
+        return
+    context = request.getfixturevalue("context")
+    marker = request.node.get_closest_marker("block_resources")
+    if marker is None or request.config.getoption("--no-resource-blocking"):
+        stop = learn_sizes(context)
+        yield
+        stop()
+        return
+    blocker = ResourceBlocker(*marker.args, **marker.kwargs)
+    blocker.attach(context)
+    yield
+    blocker.detach()
+    request.node.user_properties.append(("blocked_requests", blocker.blocked))
+    request.node.user_properties.append(("blocked_bytes", blocker.blocked_bytes))
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Take screenshot on test failure"""
     outcome = yield
     report = outcome.get_result()
+    setattr(item, "rep_" + report.when, report)
+    if report.when == "call" and wait_telemetry.calls:
+        report.user_properties.append(("wait_seconds", round(wait_telemetry.waited, 3)))
+        report.user_properties.append(("waits", dict(wait_telemetry.seconds)))
     if report.when == "call" and report.failed:
         page = item.funcargs.get("page")
         if page:
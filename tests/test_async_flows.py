@@ -0,0 +1,57 @@
+from pages.async_pages import AsyncForgotPasswordPage, AsyncLoginPage, AsyncPartyPage
+from utils.async_runner import run_flows
+from utils.random_utils import identities
+from utils.tc_data import load_tc_data
+
+tc_data = load_tc_data()
+
+
+def _report(request, name, results):
+    failed = [r for r in results if not r.passed]
+    seconds = sorted(r.seconds for r in results)
+    request.node.user_properties.append((f"{name}_flows", len(results)))
+    request.node.user_properties.append((f"{name}_failed", len(failed)))
+    request.node.user_properties.append((f"{name}_p50_s", seconds[len(seconds) // 2]))
+    request.node.user_properties.append((f"{name}_max_s", seconds[-1]))
+    # waits of concurrent flows overlap, so they are kept out of the test's own wait_seconds
+    request.node.user_properties.append((f"{name}_flow_wait_s", round(sum(r.waited for r in results), 3)))
+    print(f"{name}: {len(results)} flows, {len(failed)} failed, p50 {seconds[len(seconds) // 2]:.2f}s "
+          f"max {seconds[-1]:.2f}s")
+    assert not failed, "; ".join(f"#{r.index}: {r.error}" for r in failed[:5])
+
+
+def test_fpass01_concurrent_modal_checks(async_flows, flow_routes, request):
+    """FPASS01 (open the Forgot Password modal) async_flows times at once on one event loop"""
+
+    async def flow(page, index):
+        fp_page = AsyncForgotPasswordPage(page)
+        await fp_page.navigate()
+        await fp_page.click_login_tab()
+        await fp_page.click_forgot_password_button()
+        return await fp_page.is_heading_visible()
+
+    _report(request, "fpass01", run_flows(flow, async_flows, routes=flow_routes))
+
+
+def test_party01_concurrent_add_party(async_flows, flow_routes, request):
+    """PARTY01 (log in and add a party) async_flows times at once on one event loop"""
+    params = tc_data['PARTY01'].params
+    codes = [identities.code() for _ in range(async_flows)]
+
+    async def flow(page, index):
+        login_page = AsyncLoginPage(page)
+        party_page = AsyncPartyPage(page)
+        await login_page.navigate()
+        await login_page.login(params.email, params.password)
+        await party_page.navigate_party_section()
+        await party_page.add_party(
+            logo_file=params.get("partylogo", "uploads/partylogos/tdp.jpg"),
+            party_name=f"{params.get('party_name')} {codes[index]}",
+            party_code=codes[index],
+            country=params.get("country"),
+            state=params.get("state"),
+            district=params.get("district"),
+        )
+        return codes[index]
+
+    _report(request, "party01", run_flows(flow, async_flows, routes=flow_routes))
@@ -118,37 +118,16 @@
 
 
 import pytest
-import pandas as pd
 import os
 from pages.login_page import LoginPage
 from pages.country_page import CountryPage
 from pytest_html import extras
+from config import EXCEL_FILE
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 
-EXCEL_FILE = "data/testdata.xlsx"
-TEMP_XLSX = "data/tempdata_temp.xlsx"
-
-# Read Excel once (country sheet)
-try:
-    test_data_df = pd.read_excel(EXCEL_FILE, sheet_name="country", engine="openpyxl")
-except Exception:
-    # Fallback without specifying engine (in case of environment differences)
-    test_data_df = pd.read_excel(EXCEL_FILE, sheet_name="country")
-
-# Ensure Status/Remarks are strings to avoid dtype warnings
-for col in ["Status", "Remarks"]:
-    if col in test_data_df.columns:
-        test_data_df[col] = test_data_df[col].astype(str)
-
-# -----------------------------
-# Drive tests purely by TC ID, in sheet order. Skip rows without TC ID.
-if "TC ID" in test_data_df.columns:
-    country_data_df = test_data_df[test_data_df["TC ID"].astype(str).str.strip() != ""]
-else:
-    country_data_df = test_data_df
-# -----------------------------
-
-# Convert filtered data to dict for parametrization
-test_data = country_data_df.to_dict(orient="records")
+# Country sheet rows with a TC ID, in sheet order (parsed once per session)
+test_data = load_tc_data().sheet("country")
 
 
 @pytest.mark.parametrize("tc_index,tc", [(i, row) for i, row in enumerate(test_data)])
@@ -189,11 +168,11 @@ def test_country_filters(page, tc_index, tc, request):
         elif tc_id == "COUNTRY10":
             country_page.jurisdiction_and_fill_form("ProblemBolo_jurisdiction.csv")
         elif tc_id == "COUNTRY11": 
-            country_page.Geofence_and_fill_form()
+            country_page.Geofence_and_fill_form(checkpoint=True)
         elif tc_id == "COUNTRY12":
-            country_page.media_and_fill_form()
+            country_page.media_and_fill_form(checkpoint=True)
         elif tc_id == "COUNTRY13":
-            country_page.summary_data()
+            country_page.summary_data(checkpoint=True)
         elif tc_id in ["COUNTRY15", "COUNTRY16"]:
             country_page.click_edit_modify_data(tc_id)
         elif tc_id == "COUNTRY17":
@@ -217,19 +196,14 @@ def test_country_filters(page, tc_index, tc, request):
             request.config._html.extra.append(extras.text(error_msg))
 
     finally:
-        # Update results in the in-memory DataFrame
-        last_index = country_data_df.index[tc_index]  # map to original dataframe index
+        # Journal the result; merged into the country sheet once at session end
         if test_passed:
-            test_data_df.at[last_index, "Status"] = str("Passed")
-            test_data_df.at[last_index, "Remarks"] = str(expected_result)
+            result_journal.record(tc_id, "Passed", expected_result, source=EXCEL_FILE, sheet="country")
             if hasattr(request.config, "_html"):
                 request.config._html.extra.append(extras.text(f"{tc_id} Passed"))
         else:
-            test_data_df.at[last_index, "Status"] = str("Failed")
-            test_data_df.at[last_index, "Remarks"] = str(f"{expected_result} | Actual: {error_msg}")
-
-        # Always save to Excel output file as requested
-        test_data_df.to_excel(TEMP_XLSX, index=False)
+            result_journal.record(tc_id, "Failed", f"{expected_result} | Actual: {error_msg}",
+                                  source=EXCEL_FILE, sheet="country")
 
     # Fail the test if needed
     if not test_passed:
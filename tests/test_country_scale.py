@@ -0,0 +1,73 @@
+from pages.login_page import LoginPage
+from pages.country_page import CountryPage
+from pages.country_page import geofence_plan
+from utils.geometry import complexity_ladder, format_variant
+from utils.hierarchy_check import check_hierarchy
+from utils.hierarchy_generator import HierarchyGenerator
+
+
+def test_country_onboarding_scale(page, scale_rows, request):
+    """COUNTRY10 wizard fed with a generated hierarchy of about scale_rows rows (pytest --scale-rows)"""
+    generator = HierarchyGenerator.for_rows(scale_rows, seed=7)
+    files = generator.write()
+    report = check_hierarchy(files)
+    assert report.ok, "; ".join(report.errors())
+
+    login_page = LoginPage(page)
+    country_page = CountryPage(page)
+    login_page.navigate("login")
+    login_page.login("admin@email.com", "password")
+    country_page.open_country_page()
+
+    timings = country_page.jurisdiction_and_fill_form("generated", hierarchy=files)
+
+    request.node.user_properties.append(("hierarchy_rows", generator.total_rows))
+    for timing in timings:
+        rows = generator.counts.get(timing["step"], 3)
+        request.node.user_properties.append((f"{timing['step']}_rows", rows))
+        request.node.user_properties.append((f"{timing['step']}_upload_s", timing["upload_s"]))
+        request.node.user_properties.append((f"{timing['step']}_preview_s", timing["preview_s"]))
+        print(f"{timing['step']:>9}: {rows:>8} rows  upload {timing['upload_s']:.2f}s  preview {timing['preview_s']:.2f}s")
+
+
+def test_country_geofence_scale(page, geofence_tolerance, request):
+    """COUNTRY11's geofence_plan() files simplified to geofence_tolerance degrees (pytest --geofence-tolerances)"""
+    variants = {}
+    for kind, name in geofence_plan().items():
+        (_, path, stats), = complexity_ladder(name, [geofence_tolerance])
+        variants[kind] = path
+        request.node.user_properties.append((f"{kind}_vertices", stats["vertices"]))
+
+    login_page = LoginPage(page)
+    country_page = CountryPage(page)
+    login_page.navigate("login")
+    login_page.login("admin@email.com", "password")
+    country_page.open_country_page()
+
+    timings = country_page.Geofence_and_fill_form(geofences=variants)
+
+    for timing in timings:
+        request.node.user_properties.append((f"{timing['kind']}_upload_s", timing["upload_s"]))
+        request.node.user_properties.append((f"{timing['kind']}_render_s", timing["render_s"]))
+        print(f"{timing['kind']:>8}: tolerance {geofence_tolerance:g}  upload {timing['upload_s']:.2f}s  "
+              f"render {timing['render_s']:.2f}s")
+
+
+def test_country_geofence_formats(page, geofence_format, request):
+    """COUNTRY11 with every geofence_plan() file converted to geofence_format (pytest --geofence-formats)"""
+    variants = {kind: format_variant(name, geofence_format) for kind, name in geofence_plan().items()}
+
+    login_page = LoginPage(page)
+    country_page = CountryPage(page)
+    login_page.navigate("login")
+    login_page.login("admin@email.com", "password")
+    country_page.open_country_page()
+
+    timings = country_page.Geofence_and_fill_form(geofences=variants)
+
+    for timing in timings:
+        request.node.user_properties.append((f"{timing['kind']}_bytes", timing["bytes"]))
+        request.node.user_properties.append((f"{timing['kind']}_upload_s", timing["upload_s"]))
+        request.node.user_properties.append((f"{timing['kind']}_render_s", timing["render_s"]))
+        print(f"{timing['kind']:>8}: {geofence_format:>7} {timing['bytes']:>9} bytes  upload {timing['upload_s']:.2f}s  "
+              f"render {timing['render_s']:.2f}s")
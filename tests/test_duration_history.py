@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from utils.duration_history import DurationHistory, lpt_shards
+
+
+def _report(nodeid, when, outcome, duration, tc_id="FPASS01"):
+    return SimpleNamespace(nodeid=nodeid, when=when, outcome=outcome, duration=duration,
+                           failed=outcome == "failed", user_properties=[("tc_id", tc_id)])
+
+
+def test_lpt_shards_balances_longest_first():
+    plan = lpt_shards([(7, "a"), (5, "b"), (4, "c"), (3, "d"), (1, "e")], 2)
+    assert [load for load, _ in plan] == [10, 10]
+    assert sorted(unit for _, members in plan for unit in members) == ["a", "b", "c", "d", "e"]
+
+
+def test_lpt_shards_more_shards_than_units():
+    plan = lpt_shards([(2, "a")], 3)
+    assert [members for _, members in plan] == [["a"], [], []]
+
+
+def test_estimates_fall_back_from_test_to_family_to_overall(tmp_path):
+    history = DurationHistory(str(tmp_path / "d.sqlite"), window=2, default=9.0, backend="stub")
+    assert history.estimates([("FPASS01", "t.py::a")]) == {("FPASS01", "t.py::a"): 9.0}
+
+    history.recording = True
+    for run, seconds in enumerate((10.0, 2.0, 4.0)):
+        history.run = run
+        history.add_report(_report("t.py::a", "setup", "passed", 0.0))
+        history.add_report(_report("t.py::a", "call", "passed", seconds))
+        history.add_report(_report("t.py::b@shard-0", "call", "passed", 20.0, tc_id="AUTH01"))
+        history.save()
+
+    estimates = history.estimates([("FPASS01", "t.py::a"), ("FPASS02", "t.py::c"),
+                                   ("COUNTRY01", "t.py::d"), ("AUTH01", "t.py::b")])
+    assert estimates[("FPASS01", "t.py::a")] == 3.0       # median of the latest 2 runs
+    assert estimates[("FPASS02", "t.py::c")] == 3.0       # FPASS family
+    assert estimates[("COUNTRY01", "t.py::d")] == 11.5    # every known test
+    assert estimates[("AUTH01", "t.py::b")] == 20.0
+
+
+def test_add_report_keeps_worst_outcome_and_counts_reruns(tmp_path):
+    history = DurationHistory(str(tmp_path / "d.sqlite"))
+    history.recording = True
+    history.add_report(_report("t.py::a", "call", "rerun", 1.0))
+    history.add_report(_report("t.py::a", "call", "passed", 1.0))
+    history.add_report(_report("t.py::a", "teardown", "failed", 0.5))
+    row = history._pending["t.py::a"]
+    assert (row["outcome"], row["retries"], row["duration"]) == ("error", 1, 2.5)
@@ -1,29 +1,28 @@
 import time
 import pytest
-import pandas as pd
-import re
 import os
 from pages.password_toggle_page import PasswordTogglePage
 from pages.login_page import LoginPage
 from pytest_html import extras
-from config import CSV_FILE
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from playwright.sync_api import Page, expect
 from pages.forgot_password_page import ForgotPasswordPage
 
 
 # ------------------ LOAD CSV ------------------
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
+
+# form-only checks: images, fonts and media are never looked at
+pytestmark = pytest.mark.block_resources("fast")
 
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
         # Screenshot for failed step
         if not os.path.exists("reports"):
@@ -35,28 +34,19 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 
-def test_fpass01_click_forgot_password(page, request):
+@pytest.mark.prefix_step("modal", effect="read")
+def test_fpass01_click_forgot_password(page, request, shared_prefix):
     # Get test data for FPASS01 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS01'].to_dict(orient="records")[0]
+    row = tc_data['FPASS01']
     expected = row.get("Expected Result", "N/A")
 
     # Create page object
     fp_page = ForgotPasswordPage(page)
 
     try:
-        # Navigate and click login tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-
-        # Click Forgot Password button
-        fp_page.click_forgot_password_button()
+        # Open the Forgot Password modal
+        shared_prefix(fp_page)
 
         # If successful, update CSV as Passed
         update_csv_and_report(fp_page, request, "FPASS01", expected, True)
@@ -66,9 +56,10 @@ def test_fpass01_click_forgot_password(page, request):
         update_csv_and_report(fp_page, request, "FPASS01", expected, False, str(e))
         pytest.fail("FPASS01 failed")
 
-def test_fpass02_check_forgot_password_title(page, request):
+@pytest.mark.prefix_step("modal", effect="read")
+def test_fpass02_check_forgot_password_title(page, request, shared_prefix):
     # Get test data for FPASS02 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS02'].to_dict(orient="records")[0]
+    row = tc_data['FPASS02']
     expected = row.get("Expected Result", "N/A")
     test_data_str = str(row.get("Test Data", ""))
 
@@ -77,9 +68,7 @@ def test_fpass02_check_forgot_password_title(page, request):
 
     try:
         # Fresh start: navigate and open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Directly locate the modal title and assert visibility
         title_locator = page.get_by_text("Forgot Password", exact=True)
@@ -93,9 +82,10 @@ def test_fpass02_check_forgot_password_title(page, request):
         update_csv_and_report(fp_page, request, "FPASS02", expected, False, str(e))
         pytest.fail("FPASS02 failed")
 
-def test_fpass03_verify_forgot_password_details(page, request):
+@pytest.mark.prefix_step("modal", effect="read")
+def test_fpass03_verify_forgot_password_details(page, request, shared_prefix):
     # 🔄 Get test data for FPASS03 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS03'].to_dict(orient="records")[0]
+    row = tc_data['FPASS03']
     expected = row.get("Expected Result", "N/A")
     test_data_str = str(row.get("Test Data", ""))
 
@@ -106,9 +96,7 @@ def test_fpass03_verify_forgot_password_details(page, request):
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Verify form elements
         assert fp_page.is_mobile_input_visible(), "Mobile input not visible"
@@ -125,24 +113,21 @@ def test_fpass03_verify_forgot_password_details(page, request):
         update_csv_and_report(fp_page, request, "FPASS03", expected, False, str(e))
         pytest.fail("FPASS03 failed")
 
-def test_fpass04_enter_mobile_and_click_next(page, request):
+@pytest.mark.prefix_step("modal", effect="leave")
+def test_fpass04_enter_mobile_and_click_next(page, request, shared_prefix):
     # Get test data for FPASS04 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS04'].to_dict(orient="records")[0]
+    row = tc_data['FPASS04']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract mobile number from Test Data column (mobile:6476437332)
-    mobile_number = ""
-    if "mobile:" in test_data_str:
-        mobile_number = test_data_str.split("mobile:")[1].strip()
+    params = row.params
+    mobile_number = params.mobile
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Enter mobile number and click Next
         fp_page.enter_mobile_number(mobile_number)
@@ -155,24 +140,21 @@ def test_fpass04_enter_mobile_and_click_next(page, request):
         update_csv_and_report(fp_page, request, "FPASS04", expected, False, str(e))
         pytest.fail("FPASS04 failed")
 
-def test_fpass05_enter_email_and_click_next(page, request):
+@pytest.mark.prefix_step("modal", effect="leave")
+def test_fpass05_enter_email_and_click_next(page, request, shared_prefix):
     # Get test data for FPASS05 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS05'].to_dict(orient="records")[0]
+    row = tc_data['FPASS05']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email from Test Data column
-    email_address = ""
-    if "Email:" in test_data_str:
-        email_address = test_data_str.split("Email:")[1].strip()
+    params = row.params
+    email_address = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Enter email address
         fp_page.enter_email(email_address)
@@ -186,28 +168,22 @@ def test_fpass05_enter_email_and_click_next(page, request):
         update_csv_and_report(fp_page, request, "FPASS05", expected, False, str(e))
         pytest.fail("FPASS05 failed")
 
-def test_fpass06_enter_both_inputs(page, request):
+@pytest.mark.prefix_step("modal", effect="leave")
+def test_fpass06_enter_both_inputs(page, request, shared_prefix):
     # Get test data for FPASS06 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS06'].to_dict(orient="records")[0]
+    row = tc_data['FPASS06']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract mobile and email from Test Data
-    mobile_number = ""
-    email_address = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("mobile:"):
-            mobile_number = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("email:"):
-            email_address = line.split(":", 1)[1].strip()
+    params = row.params
+    mobile_number = params.mobile
+    email_address = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Enter both inputs
         if mobile_number:
@@ -229,31 +205,22 @@ def test_fpass06_enter_both_inputs(page, request):
         update_csv_and_report(fp_page, request, "FPASS06", expected, False, str(e))
         pytest.fail("FPASS06 failed")
 
-def test_fpass07_next_button_disabled_without_input(page, request):
+@pytest.mark.prefix_step("modal", effect="write")
+def test_fpass07_next_button_disabled_without_input(page, request, shared_prefix):
     # Get test data for FPASS07 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS07'].to_dict(orient="records")[0]
+    row = tc_data['FPASS07']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
-    # Extract mobile and email from CSV
-    mobile_number = ""
-    email_address = ""
-    parts = test_data_str.split(";")
-    for part in parts:
-        if "mobile=" in part:
-            val = part.split("mobile=")[1].strip().strip("'\"")
-            mobile_number = "" if val in ["", "''"] else val
-        elif "email=" in part:
-            val = part.split("email=")[1].strip().strip("'\"")
-            email_address = "" if val in ["", "''"] else val
+    # Extract mobile and email from CSV ("mobile='';email=''")
+    params = row.params
+    mobile_number = params.mobile
+    email_address = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Enter values (both empty in this test case)
         fp_page.enter_mobile_number(mobile_number)
@@ -269,28 +236,22 @@ def test_fpass07_next_button_disabled_without_input(page, request):
         update_csv_and_report(fp_page, request, "FPASS07", expected, False, str(e))
         pytest.fail("FPASS07 failed")
 
-def test_fpass08_otp_tab_navigation(page, request):
+@pytest.mark.prefix_step("modal", effect="leave")
+def test_fpass08_otp_tab_navigation(page, request, shared_prefix):
     # Get test data for FPASS08 from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'FPASS08'].to_dict(orient="records")[0]       
+    row = tc_data['FPASS08']       
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))  # multi-line input from CSV
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Extract mobile and email from CSV
-        mobile_number = ""
-        email_address = ""
-        for line in test_data_str.splitlines():
-            if line.strip().lower().startswith("mobile:"):
-                mobile_number = line.split(":", 1)[1].strip()
-            elif line.strip().lower().startswith("email:"):
-                email_address = line.split(":", 1)[1].strip()
+        params = row.params
+        mobile_number = params.mobile
+        email_address = params.email
 
         # Enter mobile/email if available
         if mobile_number:
@@ -317,34 +278,24 @@ def test_fpass08_otp_tab_navigation(page, request):
         update_csv_and_report(fp_page, request, "FPASS08", expected, False, str(e))
         pytest.fail("FPASS08 failed")
 # ------------------ FPASS09 ------------------
-def test_fpass09_otp_email_display(page, request):
+@pytest.mark.prefix_step("otp", effect="read")
+def test_fpass09_otp_email_display(page, request, shared_prefix):
     # Get test data for FPASS09
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS09'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS09')
+    if row is None:
         pytest.skip("FPASS09 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract real and masked email from CSV
-    real_email = ""
-    masked_email = ""
-    for line in test_data_str.splitlines():
-        line_lower = line.strip().lower()
-        if line_lower.startswith("email:"):
-            real_email = line.split(":", 1)[1].strip()
-        elif line_lower.startswith("masked_email:"):
-            masked_email = line.split(":", 1)[1].strip()
+    params = row.params
+    real_email = params.email
+    masked_email = params.masked_email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Open Forgot Password modal and enter the real email
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(real_email)
-        fp_page.click_next_button()  # Navigate to OTP tab
+        shared_prefix(fp_page, email=real_email)
 
         # Verify OTP message with masked email is visible
         otp_message = f"Enter OTP sent to {masked_email}"
@@ -358,34 +309,24 @@ def test_fpass09_otp_email_display(page, request):
         update_csv_and_report(fp_page, request, "FPASS09", expected, False, str(e))
         pytest.fail("FPASS09 failed")
 
-def test_fpass10_otp_input_validation(page, request):
+@pytest.mark.prefix_step("otp", effect="write")
+def test_fpass10_otp_input_validation(page, request, shared_prefix):
     # Get test data for FPASS10
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS10'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS10')
+    if row is None:
         pytest.skip("FPASS10 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and OTP from CSV
-    real_email = ""
-    otp_value = ""
-    for line in test_data_str.splitlines():
-        line_lower = line.strip().lower()
-        if line_lower.startswith("email:"):
-            real_email = line.split(":", 1)[1].strip()
-        elif line_lower.startswith("otp:"):
-            otp_value = line.split(":", 1)[1].strip()
+    params = row.params
+    real_email = params.email
+    otp_value = params.otp
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # -------------------- Step 1: Enter Email --------------------
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(real_email)
-        fp_page.click_next_button()  # Navigate to OTP tab
+        shared_prefix(fp_page, email=real_email)
 
         # -------------------- Step 2: Wait for OTP inputs --------------------
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
@@ -416,34 +357,24 @@ def test_fpass10_otp_input_validation(page, request):
         update_csv_and_report(fp_page, request, "FPASS10", expected, False, str(e))
         pytest.fail("FPASS10 failed")
 
-def test_fpass11_otp_autofocus(page, request):
+@pytest.mark.prefix_step("otp", effect="write")
+def test_fpass11_otp_autofocus(page, request, shared_prefix):
     # Get test data for FPASS11
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS11'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS11')
+    if row is None:
         pytest.skip("FPASS11 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and OTP from CSV
-    email = ""
-    otp_value = ""
-    for line in test_data_str.splitlines():
-        line_lower = line.strip().lower()
-        if line_lower.startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line_lower.startswith("otp:"):
-            otp_value = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    otp_value = params.otp
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # -------------------- Step 1: Enter Email --------------------
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # Navigate to OTP tab
+        shared_prefix(fp_page, email=email)
 
         # -------------------- Step 2: Wait for OTP inputs --------------------
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
@@ -486,33 +417,24 @@ def test_fpass11_otp_autofocus(page, request):
         update_csv_and_report(fp_page, request, "FPASS11", expected, False, str(e))
         pytest.fail("FPASS11 failed due to exception")
 
-def test_fpass12_otp_backspace_navigation(page, request):
+@pytest.mark.prefix_step("otp", effect="write")
+def test_fpass12_otp_backspace_navigation(page, request, shared_prefix):
     # Get test data for FPASS12
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS12'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS12')
+    if row is None:
         pytest.skip("FPASS12 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and OTP from CSV
-    email = ""
-    otp_value = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("otp:"):
-            otp_value = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    otp_value = params.otp
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Enter Email
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # Navigate to OTP tab
+        shared_prefix(fp_page, email=email)
 
         # Step 2: Wait for OTP inputs
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
@@ -555,34 +477,24 @@ def test_fpass12_otp_backspace_navigation(page, request):
         pytest.fail("FPASS12 failed")
 
 
-def test_fpass13_next_button_state(page, request):
+@pytest.mark.prefix_step("otp", effect="write")
+def test_fpass13_next_button_state(page, request, shared_prefix):
     # Get test data for FPASS13
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS13'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS13')
+    if row is None:
         pytest.skip("FPASS13 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and OTP from CSV
-    real_email = ""
-    otp_value = ""
-    for line in test_data_str.splitlines():
-        line_lower = line.strip().lower()
-        if line_lower.startswith("email:"):
-            real_email = line.split(":", 1)[1].strip()
-        elif line_lower.startswith("otp:"):
-            otp_value = line.split(":", 1)[1].strip()
+    params = row.params
+    real_email = params.email
+    otp_value = params.otp
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # -------------------- Step 1: Enter Email --------------------
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(real_email)
-        fp_page.click_next_button()  # Navigate to OTP tab
+        shared_prefix(fp_page, email=real_email)
 
         # -------------------- Step 2: Wait for OTP inputs --------------------
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
@@ -614,51 +526,49 @@ def test_fpass13_next_button_state(page, request):
 
 def test_fpass14_otp_countdown_timer(page, request):
     # Get test data for FPASS14
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS14'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS14')
+    if row is None:
         pytest.skip("FPASS14 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email from CSV
-    email = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
-        # Step 1: Navigate to Forgot Password
+        # Step 1: Navigate to Forgot Password (fake clock, so the countdown runs on virtual time)
+        fp_page.install_clock()
         fp_page.navigate()
         fp_page.click_login_tab()
         fp_page.click_forgot_password_button()
         fp_page.enter_email(email)
+        fp_page.pause_clock()
         fp_page.click_next_button()  # Navigate to OTP tab
 
         # Step 2: Wait for OTP tab to load
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
         expect(otp_inputs).to_have_count(4, timeout=5000)
 
-        # Step 3: Check that Resend button stays disabled for 20 seconds
-        import time
-        test_passed = True
-        for second in range(20):
-            is_disabled = fp_page.page.locator(fp_page.RESEND_BUTTON).get_attribute("disabled") is not None
-            print(f"Second {second+1}: Resend button disabled = {is_disabled}")
-            if not is_disabled:
-                test_passed = False
-                print("❌ Resend button enabled before 20 seconds → Test Failed")
-                break
-            time.sleep(1)
+        # Step 3: Check that Resend button is disabled for 20 virtual seconds, then turns enabled
+        enabled_at = fp_page.seconds_until_enabled(fp_page.page.locator(fp_page.RESEND_BUTTON), 22)
+        print(f"Resend button enabled at virtual second: {enabled_at}")
+        # one second of slack for the tick that lands the countdown's last render
+        test_passed = enabled_at in (20, 21)
+        if enabled_at is None:
+            print("❌ Resend button never enabled → Test Failed")
+        elif not test_passed:
+            print(f"❌ Resend button enabled at {enabled_at} seconds instead of 20 → Test Failed")
 
         # Step 4: Update CSV/report
         if test_passed:
-            print("✅ Resend button stayed disabled for 20 seconds → Test Passed")
+            print("✅ Resend button stayed disabled for 20 seconds, then enabled → Test Passed")
             update_csv_and_report(fp_page, request, "FPASS14", expected, True)
         else:
-            update_csv_and_report(fp_page, request, "FPASS14", expected, False, "Resend enabled too early")
+            update_csv_and_report(fp_page, request, "FPASS14", expected, False,
+                                  f"Resend enabled at virtual second {enabled_at}, expected 20")
+            pytest.fail(f"FPASS14 failed: Resend enabled at virtual second {enabled_at}, expected 20")
 
     except Exception as e:
         update_csv_and_report(fp_page, request, "FPASS14", expected, False, str(e))
@@ -666,36 +576,33 @@ def test_fpass14_otp_countdown_timer(page, request):
 
 def test_fpass15_resend_otp_enabled_after_countdown(page, request):
     # Get test data for FPASS15
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS15'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS15')
+    if row is None:
         pytest.skip("FPASS15 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email from CSV
-    email = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
-        # Step 1: Navigate to Forgot Password
+        # Step 1: Navigate to Forgot Password (fake clock, so the countdown runs on virtual time)
+        fp_page.install_clock()
         fp_page.navigate()
         fp_page.click_login_tab()
         fp_page.click_forgot_password_button()
         fp_page.enter_email(email)
+        fp_page.pause_clock()
         fp_page.click_next_button()  # Navigate to OTP tab
 
         # Step 2: Wait for OTP tab to load
         otp_inputs = page.locator("input[type='text'][maxlength='1']")
         expect(otp_inputs).to_have_count(4, timeout=5000)
 
-        # Step 3: Wait for countdown to complete (20 sec)
-        import time
-        time.sleep(20)  # Wait for timer to reach 0
+        # Step 3: Fast-forward through the countdown (20 virtual sec)
+        fp_page.advance_clock(20)
 
         # Step 4: Check if Resend OTP button is enabled
         if fp_page.is_resend_enabled():
@@ -709,31 +616,23 @@ def test_fpass15_resend_otp_enabled_after_countdown(page, request):
         update_csv_and_report(fp_page, request, "FPASS15", expected, False, str(e))
         pytest.fail("FPASS15 failed")
 
-def test_fpass16_back_button(page, request):
+@pytest.mark.prefix_step("new_password", effect="leave")
+def test_fpass16_back_button(page, request, shared_prefix):
     # Get test data for FPASS16
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS16'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS16')
+    if row is None:
         pytest.skip("FPASS16 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email from CSV
-    email = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to Forgot Password and go to OTP tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # Navigate to OTP tab
-        fp_page.click_next_button()
+        shared_prefix(fp_page, email=email)
 
         # Step 2: Click Back button from OTP tab
         fp_page.click_back_button()
@@ -751,24 +650,18 @@ def test_fpass16_back_button(page, request):
         pytest.fail("FPASS16 failed")
 
 
-def test_fpass17_set_new_password_tab(page, request):
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS17'].to_dict(orient="records")
-    if not rows:
+@pytest.mark.prefix_step("new_password", effect="read")
+def test_fpass17_set_new_password_tab(page, request, shared_prefix):
+    row = tc_data.get('FPASS17')
+    if row is None:
         pytest.skip("FPASS17 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    email = next((line.split(":", 1)[1].strip() for line in str(row.get("Test Data", "")).splitlines() if line.lower().startswith("email:")), "")
+    email = row.params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-
-        fp_page.click_next_button()  # OTP tab
-        fp_page.click_next_button()  # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Verify using locator from page class
         if page.locator(ForgotPasswordPage.NEW_PASSWORD_TAB_TEXT).is_visible():
@@ -783,34 +676,24 @@ def test_fpass17_set_new_password_tab(page, request):
         pytest.fail("FPASS17 failed")
 
 
-def test_fpass18_password_input(page, request):
+@pytest.mark.prefix_step("new_password", effect="write")
+def test_fpass18_password_input(page, request, shared_prefix):
     # Get test data for FPASS18
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS18'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS18')
+    if row is None:
         pytest.skip("FPASS18 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and password from CSV
-    email = ""
-    password = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Navigate to Forgot Password → OTP → Set New Password
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Enter new password
         new_password_input = page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT)
@@ -834,37 +717,25 @@ def test_fpass18_password_input(page, request):
     except Exception as e:
         update_csv_and_report(fp_page, request, "FPASS18", expected, False, str(e))
         pytest.fail("FPASS18 failed")
-def test_fpass19_confirm_password_input(page, request):
+@pytest.mark.prefix_step("new_password", effect="write")
+def test_fpass19_confirm_password_input(page, request, shared_prefix):
     # Get test data for FPASS19
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS19'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS19')
+    if row is None:
         pytest.skip("FPASS19 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email, new password, confirm password
-    email = ""
-    new_password = ""
-    confirm_password = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            new_password = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("confirmpassword:"):
-            confirm_password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    new_password = params.password
+    confirm_password = params.confirm_password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Navigate to Set New Password tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()   # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Enter new password
         page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT).fill(new_password)
@@ -886,35 +757,26 @@ def test_fpass19_confirm_password_input(page, request):
         pytest.fail("FPASS19 failed")
 
 
-def test_fpass20_password_mismatch(page, request):
+@pytest.mark.prefix_step("new_password", effect="write")
+def test_fpass20_password_mismatch(page, request, shared_prefix):
     # Get test data for FPASS20
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS20'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS20')
+    if row is None:
         pytest.skip("FPASS20 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email, password, confirm password
     email, password, confirm_password = "", "", ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("confirmpassword:"):
-            confirm_password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
+    confirm_password = params.confirm_password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Navigate to Set New Password tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()   # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Enter mismatch passwords using page class locators
         fp_page.enter_new_password(password)
@@ -934,34 +796,24 @@ def test_fpass20_password_mismatch(page, request):
         update_csv_and_report(fp_page, request, "FPASS20", expected, False, str(e))
         pytest.fail(f"FPASS20 failed due to exception: {e}")
 
-def test_fpass21_password_toggle(page, request):
+@pytest.mark.prefix_step("new_password", effect="write")
+def test_fpass21_password_toggle(page, request, shared_prefix):
     # Get test data for FPASS21
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS21'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS21')
+    if row is None:
         pytest.skip("FPASS21 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and password from CSV
-    email = ""
-    password = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to Set New Password tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()   # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Step 2: Enter new password and confirm password
         page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT).fill(password)
@@ -993,46 +845,28 @@ def test_fpass21_password_toggle(page, request):
         update_csv_and_report(fp_page, request, "FPASS21", expected, False, str(e))
         pytest.fail(f"FPASS21 failed due to exception: {e}")
 
-def test_fpass22_register_button_disabled_with_empty_passwords(page, request):
+@pytest.mark.prefix_step("new_password", effect="write")
+def test_fpass22_register_button_disabled_with_empty_passwords(page, request, shared_prefix):
     # Get test data for FPASS22 (converted from FPASS37)
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS22'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS22')
+    if row is None:
         pytest.skip("FPASS22 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # CSV like:
     # Email:admin@email.com
     # Password:""
     # confirmpassword:""
-    email = ""
-    password = ""
-    confirm_password = ""
-
-    for line in test_data_str.splitlines():
-        key, sep, value = line.partition(":")
-        if not sep:
-            continue
-        k = key.strip().lower()
-        v = value.strip().strip('"').strip("'")  # handle "" in CSV
-        if k == "email":
-            email = v
-        elif k == "password":
-            password = v
-        elif k == "confirmpassword":
-            confirm_password = v
+    params = row.params
+    email = params.email
+    password = params.password
+    confirm_password = params.confirm_password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Navigate to Set New Password tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()   # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Ensure both password fields are empty
         page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT).fill("")        # explicit clear
@@ -1060,33 +894,23 @@ def test_fpass22_register_button_disabled_with_empty_passwords(page, request):
         update_csv_and_report(fp_page, request, "FPASS22", expected, False, str(e))
         pytest.fail(f"FPASS22 failed due to exception: {e}")
 
-def test_fpass23_back_button(page, request):
+@pytest.mark.prefix_step("new_password", effect="leave")
+def test_fpass23_back_button(page, request, shared_prefix):
     # Get test data for FPASS23
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS23'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS23')
+    if row is None:
         pytest.skip("FPASS23 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email from CSV
-    email = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to Forgot Password
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-
-        # Step 2: Next → OTP tab → Next → Set New Password tab
-        fp_page.click_next_button()   # OTP tab
-        fp_page.click_next_button()   # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Step 3: Click Back button
         page.locator(ForgotPasswordPage.BACK_BUTTON).click()
@@ -1106,21 +930,19 @@ def test_fpass23_back_button(page, request):
         update_csv_and_report(fp_page, request, "FPASS23", expected, False, str(e))
         pytest.fail(f"FPASS23 failed due to exception: {e}")
 
-def test_fpass24_modal_close_button(page, request):
+@pytest.mark.prefix_step("modal", effect="write")
+def test_fpass24_modal_close_button(page, request, shared_prefix):
     # Get test data for FPASS24
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS24'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS24')
+    if row is None:
         pytest.skip("FPASS24 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Step 2: Verify X (Close) button is visible and enabled
         cross_btn = page.locator(ForgotPasswordPage.CROSS_BUTTON)
@@ -1138,33 +960,23 @@ def test_fpass24_modal_close_button(page, request):
         update_csv_and_report(fp_page, request, "FPASS24", expected, False, str(e))
         pytest.fail(f"FPASS24 failed due to exception: {e}")
 
-def test_fpass25_register_button(page, request):
+@pytest.mark.prefix_step("new_password", effect="leave")
+def test_fpass25_register_button(page, request, shared_prefix):
     # Get test data for FPASS25
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS25'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS25')
+    if row is None:
         pytest.skip("FPASS25 test data not found in CSV")
-    row = rows[0]
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and password from CSV
-    email = ""
-    password = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to Forgot Password → Set New Password
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # OTP tab
-        fp_page.click_next_button()  # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Step 2: Enter new password and confirm password
         page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT).fill(password)
@@ -1180,33 +992,23 @@ def test_fpass25_register_button(page, request):
         update_csv_and_report(fp_page, request, "FPASS25", row.get("Expected Result", "N/A"), False, str(e))
         pytest.fail(f"FPASS25 failed due to exception: {e}")
 
-def test_fpass26_register_and_back_home(page, request):
+@pytest.mark.prefix_step("new_password", effect="leave")
+def test_fpass26_register_and_back_home(page, request, shared_prefix):
     # Get test data for FPASS25
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS26'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS26')
+    if row is None:
         pytest.skip("FPASS25 test data not found in CSV")
-    row = rows[0]
-    test_data_str = str(row.get("Test Data", ""))
 
     # Extract email and password from CSV
-    email = ""
-    password = ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Navigate to Set New Password tab
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
-        fp_page.enter_email(email)
-        fp_page.click_next_button()  # OTP tab
-        fp_page.click_next_button()  # Set New Password tab
+        shared_prefix(fp_page, email=email)
 
         # Enter new password and confirm password
         page.locator(ForgotPasswordPage.NEW_PASSWORD_INPUT).fill(password)
@@ -1225,20 +1027,18 @@ def test_fpass26_register_and_back_home(page, request):
         update_csv_and_report(fp_page, request, "FPASS26", row.get("Expected Result", "N/A"), False, str(e))
         pytest.fail(f"FPASS25 failed due to exception: {e}")
 
-def test_fpass27_escape_modal(page, request):
+@pytest.mark.prefix_step("modal", effect="write")
+def test_fpass27_escape_modal(page, request, shared_prefix):
     # Get test data for FPASS27
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS27'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS27')
+    if row is None:
         pytest.skip("FPASS27 test data not found in CSV")
-    row = rows[0]
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to login and open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Step 2: Press Escape key
         page.keyboard.press("Escape")
@@ -1259,20 +1059,18 @@ def test_fpass27_escape_modal(page, request):
         update_csv_and_report(fp_page, request, "FPASS27", row.get("Expected Result", "N/A"), False, str(e))
         pytest.fail(f"FPASS27 failed due to exception: {e}")
 
-def test_fpass28_backdrop_click(page, request):
+@pytest.mark.prefix_step("modal", effect="write")
+def test_fpass28_backdrop_click(page, request, shared_prefix):
     # Get test data for FPASS28
-    rows = test_data_df[test_data_df['TC ID'] == 'FPASS28'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('FPASS28')
+    if row is None:
         pytest.skip("FPASS28 test data not found in CSV")
-    row = rows[0]
 
     fp_page = ForgotPasswordPage(page)
 
     try:
         # Step 1: Navigate to login and open Forgot Password modal
-        fp_page.navigate()
-        fp_page.click_login_tab()
-        fp_page.click_forgot_password_button()
+        shared_prefix(fp_page)
 
         # Step 2: Click outside modal area (backdrop area)
         page.mouse.click(10, 10)  # clicking at top-left corner outside modal
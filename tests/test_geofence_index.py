@@ -0,0 +1,41 @@
+import numpy as np
+
+from utils.geofence_index import GeofenceEntry, STRTree, _in_ring, normalize
+
+OUTER = np.array([[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]], dtype=float)
+HOLE = np.array([[1, 1], [3, 1], [3, 3], [1, 3], [1, 1]], dtype=float)
+
+
+def test_in_ring_even_odd():
+    points = np.array([[2, 2], [0.5, 0.5], [5, 2], [-1, -1]])
+    assert _in_ring(OUTER, points).tolist() == [True, True, False, False]
+
+
+def test_contains_excludes_holes():
+    entry = GeofenceEntry("x.kml", 0, 1, "X", (), (0, 0, 14, 14), [[OUTER, HOLE], [OUTER + 10]])
+    points = [[2, 2], [0.5, 2], [12, 12], [8, 8]]
+    assert entry.contains(points).tolist() == [False, True, True, False]
+
+
+def test_representative_point_is_inside():
+    entry = GeofenceEntry("x.kml", 0, 1, "X", (), (0, 0, 4, 4), [[OUTER, HOLE]])
+    assert entry.contains(entry.representative_point())[0]
+
+
+def test_str_tree_query_matches_brute_force():
+    rng = np.random.default_rng(3)
+    corners = rng.uniform(0, 100, (200, 2))
+    boxes = np.hstack([corners, corners + rng.uniform(0, 5, (200, 2))])
+    tree = STRTree(boxes, capacity=4)
+    for box in ([10, 10, 30, 30], [0, 0, 100, 100], [200, 200, 210, 210], [50, 50, 50, 50]):
+        x0, y0, x1, y1 = box
+        expected = np.flatnonzero((boxes[:, 0] <= x1) & (boxes[:, 2] >= x0) & (boxes[:, 1] <= y1) & (boxes[:, 3] >= y0))
+        assert sorted(tree.query(box).tolist()) == expected.tolist()
+
+
+def test_str_tree_empty():
+    assert STRTree([]).query([0, 0, 1, 1]).tolist() == []
+
+
+def test_normalize():
+    assert normalize("Andhra Pradesh") == normalize("ANDHRA_PRADESH") == normalize("AndhraPradesh")
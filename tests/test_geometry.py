@@ -0,0 +1,85 @@
+import io
+import json
+
+import numpy as np
+
+from utils.geometry import (Feature, GeoFence, _JsonStream, iter_geojson_features, iter_kml_features, simplify,
+                            simplify_ring, write_geojson, write_kml)
+
+SQUARE = np.array([[0, 0], [1, 0], [2, 0], [2, 1], [2, 2], [1, 2], [0, 2], [0, 1], [0, 0]], dtype=float)
+HOLE = np.array([[0.5, 0.5], [1.5, 0.5], [1.5, 1.5], [0.5, 1.5], [0.5, 0.5]])
+
+
+def _features():
+    return [
+        Feature({"NAME_1": "AndhraPradesh", "OBJECTID": 38, "Shape_Area": 7.25, "active": True, "note": None},
+                [[SQUARE, HOLE]], "AP", 38),
+        Feature({"NAME_1": "Nellore", "GID_1": "IND.2_1"}, [[SQUARE + 5], [SQUARE + 10]], "", "nel"),
+    ]
+
+
+def test_simplify_ring_drops_collinear_points():
+    simplified = simplify_ring(SQUARE, 0.1)
+    assert simplified.tolist() == [[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]
+
+
+def test_simplify_ring_keeps_small_rings_and_zero_tolerance():
+    triangle = np.array([[0, 0], [1, 0], [0, 1], [0, 0]], dtype=float)
+    assert simplify_ring(triangle, 10) is triangle
+    assert simplify_ring(SQUARE, 0) is SQUARE
+    assert len(simplify_ring(SQUARE, 100)) >= 4
+
+
+def test_simplify_keeps_feature_ids_and_properties():
+    simplified = simplify(GeoFence(_features()), 0.1)
+    assert [f.id for f in simplified.features] == [38, "nel"]
+    assert simplified.features[0].properties["OBJECTID"] == 38
+
+
+def test_json_stream_across_chunk_boundaries(tmp_path):
+    path = tmp_path / "fc.geojson"
+    collection = {"type": "FeatureCollection", "name": "x", "features": [
+        {"type": "Feature", "id": i, "properties": {"n": 12345.678 * i, "s": "a,b]}"},
+         "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}}
+        for i in range(3)]}
+    path.write_text(json.dumps(collection))
+    for chunk_size in range(1, 24):
+        features = list(iter_geojson_features(str(path), chunk_size=chunk_size))
+        assert [f.id for f in features] == [0, 1, 2]
+        assert [f.properties["n"] for f in features] == [12345.678 * i for i in range(3)]
+        assert features[2].properties["s"] == "a,b]}"
+
+
+def test_json_stream_values_and_punctuation():
+    stream = _JsonStream(io.StringIO('  {"a" : 10 , "b": [1, 2]}'), 3)
+    assert stream.expect("{") == "{"
+    assert stream.value() == "a"
+    stream.expect(":")
+    assert stream.value() == 10
+    stream.expect(",")
+    assert stream.value() == "b"
+    stream.expect(":")
+    assert stream.value() == [1, 2]
+    assert stream.peek() == "}"
+
+
+def test_kml_round_trip_keeps_property_types(tmp_path):
+    path = str(tmp_path / "out.kml")
+    write_kml(_features(), path)
+    features = list(iter_kml_features(path))
+    assert features[0].properties == {"NAME_1": "AndhraPradesh", "OBJECTID": 38, "Shape_Area": 7.25,
+                                      "active": True, "note": None}
+    assert features[1].properties == {"NAME_1": "Nellore", "GID_1": "IND.2_1"}
+    assert [f.name for f in features] == ["AP", ""]
+    assert [f.id for f in features] == ["38", "nel"]   # placemark ids are XML text
+    assert len(features[0].polygons[0]) == 2 and len(features[1].polygons) == 2
+    np.testing.assert_allclose(features[0].polygons[0][1], HOLE)
+
+
+def test_geojson_round_trip(tmp_path):
+    path = str(tmp_path / "out.geojson")
+    write_geojson(_features(), path)
+    features = list(iter_geojson_features(path))
+    assert features[0].properties["OBJECTID"] == 38 and features[0].properties["name"] == "AP"
+    assert [f.id for f in features] == [38, "nel"]
+    np.testing.assert_allclose(features[1].polygons[1][0], SQUARE + 10)
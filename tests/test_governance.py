@@ -1,24 +1,21 @@
 import time
 import pytest
-import pandas as pd
 import os
 from pages.login_page import LoginPage
 from pages.governance_page import GovernancePage
-from config import CSV_FILE
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from playwright.sync_api import Page
 from pytest_html import extras
 
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
         if not os.path.exists("reports"):
             os.makedirs("reports")
@@ -29,25 +26,14 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 
 def test_gov01_ministry_upload(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'GOV01'].to_dict(orient="records")[0]
+    row = tc_data['GOV01']
     expected = row.get("Expected", "Ministry file uploaded successfully")
-    test_data_str = row.get("Test Data", "")
 
     # ------------------ Parse Test Data ------------------
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     # Extract variables
     email = data_map.get("email")
@@ -82,13 +68,9 @@ def test_gov01_ministry_upload(page: Page, request):
 
 def test_gov02_add_governance(page: Page, request):
    
-    row = test_data_df[test_data_df['TC ID'] == 'GOV02'].to_dict(orient="records")[0]
+    row = tc_data['GOV02']
     expected = row.get("Expected", "Governance roles created")
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -128,15 +110,9 @@ def test_gov02_add_governance(page: Page, request):
 
 def test_gov03_upload_governance(page: Page,request):
     # ------------------ Load Test Data ------------------
-    test_data_df['TC ID'] = test_data_df['TC ID'].astype(str).str.strip()
-
-    row = test_data_df[test_data_df['TC ID'] == 'GOV03'].to_dict(orient="records")[0]
+    row = tc_data['GOV03']
     expected = row.get("Expected", "Governance roles created")
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -177,13 +153,9 @@ def test_gov03_upload_governance(page: Page,request):
         raise
 
 def test_gov04_role_personnel_mapping(page: Page,request):
-    row = test_data_df[test_data_df['TC ID'] == 'GOV04'].to_dict(orient="records")[0]
+    row = tc_data['GOV04']
     expected = row.get("Expected", "Governance roles created")
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -221,14 +193,10 @@ def test_gov04_role_personnel_mapping(page: Page,request):
         raise
 
 def test_gov05_edit_governance(page: Page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'GOV05'].to_dict(orient="records")[0]
+    row = tc_data['GOV05']
     expected = row.get("Expected", "Governance body updated")
 
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -258,14 +226,10 @@ def test_gov05_edit_governance(page: Page, request):
 
 def test_gov06_update_roles(page: Page, request):
     
-    row6 = test_data_df[test_data_df['TC ID'] == 'GOV06'].to_dict(orient="records")[0]
+    row6 = tc_data['GOV06']
     expected6 = row6.get("Expected", "Governance roles updated")
 
-    data_map6 = {}
-    for item in row6["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map6[key.strip()] = val.strip()
+    data_map6 = row6.params
 
     email = data_map6.get("email")
     password = data_map6.get("password")
@@ -302,14 +266,10 @@ def test_gov06_update_roles(page: Page, request):
 
 def test_gov07_view_governance(page: Page, request):
   
-    row = test_data_df[test_data_df['TC ID'] == 'GOV07'].to_dict(orient="records")[0]
+    row = tc_data['GOV07']
     expected = row.get("Expected", "Complete governance structure displayed")
 
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -0,0 +1,42 @@
+import time
+from pages.login_page import LoginPage
+from pages.governance_page import GovernancePage
+from utils.governance_generator import GovernanceGenerator
+from utils.tc_data import load_tc_data
+
+tc_data = load_tc_data()
+
+MAPPED_ROLES = 10   # mapping latency is measured on a fixed number of pairs as the dropdowns grow
+
+
+def test_governance_scale(page, governance_rows, request):
+    """GOV04 flow fed with generated ministry/roles/officers files of governance_rows rows each
+    (pytest --governance-rows)"""
+    params = tc_data['GOV04'].params
+    generator = GovernanceGenerator(governance_rows, seed=7)
+    files = generator.write()
+
+    login_page = LoginPage(page)
+    governance_page = GovernancePage(page)
+    login_page.navigate()
+    login_page.login(params.email, params.password)
+    governance_page.navigate_to_governance()
+    governance_page.select_location(params.get("country"), params.get("state"),
+                                    params.get("district"), params.get("city"))
+    governance_page.upload_btn.click()
+
+    timings = {}
+    for kind, upload in (("ministry", governance_page.upload_ministry_file),
+                         ("roles", governance_page.upload_roles_file),
+                         ("officers", governance_page.upload_officers_file)):
+        started = time.monotonic()
+        upload(files[kind])
+        timings[f"{kind}_upload_s"] = round(time.monotonic() - started, 3)
+
+    started = time.monotonic()
+    governance_page.map_roles_to_personnel(generator.assignments(MAPPED_ROLES))
+    timings["mapping_s"] = round(time.monotonic() - started, 3)
+
+    request.node.user_properties.append(("governance_rows", governance_rows))
+    request.node.user_properties.extend(timings.items())
+    print(f"{governance_rows:>7} rows  " + "  ".join(f"{k} {v:.2f}" for k, v in timings.items()))
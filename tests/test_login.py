@@ -1,29 +1,25 @@
 import time
 import pytest
-import pandas as pd
-import re
 import os
 from pages.password_toggle_page import PasswordTogglePage
 from pages.login_page import LoginPage
 from pytest_html import extras
-from config import CSV_FILE
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from playwright.sync_api import Page, expect
 
 
 
 # ------------------ LOAD CSV ------------------
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
 
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
         
         if not os.path.exists("reports"):
@@ -35,26 +31,16 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 def test_auth01_valid_login(page: Page, request):
     """AUTH01 - Valid Login with Email and Password"""
 
     tcid = "AUTH01"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
+    params = tc_row.params
+    email = params.email
+    password = params.password
 
-   
-    test_data_str = str(tc_row.get("Test Data", ""))
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str)
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-
-    email = email_match.group(1) if email_match else ""
-    password = password_match.group(1) if password_match else ""
 
     login_page = LoginPage(page)
 
@@ -62,8 +48,8 @@ def test_auth01_valid_login(page: Page, request):
        
         login_page.navigate("login")
 
-
-        login_page.login(email, password)
+        # AUTH01 exercises the UI login itself; it also warms the session cache
+        login_page.login(email, password, use_cache=False)
 
         update_csv_and_report(login_page, request, tcid, expected_result, passed=True)
 
@@ -83,16 +69,12 @@ def test_auth02_invalid_password(page: Page, request):
     """AUTH02 - Invalid Login with Wrong Password"""
 
     tcid = "AUTH02"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
+    params = tc_row.params
+    email = params.email
+    password = params.password
 
-    
-    test_data_str = str(tc_row.get("Test Data", ""))
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str)
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-
-    email = email_match.group(1) if email_match else ""
-    password = password_match.group(1) if password_match else ""
 
     login_page = LoginPage(page)
 
@@ -127,16 +109,12 @@ def test_auth03_invalid_nonexistent_email(page: Page, request):
     """AUTH03 - Invalid Login with Non-existent Email"""
 
     tcid = "AUTH03"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
+    params = tc_row.params
+    email = params.email
+    password = params.password
 
-   
-    test_data_str = str(tc_row.get("Test Data", ""))
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str)
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-
-    email = email_match.group(1) if email_match else ""
-    password = password_match.group(1) if password_match else ""
 
     login_page = LoginPage(page)
 
@@ -173,13 +151,10 @@ def test_auth04_empty_email_field(page: Page, request):
     """AUTH04 - Empty Email Field Validation"""
 
     tcid = "AUTH04"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
-
-   
-    test_data_str = str(tc_row.get("Test Data", ""))
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-    password = password_match.group(1) if password_match else ""
+    params = tc_row.params
+    password = params.password
 
     login_page = LoginPage(page)
 
@@ -206,13 +181,10 @@ def test_auth05_empty_password_field(page: Page, request):
     """AUTH05 - Empty Password Field Validation"""
 
     tcid = "AUTH05"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
-
-    
-    test_data_str = str(tc_row.get("Test Data", ""))
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str)
-    email = email_match.group(1) if email_match else ""
+    params = tc_row.params
+    email = params.email
 
     login_page = LoginPage(page)
 
@@ -240,17 +212,13 @@ def test_auth06_invalid_email_format(page: Page, request):
     """AUTH06 - Invalid Email Format Validation"""
 
     tcid = "AUTH06"
-    tc_row = test_data_df[test_data_df['TC ID'] == tcid].iloc[0]
+    tc_row = tc_data[tcid]
     expected_result = tc_row["Expected Result"]
+    params = tc_row.params
+    email = params.email
+    password = params.password
 
 
-    test_data_str = str(tc_row.get("Test Data", ""))
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str)
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-
-    email = email_match.group(1) if email_match else ""
-    password = password_match.group(1) if password_match else ""
-
     login_page = LoginPage(page)
 
     try:
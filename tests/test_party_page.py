@@ -1,29 +1,24 @@
-import random
-import time
 from playwright.sync_api import Page
-import time
 import pytest
-import pandas as pd
 import os
 from pages.login_page import LoginPage
 from pages.governance_page import GovernancePage
-from config import CSV_FILE
+from utils.random_utils import identities
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from playwright.sync_api import Page
 from pytest_html import extras
 
 from pages.party_page import PartyPage
 
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
         # Screenshot for failed step
         if not os.path.exists("reports"):
@@ -35,24 +30,14 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 
 def test_party01_add_party(page: Page, request):
     # Fetch row
-    row = test_data_df[test_data_df['TC ID'] == 'PARTY01'].to_dict(orient="records")[0]
+    row = tc_data['PARTY01']
     expected = row.get("Expected", "Party created successfully")
 
     # Parse test data into dict
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -64,7 +49,7 @@ def test_party01_add_party(page: Page, request):
     city = data_map.get("city")
 
     # Generate dynamic party code
-    party_code = f"{random.randint(100, 999)}{int(time.time()) % 1000}"
+    party_code = identities.code()
 
     login_page = LoginPage(page)
     party_page = PartyPage(page)
@@ -97,15 +82,11 @@ def test_party01_add_party(page: Page, request):
 
 def test_party02_edit_party(page, request):
     # Fetch PARTY02 row from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'PARTY02'].to_dict(orient="records")[0]
+    row = tc_data['PARTY02']
     expected = row.get("Expected", "Party details updated")
 
     # Parse test data
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
@@ -135,15 +116,11 @@ def test_party02_edit_party(page, request):
 
 def test_party03_view_party(page, request):
     # Fetch PARTY03 row from CSV
-    row = test_data_df[test_data_df['TC ID'] == 'PARTY03'].to_dict(orient="records")[0]
+    row = tc_data['PARTY03']
     expected = row.get("Expected", "Complete party information displayed")
 
     # Parse test data into dict
-    data_map = {}
-    for item in row["Test Data"].split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     email = data_map.get("email")
     password = data_map.get("password")
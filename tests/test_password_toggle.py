@@ -1,29 +1,28 @@
 import time
 import pytest
-import pandas as pd
-import re
 import os
 from pages.password_toggle_page import PasswordTogglePage
 from pages.login_page import LoginPage
 from pytest_html import extras
-from config import CSV_FILE
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from playwright.sync_api import Page, expect
 
 
 
 # ------------------ LOAD CSV ------------------
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
+
+# form-only checks: images, fonts and media are never looked at
+pytestmark = pytest.mark.block_resources("fast")
 
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
         
         if not os.path.exists("reports"):
@@ -35,16 +34,10 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 
 # ------------------ AUTH07 ------------------
 def test_auth07_login_tab(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH07'].to_dict(orient="records")[0]
+    row = tc_data['AUTH07']
     expected = row.get("Expected Result", "N/A")
     password_page = PasswordTogglePage(page)
 
@@ -58,11 +51,10 @@ def test_auth07_login_tab(page, request):
 
 # ------------------ AUTH09 ------------------
 def test_auth09_password_toggle(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH09'].to_dict(orient="records")[0]
+    row = tc_data['AUTH09']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str)
-    password = password_match.group(1) if password_match else ""
+    params = row.params
+    password = params.password
 
     password_page = PasswordTogglePage(page)
 
@@ -80,14 +72,12 @@ def test_auth09_password_toggle(page, request):
 
 # ------------------ AUTH10 ------------------
 def test_auth10_first_next(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH10'].to_dict(orient="records")[0]
+    row = tc_data['AUTH10']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
     email, password = "", ""
-    if "Email:" in test_data_str:
-        email = test_data_str.split("Email:")[1].split(",")[0].strip()
-    if "Password:" in test_data_str:
-        password = test_data_str.split("Password:")[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     login_page = LoginPage(page)
 
@@ -105,14 +95,12 @@ def test_auth10_first_next(page, request):
 
 # ------------------ AUTH11 ------------------
 def test_auth11_verify_email_in_otp_tab(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH11'].to_dict(orient="records")[0]
+    row = tc_data['AUTH11']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     
-    email = ""
-    if "Email:" in test_data_str:
-        email = test_data_str.split("Email:")[1].strip()
+    params = row.params
+    email = params.email
 
     login_page = LoginPage(page)
 
@@ -127,17 +115,15 @@ def test_auth11_verify_email_in_otp_tab(page, request):
         
 # ------------------ AUTH15 ------------------
 def test_auth15_otp_input_ui(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH15'].to_dict(orient="records")[0]
+    row = tc_data['AUTH15']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
    
     import re
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str, re.IGNORECASE)
-    password_match = re.search(r"Password:\s*([^\s]+)", test_data_str, re.IGNORECASE)
+    params = row.params
+    email = params.email
+    password = params.password
 
-    email = email_match.group(1).strip() if email_match else ""
-    password = password_match.group(1).strip() if password_match else ""
 
     login_page = LoginPage(page)
 
@@ -179,18 +165,15 @@ def test_auth15_otp_input_ui(page, request):
 
 # ------------------ AUTH16 ------------------
 def test_auth16_otp_input_validation(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH16'].to_dict(orient="records")[0]
+    row = tc_data['AUTH16']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     import re
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str, re.IGNORECASE)
-    password_match = re.search(r"Password:\s*([^\s,]+)", test_data_str, re.IGNORECASE)
-    otp_match = re.search(r"OTP:\s*([^\s]+)", test_data_str, re.IGNORECASE)
+    params = row.params
+    email = params.email
+    password = params.password
+    otp_value = params.otp
 
-    email = email_match.group(1).strip() if email_match else ""
-    password = password_match.group(1).strip() if password_match else ""
-    otp_value = otp_match.group(1).strip() if otp_match else ""
 
     login_page = LoginPage(page)
 
@@ -241,19 +224,16 @@ def test_auth16_otp_input_validation(page, request):
 
 # ------------------ AUTH12 ------------------
 def test_auth12_otp_auto_focus(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH12'].to_dict(orient="records")[0]
+    row = tc_data['AUTH12']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     import re
     
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str, re.IGNORECASE)
-    password_match = re.search(r"Password:\s*([^\s,]+)", test_data_str, re.IGNORECASE)
-    otp_match = re.search(r"OTP:\s*([^\s]+)", test_data_str, re.IGNORECASE)
+    params = row.params
+    email = params.email
+    password = params.password
+    otp_value = params.otp
 
-    email = email_match.group(1).strip() if email_match else ""
-    password = password_match.group(1).strip() if password_match else ""
-    otp_value = otp_match.group(1).strip() if otp_match else ""
 
     login_page = LoginPage(page)
 
@@ -312,19 +292,16 @@ def test_auth12_otp_auto_focus(page, request):
 
 # -------------------- AUTH13: OTP Backspace Navigation --------------------
 def test_auth13_otp_backspace(page, request):
-    row = test_data_df[test_data_df['TC ID'] == 'AUTH13'].to_dict(orient="records")[0]
+    row = tc_data['AUTH13']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     import re
     # Extract Email, Password, OTP
-    email_match = re.search(r"Email:\s*([^\s]+)", test_data_str, re.IGNORECASE)
-    password_match = re.search(r"Password:\s*([^\s,]+)", test_data_str, re.IGNORECASE)
-    otp_match = re.search(r"OTP:\s*([^\s]+)", test_data_str, re.IGNORECASE)
+    params = row.params
+    email = params.email
+    password = params.password
+    otp_value = params.otp
 
-    email = email_match.group(1).strip() if email_match else ""
-    password = password_match.group(1).strip() if password_match else ""
-    otp_value = otp_match.group(1).strip() if otp_match else ""
 
     login_page = LoginPage(page)
 
@@ -388,36 +365,34 @@ def test_auth13_otp_backspace(page, request):
 
 def test_auth14_resend_otp_timer(page, request):
    
-    rows = test_data_df[test_data_df['TC ID'] == 'AUTH14'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('AUTH14')
+    if row is None:
         pytest.skip("AUTH14 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     
     email, password = "", ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     login_page = LoginPage(page)
 
     try:
         
+        login_page.install_clock()
         login_page.navigate()
         login_page.tab_login.click()
         login_page.input_email.fill(email)
         login_page.input_password.fill(password)
         login_page.btn_next.click()
-        page.wait_for_timeout(1000)
+        expect(login_page.masked_email).to_be_visible(timeout=5000)
+        login_page.pause_clock()
         login_page.btn_next.click() 
 
        
-        print("⏳ Waiting 20 seconds for countdown...")
-        page.wait_for_timeout(20000)
+        print("⏩ Fast-forwarding 20 virtual seconds of countdown...")
+        login_page.advance_clock(20)
 
        
         expect(login_page.resend_button).to_be_visible(timeout=5000)
@@ -432,20 +407,16 @@ def test_auth14_resend_otp_timer(page, request):
 
 def test_auth17_keyboard_navigation(page, request):
     
-    rows = test_data_df[test_data_df['TC ID'] == 'AUTH17'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('AUTH17')
+    if row is None:
         pytest.skip("AUTH17 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     
     email, password = "", ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     login_page = LoginPage(page)
 
@@ -475,19 +446,15 @@ def test_auth17_keyboard_navigation(page, request):
 
 
 def test_auth18_logout_functionality(page, request):
-    rows = test_data_df[test_data_df['TC ID'] == 'AUTH18'].to_dict(orient="records")
-    if not rows:
+    row = tc_data.get('AUTH18')
+    if row is None:
         pytest.skip("AUTH18 test data not found in CSV")
-    row = rows[0]
     expected = row.get("Expected Result", "N/A")
-    test_data_str = str(row.get("Test Data", ""))
 
     email, password = "", ""
-    for line in test_data_str.splitlines():
-        if line.strip().lower().startswith("email:"):
-            email = line.split(":", 1)[1].strip()
-        elif line.strip().lower().startswith("password:"):
-            password = line.split(":", 1)[1].strip()
+    params = row.params
+    email = params.email
+    password = params.password
 
     login_page = LoginPage(page)
 
@@ -504,6 +471,7 @@ def test_auth18_logout_functionality(page, request):
         login_page.tab_account_settings.click()
         login_page.btn_logout.wait_for(state="visible", timeout=10000)
         login_page.btn_logout.click()
+        login_page.forget_session(email)
 
         update_csv_and_report(login_page, request, "AUTH18", expected, True)
         print("✅ AUTH18: Logout clicked (no verification)")
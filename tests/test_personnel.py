@@ -1,27 +1,23 @@
-import random
 import pytest
-import pandas as pd
 import os
-import time
 from pages.login_page import LoginPage
 from pages.personnel_page import PersonnelPage
-from config import CSV_FILE
+from utils.random_utils import identities
+from utils.result_journal import result_journal
+from utils.tc_data import load_tc_data
 from pytest_html import extras
 from playwright.sync_api import Page
 
 # ------------------ LOAD CSV ------------------
-test_data_df = pd.read_csv(CSV_FILE, engine="python")
+tc_data = load_tc_data()
 
 
 def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
-    """Helper to update CSV + attach screenshot if failed."""
-    last_index = test_data_df[test_data_df['TC ID'] == tcid].index[0]
+    """Helper to journal the TC result + attach screenshot if failed."""
     if passed:
-        test_data_df.at[last_index, "Status"] = "Passed"
-        test_data_df.at[last_index, "Remarks"] = expected
+        result_journal.record(tcid, "Passed", expected)
     else:
-        test_data_df.at[last_index, "Status"] = "Failed"
-        test_data_df.at[last_index, "Remarks"] = f"Expected: {expected} | Actual: {error}"
+        result_journal.record(tcid, "Failed", f"Expected: {expected} | Actual: {error}")
 
        
         if not os.path.exists("reports"):
@@ -33,25 +29,14 @@ def update_csv_and_report(page_obj, request, tcid, expected, passed, error=""):
             request.config._html.extra.append(extras.image(screenshot_path))
             request.config._html.extra.append(extras.text(f"{tcid} Failed: {error}"))
 
-    try:
-        test_data_df.to_csv(CSV_FILE, index=False)
-    except PermissionError:
-        temp_csv = CSV_FILE.replace(".csv", "_temp.csv")
-        test_data_df.to_csv(temp_csv, index=False)
-
 
 def test_pers02_add_personnel(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'PERS02'].to_dict(orient="records")[0]
+    row = tc_data['PERS02']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
     # ------------------ Parse Test Data safely ------------------
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)  
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     
     email = data_map.get("Email")
@@ -61,10 +46,9 @@ def test_pers02_add_personnel(page: Page, request):
     address = data_map.get("address")
 
     
-    timestamp = int(time.time())
-    personal_email = f"{firstname.lower()}{timestamp}@example.com"
-    personal_email_id = f"{lastname.lower()}{timestamp}"
-    dynamic_phone = f"+91{random.randint(1000000000, 9999999999)}"
+    personal_email = identities.email(firstname)
+    personal_email_id = identities.emp_id(lastname.lower())
+    dynamic_phone = identities.phone()
 
     
     login_page = LoginPage(page)
@@ -96,16 +80,11 @@ def test_pers02_add_personnel(page: Page, request):
 
 def test_pers03_select_profile(page: Page, request):
     
-    row = test_data_df[test_data_df['TC ID'] == 'PERS03'].to_dict(orient="records")[0]
+    row = tc_data['PERS03']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
     
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     
     email = data_map.get("Email")
@@ -140,16 +119,11 @@ def test_pers03_select_profile(page: Page, request):
 
 def test_pers04_assign_jurisdiction(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'PERS04'].to_dict(orient="records")[0]
+    row = tc_data['PERS04']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
    
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
    
     email = data_map.get("Email")
@@ -183,16 +157,11 @@ def test_pers04_assign_jurisdiction(page: Page, request):
 
 def test_pers05_institution_assignment(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'PERS05'].to_dict(orient="records")[0]
+    row = tc_data['PERS05']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
     
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
    
     email = data_map.get("Email")
@@ -223,16 +192,11 @@ def test_pers05_institution_assignment(page: Page, request):
 
 def test_pers06_edit_personnel(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'PERS06'].to_dict(orient="records")[0]
+    row = tc_data['PERS06']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
     
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item or "=" in item:
-            key, val = item.replace("=", ":").split(":", 1)  # normalize separator
-            data_map[key.strip()] = val.strip()
+    data_map = row.params  # accepts both "key:value" and "key=value"
 
     
     email = data_map.get("Email")
@@ -263,16 +227,11 @@ def test_pers06_edit_personnel(page: Page, request):
 
 def test_pers07_view_personnel(page: Page, request):
     # ------------------ Load Test Data ------------------
-    row = test_data_df[test_data_df['TC ID'] == 'PERS07'].to_dict(orient="records")[0]
+    row = tc_data['PERS07']
     expected = row.get("Expected Result", "N/A")
-    test_data_str = row.get("Test Data", "")
 
     
-    data_map = {}
-    for item in test_data_str.split(","):
-        if ":" in item:
-            key, val = item.split(":", 1)
-            data_map[key.strip()] = val.strip()
+    data_map = row.params
 
     
     email = data_map.get("Email")
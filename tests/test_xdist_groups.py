@@ -0,0 +1,67 @@
+"""The xdist_group pins tests/conftest.py adds must reach the node IDs pytest-xdist --dist loadgroup schedules by"""
+import os
+import re
+import shutil
+
+import pytest
+
+pytest.importorskip("xdist")
+
+pytest_plugins = ["pytester"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_loadgroup(pytester, monkeypatch, source: str, *args):
+    """Run source as test_grouped.py on two loadgroup workers with this repo's conftest as a plugin,
+    in a copy of data/ so results land there; returns the run result and {test name: (worker, group)}"""
+    shutil.copytree(os.path.join(ROOT, "data"), pytester.path / "data")
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    pytester.makepyfile(test_grouped=source)
+    result = pytester.runpytest_subprocess("-p", "tests.conftest", "-n", "2", "--dist", "loadgroup", "-v", *args)
+    placed = {name: (worker, group) for worker, name, group in
+              re.findall(r"\[(gw\d+)\][^\n]*? PASSED test_grouped\.py::(\w+(?:\[\d+\])?)@([\w:-]+)", result.stdout.str())}
+    return result, placed
+
+
+def test_shard_groups_reach_loadgroup(pytester, monkeypatch):
+    """--shards 2 puts every test in shard-0 or shard-1, and each shard runs on one worker"""
+    result, placed = run_loadgroup(pytester, monkeypatch, """
+        import pytest
+
+        @pytest.mark.parametrize("n", range(6))
+        def test_unit(n):
+            pass
+    """, "--shards", "2")
+    result.assert_outcomes(passed=6)
+    assert len(placed) == 6, result.stdout.str()
+    groups = {group for _, group in placed.values()}
+    assert groups == {"shard-0", "shard-1"}
+    for group in groups:
+        assert len({worker for worker, g in placed.values() if g == group}) == 1, f"{group} split across workers"
+
+
+def test_prefix_steps_pin_their_module(pytester, monkeypatch):
+    """prefix_step tests run as group prefix:<module> on one worker; unmarked tests stay ungrouped"""
+    result, placed = run_loadgroup(pytester, monkeypatch, """
+        import pytest
+
+        @pytest.mark.prefix_step("list")
+        def test_read():
+            pass
+
+        @pytest.mark.prefix_step("list", effect="write")
+        def test_write():
+            pass
+
+        @pytest.mark.prefix_step("form", effect="leave")
+        def test_leave():
+            pass
+
+        def test_free():
+            pass
+    """)
+    result.assert_outcomes(passed=4)
+    assert set(placed) == {"test_read", "test_write", "test_leave"}, result.stdout.str()
+    assert {group for _, group in placed.values()} == {"prefix:test_grouped"}
+    assert len({worker for worker, _ in placed.values()}) == 1
@@ -0,0 +1,135 @@
+import hashlib
+import mimetypes
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from config import UPLOAD_CACHE_BYTES, UPLOADS_DIR
+
+
+@dataclass(frozen=True)
+class Asset:
+    name: str       # path under uploads/, '/' separated (e.g. governanceV5/ministryV5.csv)
+    path: str       # absolute path
+    size: int
+    mime: str
+    sha1: str
+
+
+class BufferCache:
+    """LRU of asset bytes, evicting least recently used entries beyond max_bytes in total"""
+
+    def __init__(self, max_bytes: int = UPLOAD_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self._buffers = OrderedDict()
+
+    def get(self, key):
+        content = self._buffers.get(key)
+        if content is not None:
+            self._buffers.move_to_end(key)
+        return content
+
+    def put(self, key, content: bytes):
+        if len(content) > self.max_bytes:
+            return
+        old = self._buffers.pop(key, None)
+        if old is not None:
+            self.total -= len(old)
+        self._buffers[key] = content
+        self.total += len(content)
+        while self.total > self.max_bytes:
+            _, evicted = self._buffers.popitem(last=False)
+            self.total -= len(evicted)
+
+
+class AssetIndex:
+    """Name and content-hash index over uploads/, built by one scan"""
+
+    def __init__(self, root: str = UPLOADS_DIR, cache_bytes: int = UPLOAD_CACHE_BYTES):
+        self.root = root
+        self._by_name = {}
+        self._by_hash = {}
+        self.buffers = BufferCache(cache_bytes)
+        basenames = {}
+        for directory, _, files in os.walk(root):
+            for filename in sorted(files):
+                path = os.path.join(directory, filename)
+                with open(path, "rb") as f:
+                    content = f.read()
+                name = os.path.relpath(path, root).replace(os.sep, "/")
+                mime = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                asset = Asset(name, path, len(content), mime, hashlib.sha1(content).hexdigest())
+                self._by_name[name] = asset
+                self._by_hash.setdefault(asset.sha1, asset)
+                basenames.setdefault(filename, []).append(asset)
+                self.buffers.put(asset.sha1, content)  # already read for the hash, keep it warm
+        # bare file names resolve too, as long as they are unique across subfolders
+        for filename, assets in basenames.items():
+            if len(assets) == 1:
+                self._by_name.setdefault(filename, assets[0])
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(self._by_hash)
+
+    def __iter__(self):
+        """Every indexed file once, by relative path"""
+        return iter({asset.name: asset for asset in self._by_name.values()}.values())
+
+    def get(self, name: str):
+        """Asset for 'stateV5.csv', 'uploads/governanceV5/rolesV5.csv' or an old absolute
+        'C:\\...\\uploads\\stateV5.csv' path; None if it is not under uploads/"""
+        key = str(name).replace("\\", "/")
+        if "uploads/" in key:
+            key = key.rsplit("uploads/", 1)[1]
+        return self._by_name.get(key.lstrip("/"))
+
+    def resolve(self, name: str) -> Asset:
+        asset = self.get(name)
+        if asset is None:
+            raise FileNotFoundError(f"Asset {name!r} not found under {self.root}")
+        return asset
+
+    def by_hash(self, sha1: str):
+        return self._by_hash.get(sha1)
+
+    def read(self, name: str) -> bytes:
+        """Asset bytes, from the buffer cache when warm (keyed by content, so copies share one buffer)"""
+        asset = self.resolve(name)
+        content = self.buffers.get(asset.sha1)
+        if content is None:
+            with open(asset.path, "rb") as f:
+                content = f.read()
+            self.buffers.put(asset.sha1, content)
+        return content
+
+    def payload(self, name: str) -> dict:
+        """set_input_files() payload served from memory instead of from disk"""
+        asset = self.resolve(name)
+        return {"name": os.path.basename(asset.name), "mimeType": asset.mime, "buffer": self.read(name)}
+
+
+@lru_cache(maxsize=None)
+def load_assets() -> AssetIndex:
+    """Scan uploads/ once per process"""
+    return AssetIndex()
+
+
+def asset_path(name: str) -> str:
+    """Absolute path of an upload asset; paths outside uploads/ are returned as given if they exist"""
+    asset = load_assets().get(name)
+    if asset is not None:
+        return asset.path
+    if os.path.exists(name):
+        return os.path.abspath(name)
+    raise FileNotFoundError(f"Asset {name!r} not found under {UPLOADS_DIR}")
+
+
+def asset_payload(name: str):
+    """In-memory set_input_files payload for an upload asset, or its path if it is not under uploads/"""
+    index = load_assets()
+    return index.payload(name) if name in index else asset_path(name)
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import async_playwright
+
+from config import BROWSER
+from utils.wait_telemetry import start_flow_telemetry
+
+
+@dataclass
+class FlowResult:
+    index: int
+    passed: bool
+    seconds: float
+    value: object = None
+    error: str = ""
+    waited: float = 0.0   # seconds this flow spent in AsyncBasePage waits
+
+
+async def _run_flows(flow, count, concurrency, browser_name, launch_args, context_args, routes):
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(**launch_args)
+        gate = asyncio.Semaphore(concurrency)
+
+        async def run_one(index):
+            async with gate:
+                telemetry = start_flow_telemetry()
+                context = await browser.new_context(**context_args)
+                if routes is not None:
+                    await routes(context)
+                page = await context.new_page()
+                started = time.monotonic()
+                try:
+                    value = await flow(page, index)
+                    return FlowResult(index, True, round(time.monotonic() - started, 3), value,
+                                      waited=round(telemetry.waited, 3))
+                except Exception as e:
+                    return FlowResult(index, False, round(time.monotonic() - started, 3), error=str(e),
+                                      waited=round(telemetry.waited, 3))
+                finally:
+                    await context.close()
+
+        try:
+            return await asyncio.gather(*(run_one(i) for i in range(count)))
+        finally:
+            await browser.close()
+
+
+def run_flows(flow, count: int, concurrency: int = None, browser_name: str = BROWSER,
+              launch_args: dict = None, context_args: dict = None, routes=None):
+    """Run `await flow(page, index)` count times, each in its own context of one async browser,
+    at most `concurrency` at once; return [FlowResult] in index order.
+
+    `await routes(context)`, when given, runs on every context before its page opens (the
+    stand-in backend's routes; see the flow_routes fixture). These contexts are not pooled and
+    get no HAR recording or resource blocking. Each flow's waits are timed on its own
+    (FlowResult.waited), never in the calling test's wait_telemetry.
+
+    The event loop runs on its own thread, so this is safe to call from a sync pytest-playwright
+    test (whose Playwright already owns the calling thread).
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["results"] = asyncio.run(_run_flows(
+                flow, count, concurrency or count, browser_name, launch_args or {}, context_args or {}, routes))
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name="async-flows")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["results"]
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import time
+import weakref
+
+from config import AUTH_CACHE_ENABLED, AUTH_STATE_DIR, AUTH_STATE_TTL, BASE_URL
+
+
+class AuthStateCache:
+    """Per-worker cache of Playwright storage_state keyed by (BASE_URL, email)"""
+
+    def __init__(self, state_dir: str = AUTH_STATE_DIR, ttl: int = AUTH_STATE_TTL):
+        self.enabled = AUTH_CACHE_ENABLED
+        self.state_dir = state_dir
+        self.ttl = ttl
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        self._states = {}   # path -> (saved_at, storage_state)
+        self._tracked = weakref.WeakKeyDictionary()  # page -> email
+
+    def state_path(self, email: str) -> str:
+        key = hashlib.sha1(f"{BASE_URL}|{email}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{self.worker}_{key}.json")
+
+    def load(self, email: str):
+        """Return the cached storage_state, or None if missing or older than the TTL"""
+        if not self.enabled:
+            return None
+        path = self.state_path(email)
+        cached = self._states.get(path)
+        if cached is None:
+            try:
+                saved_at = os.path.getmtime(path)
+                with open(path, encoding="utf-8") as f:
+                    cached = (saved_at, json.load(f))
+            except (OSError, ValueError):
+                return None
+            self._states[path] = cached
+
+        saved_at, state = cached
+        if time.time() - saved_at > self.ttl:
+            self.invalidate(email)
+            return None
+        return state
+
+    def save(self, page, email: str):
+        """Persist the storage_state of the page's context after a UI login"""
+        if not self.enabled:
+            return None
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.state_path(email)
+        state = page.context.storage_state(path=path)
+        self._states[path] = (time.time(), state)
+        self.track(page, email)
+        return state
+
+    def invalidate(self, email: str):
+        path = self.state_path(email)
+        self._states.pop(path, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def restore(self, page, state: dict):
+        """Apply a cached storage_state to the page's current context.
+
+        Cookies go on the context; localStorage is written through the page, so
+        the page must already be on the app origin (tests navigate before login).
+        """
+        if state.get("cookies"):
+            page.context.add_cookies(state["cookies"])
+        for origin in state.get("origins", []):
+            if page.url.startswith(origin["origin"]):
+                page.evaluate(
+                    "items => items.forEach(i => window.localStorage.setItem(i.name, i.value))",
+                    origin.get("localStorage", []),
+                )
+
+    def track(self, page, email: str):
+        self._tracked[page] = email
+
+    def tracked_email(self, page):
+        return self._tracked.get(page)
+
+    def clear(self):
+        """Drop every state file written by this worker"""
+        self._states.clear()
+        self._tracked.clear()
+        if not os.path.isdir(self.state_dir):
+            return
+        for name in os.listdir(self.state_dir):
+            if name.startswith(f"{self.worker}_") and name.endswith(".json"):
+                os.remove(os.path.join(self.state_dir, name))
+
+
+auth_cache = AuthStateCache()
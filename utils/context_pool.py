@@ -0,0 +1,123 @@
+import time
+import weakref
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from config import BASE_URL, CONTEXT_POOL_MAX_USES
+
+_CLEAR_STORAGE = "() => { window.localStorage.clear(); window.sessionStorage.clear(); }"
+
+# contexts a test installed Playwright's fake clock on (BasePage.install_clock): the clock
+# belongs to the whole context and cannot be uninstalled, so the pool closes them at checkin
+clocked_contexts = weakref.WeakSet()
+
+
+@dataclass
+class Lease:
+    """One pooled context and the page a test drives in it"""
+
+    context: object
+    page: object
+    uses: int = 0
+    warmed_at: float = field(default_factory=time.monotonic)
+
+
+class ContextPool:
+    """A small ring of browser contexts on the worker's one browser, kept warm between tests.
+
+    A context is warmed once (app shell loaded, so its HTTP cache holds the SPA bundle) and
+    handed out again after a reset: extra pages closed, routes, cookies, permissions and
+    storage cleared, and a fresh page parked on the app shell. Contexts that failed a test,
+    failed their reset, reached max_uses or had the fake clock installed are closed and
+    replaced instead. routes(context), when given, installs the stand-in backend's route
+    handlers on every context before it loads anything, and again after each reset.
+    """
+
+    def __init__(self, browser, size: int = 2, context_args: dict = None,
+                 base_url: str = BASE_URL, max_uses: int = CONTEXT_POOL_MAX_USES, routes=None):
+        self.browser = browser
+        self.size = size
+        self.context_args = dict(context_args or {})
+        self.base_url = base_url
+        self.max_uses = max_uses
+        self.routes = routes
+        self._idle = []
+        self._leased = {}   # context -> Lease
+        self.stats = {"warmed": 0, "reused": 0, "discarded": 0}
+
+    @property
+    def origin(self) -> str:
+        parts = urlsplit(self.base_url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def fill(self):
+        """Warm contexts until size are idle"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._warm())
+
+    def _warm(self) -> Lease:
+        context = self.browser.new_context(**self.context_args)
+        if self.routes is not None:
+            self.routes(context)
+        page = context.new_page()
+        page.goto(self.base_url, wait_until="domcontentloaded")
+        self.stats["warmed"] += 1
+        return Lease(context, page)
+
+    def checkout(self) -> Lease:
+        lease = self._idle.pop() if self._idle else self._warm()
+        if lease.uses:
+            self.stats["reused"] += 1
+        lease.uses += 1
+        self._leased[lease.context] = lease
+        return lease
+
+    def page_for(self, context):
+        lease = self._leased.get(context)
+        return lease.page if lease else None
+
+    def checkin(self, lease: Lease, discard: bool = False):
+        """Return a context: reset it for the next test, or close it if it cannot be trusted"""
+        self._leased.pop(lease.context, None)
+        discard = discard or lease.context in clocked_contexts
+        if not discard and lease.uses < self.max_uses and len(self._idle) < self.size:
+            try:
+                self._reset(lease)
+                self._idle.append(lease)
+                return
+            except Exception:
+                pass   # a context that cannot be reset is not handed out again
+        self.stats["discarded"] += 1
+        self._close(lease)
+
+    def _reset(self, lease: Lease):
+        context = lease.context
+        on_origin = [p for p in context.pages if p.url.startswith(self.origin)]
+        if on_origin:
+            on_origin[0].evaluate(_CLEAR_STORAGE)
+        context.unroute_all(behavior="ignoreErrors")
+        if self.routes is not None:
+            self.routes(context)
+        context.clear_cookies()
+        context.clear_permissions()
+        # listeners a test put on its page die with it; the next test gets a new page
+        lease.page = context.new_page()
+        for page in list(context.pages):
+            if page is not lease.page:
+                page.close()
+        lease.page.goto(self.base_url, wait_until="domcontentloaded")
+        if not on_origin:
+            lease.page.evaluate(_CLEAR_STORAGE)
+            lease.page.reload(wait_until="domcontentloaded")
+
+    def _close(self, lease: Lease):
+        try:
+            lease.context.close()
+        except Exception:
+            pass
+
+    def close(self):
+        for lease in self._idle + list(self._leased.values()):
+            self._close(lease)
+        self._idle.clear()
+        self._leased.clear()
@@ -0,0 +1,145 @@
+import heapq
+import os
+import re
+import sqlite3
+import statistics
+import time
+
+from config import BACKEND_MODE, HISTORY_DB, HISTORY_DEFAULT_SECONDS, HISTORY_WINDOW
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    run REAL NOT NULL,
+    backend TEXT NOT NULL,
+    tc_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    wait_seconds REAL,
+    retries INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS durations_tc ON durations (backend, tc_id, run);
+"""
+
+# a worse outcome of one test's setup/call/teardown reports wins
+_OUTCOMES = ("passed", "skipped", "failed", "error")
+
+
+def _family(tc_id: str, nodeid: str) -> str:
+    """COUNTRY, FPASS, ... for TC IDs, else the test file"""
+    match = re.match(r"([A-Z]+)\d+$", tc_id)
+    return match.group(1) if match else nodeid.split("::")[0]
+
+
+class DurationHistory:
+    """SQLite log of how long each test took on every run, and the estimates sharding plans with.
+
+    Only the controller records (xdist forwards every worker report to it); rows are kept in
+    memory and written in one transaction at session end. Durations are kept per BACKEND_MODE,
+    so stub runs do not skew estimates for the real server.
+    """
+
+    def __init__(self, path: str = HISTORY_DB, window: int = HISTORY_WINDOW,
+                 default: float = HISTORY_DEFAULT_SECONDS, backend: str = BACKEND_MODE):
+        self.path = path
+        self.window = window
+        self.default = default
+        self.backend = backend
+        self.recording = False
+        self.run = time.time()
+        self._pending = {}   # nodeid -> row
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        db = sqlite3.connect(self.path)
+        db.executescript(_SCHEMA)
+        return db
+
+    def add_report(self, report):
+        """Fold one setup/call/teardown (or rerun) report into its test's row"""
+        if not self.recording:
+            return
+        nodeid = report.nodeid.split("@")[0]   # xdist_group suffix
+        props = dict(report.user_properties)
+        row = self._pending.setdefault(nodeid, {
+            "tc_id": props.get("tc_id", nodeid), "outcome": "passed",
+            "duration": 0.0, "wait_seconds": None, "retries": 0,
+        })
+        row["duration"] += report.duration
+        if report.outcome == "rerun":
+            row["retries"] += 1
+            return
+        if report.when == "call":
+            outcome = report.outcome
+            row["wait_seconds"] = props.get("wait_seconds", row["wait_seconds"])
+        else:
+            outcome = "error" if report.failed else report.outcome
+        if _OUTCOMES.index(outcome) > _OUTCOMES.index(row["outcome"]):
+            row["outcome"] = outcome
+
+    def save(self):
+        if not self._pending:
+            return
+        db = self._connect()
+        try:
+            with db:
+                db.executemany(
+                    "INSERT INTO durations VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(self.run, self.backend, row["tc_id"], nodeid, row["outcome"], round(row["duration"], 3),
+                      row["wait_seconds"], row["retries"]) for nodeid, row in self._pending.items()],
+                )
+        finally:
+            db.close()
+        self._pending.clear()
+
+    def _recent(self):
+        """tc_id -> (nodeid, durations of its latest `window` non-skipped runs)"""
+        if not os.path.exists(self.path):
+            return {}
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT tc_id, nodeid, duration FROM durations WHERE backend = ? AND outcome != 'skipped' "
+                "ORDER BY run DESC", (self.backend,)
+            ).fetchall()
+        finally:
+            db.close()
+        recent = {}
+        for tc_id, nodeid, duration in rows:
+            _, durations = recent.setdefault(tc_id, (nodeid, []))
+            if len(durations) < self.window:
+                durations.append(duration)
+        return recent
+
+    def estimates(self, tests):
+        """Seconds expected for each (tc_id, nodeid): the median of its latest runs, else the median
+        over its TC family (or test file), else over every known test, else the default"""
+        known = {tc_id: (nodeid, statistics.median(durations)) for tc_id, (nodeid, durations) in self._recent().items()}
+        families = {}
+        for tc_id, (nodeid, seconds) in known.items():
+            families.setdefault(_family(tc_id, nodeid), []).append(seconds)
+        overall = statistics.median(s for _, s in known.values()) if known else self.default
+        estimates = {}
+        for tc_id, nodeid in tests:
+            if tc_id in known:
+                estimates[tc_id, nodeid] = known[tc_id][1]
+            elif _family(tc_id, nodeid) in families:
+                estimates[tc_id, nodeid] = statistics.median(families[_family(tc_id, nodeid)])
+            else:
+                estimates[tc_id, nodeid] = overall
+        return estimates
+
+
+def lpt_shards(units, shards: int):
+    """Longest-processing-time-first: hand each (seconds, unit), longest first, to the least-loaded
+    shard. Returns [(seconds, [unit, ...])] per shard."""
+    plan = [(0.0, index, []) for index in range(shards)]
+    heapq.heapify(plan)
+    for seconds, unit in sorted(units, key=lambda u: u[0], reverse=True):
+        load, index, members = heapq.heappop(plan)
+        members.append(unit)
+        heapq.heappush(plan, (load + seconds, index, members))
+    return [(load, members) for load, _, members in sorted(plan, key=lambda p: p[1])]
+
+
+duration_history = DurationHistory()
@@ -0,0 +1,233 @@
+import csv
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from utils.assets import asset_path, load_assets
+from utils.geometry import iter_features
+
+NODE_CAPACITY = 8
+HIERARCHY_LEVELS = ("state", "district", "city")
+_POINT_BLOCK = 1 << 21   # ring edges x points evaluated per numpy step
+
+
+def normalize(name) -> str:
+    """'Andhra Pradesh', 'AndhraPradesh' and 'ANDHRA_PRADESH' all index the same"""
+    return re.sub(r"[^0-9a-z]", "", str(name).lower())
+
+
+@dataclass
+class GeofenceEntry:
+    """One feature of one geofence file, with the metadata used to match hierarchy rows"""
+
+    path: str
+    feature: int
+    level: int            # 1 = state, 2 = district, ... (from NAME_<n>; 0 when unknown)
+    name: str             # the feature's own name at its level
+    codes: tuple          # GID_<n> / HASC_<n> / ISO_<n> codes
+    bbox: tuple           # (min lon, min lat, max lon, max lat)
+    polygons: list        # [[outer ring, *holes], ...] as (N, 2) arrays
+
+    def contains(self, points) -> np.ndarray:
+        """Even-odd test of (P, 2) lon/lat points against every polygon; holes are excluded"""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        inside = np.zeros(len(points), dtype=bool)
+        in_box = ((points[:, 0] >= self.bbox[0]) & (points[:, 0] <= self.bbox[2])
+                  & (points[:, 1] >= self.bbox[1]) & (points[:, 1] <= self.bbox[3]))
+        if not in_box.any():
+            return inside
+        candidates = points[in_box]
+        hit = np.zeros(len(candidates), dtype=bool)
+        for polygon in self.polygons:
+            hit |= _in_ring(polygon[0], candidates) & ~np.any(
+                [_in_ring(hole, candidates) for hole in polygon[1:]] or [np.zeros(len(candidates), bool)], axis=0)
+        inside[in_box] = hit
+        return inside
+
+    def representative_point(self):
+        """A point of the largest outer ring: its vertex mean when that falls inside, else a vertex"""
+        ring = max((polygon[0] for polygon in self.polygons), key=len)
+        mean = ring[:-1].mean(axis=0) if len(ring) > 1 else ring[0]
+        return mean if self.contains(mean)[0] else ring[0]
+
+
+def _in_ring(ring, points) -> np.ndarray:
+    x1, y1 = ring[:-1, 0][:, None], ring[:-1, 1][:, None]
+    x2, y2 = ring[1:, 0][:, None], ring[1:, 1][:, None]
+    result = np.empty(len(points), dtype=bool)
+    step = max(1, _POINT_BLOCK // max(len(ring), 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for start in range(0, len(points), step):
+            px, py = points[start:start + step, 0], points[start:start + step, 1]
+            crosses = (y1 > py) != (y2 > py)
+            x_at = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+            result[start:start + step] = np.count_nonzero(crosses & (px < x_at), axis=0) % 2 == 1
+    return result
+
+
+def _entry(path, index, feature) -> GeofenceEntry:
+    properties = feature.properties
+    levels = [int(m.group(1)) for key in properties if (m := re.fullmatch(r"NAME_(\d+)", key))]
+    level = max(levels, default=0)
+    name = (properties.get(f"NAME_{level}") if level else None) or properties.get("STNAME") or feature.name
+    if not level and "STNAME" in properties:
+        level = 1
+    codes = tuple(str(value) for key, value in properties.items()
+                  if re.fullmatch(r"(GID|HASC|ISO)_%d" % level, key) and value not in ("", "NA", None))
+    rings = [polygon[0] for polygon in feature.polygons if len(polygon) and len(polygon[0])]
+    points = np.concatenate(rings) if rings else np.zeros((1, 2))
+    bbox = (*map(float, points.min(axis=0)), *map(float, points.max(axis=0)))
+    return GeofenceEntry(path, index, level, str(name or ""), codes, bbox, feature.polygons)
+
+
+class STRTree:
+    """Sort-Tile-Recursive packed R-tree over (n, 4) boxes, built bottom-up in one pass"""
+
+    def __init__(self, boxes, capacity: int = NODE_CAPACITY):
+        self.capacity = capacity
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        self.boxes = boxes
+        self.levels = []   # bottom-up: (node boxes, [child index arrays]); level 0 children index items
+        ids = np.arange(len(boxes))
+        level_boxes = boxes
+        while True:
+            groups = self._pack(level_boxes, ids)
+            node_boxes = np.array([
+                [level_boxes[g, 0].min(), level_boxes[g, 1].min(), level_boxes[g, 2].max(), level_boxes[g, 3].max()]
+                for g in groups]).reshape(-1, 4)
+            self.levels.append((node_boxes, groups))
+            if len(groups) <= 1:
+                break
+            level_boxes, ids = node_boxes, np.arange(len(node_boxes))
+
+    def _pack(self, boxes, ids):
+        if not len(ids):
+            return []
+        leaves = math.ceil(len(ids) / self.capacity)
+        slab_size = math.ceil(math.sqrt(leaves)) * self.capacity
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        by_x = ids[np.argsort(centers[ids, 0], kind="stable")]
+        groups = []
+        for start in range(0, len(by_x), slab_size):
+            slab = by_x[start:start + slab_size]
+            slab = slab[np.argsort(centers[slab, 1], kind="stable")]
+            groups.extend(slab[i:i + self.capacity] for i in range(0, len(slab), self.capacity))
+        return groups
+
+    def query(self, box) -> np.ndarray:
+        """Indices of the items whose box intersects box = (min x, min y, max x, max y)"""
+        if not self.levels or not len(self.levels[-1][1]):
+            return np.empty(0, dtype=int)
+        x0, y0, x1, y1 = box
+        nodes = np.arange(len(self.levels[-1][0]))
+        for node_boxes, groups in reversed(self.levels):
+            b = node_boxes[nodes]
+            nodes = nodes[(b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1) & (b[:, 3] >= y0)]
+            if not len(nodes):
+                return np.empty(0, dtype=int)
+            nodes = np.concatenate([groups[n] for n in nodes])
+        b = self.boxes[nodes]
+        return nodes[(b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1) & (b[:, 3] >= y0)]
+
+
+class GeofenceIndex:
+    """Every geofence feature under uploads/ (or the given files), indexed by name, code and bbox"""
+
+    def __init__(self, paths=None):
+        if paths is None:
+            paths = [a.path for a in load_assets() if a.name.lower().endswith((".kml", ".geojson"))]
+        self.entries = [_entry(path, i, feature)
+                        for path in map(asset_path, paths) for i, feature in enumerate(iter_features(path))]
+        self.by_key = {}
+        for entry in self.entries:
+            for key in {normalize(entry.name), *map(normalize, entry.codes)} - {""}:
+                self.by_key.setdefault(key, []).append(entry)
+        self.tree = STRTree([entry.bbox for entry in self.entries])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, name: str, level: int = None):
+        """Entries whose own name or code is name; those at level first, then the smallest"""
+        matches = self.by_key.get(normalize(name), [])
+        return sorted(matches, key=lambda e: (level is not None and e.level != level,
+                                              (e.bbox[2] - e.bbox[0]) * (e.bbox[3] - e.bbox[1])))
+
+    def file_for(self, name: str, level: int = None):
+        matches = self.lookup(name, level)
+        return matches[0].path if matches else None
+
+    def locate(self, points):
+        """For each (lon, lat) point, the entries containing it (bbox pruned through the STR tree)"""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        found = [[] for _ in range(len(points))]
+        if not len(points) or not self.entries:
+            return found
+        box = (*points.min(axis=0), *points.max(axis=0))
+        for item in self.tree.query(box):
+            entry = self.entries[item]
+            for p in np.flatnonzero(entry.contains(points)):
+                found[p].append(entry)
+        return found
+
+    def check_nesting(self, pairs):
+        """(child name, parent name) pairs whose geofences are both indexed but the child's
+        representative point falls outside the parent, as [(child, parent, child file, parent file)]"""
+        by_parent = {}
+        for child, parent in pairs:
+            child_entries, parent_entries = self.lookup(child), self.lookup(parent)
+            if child_entries and parent_entries and child_entries[0] is not parent_entries[0]:
+                by_parent.setdefault(id(parent_entries[0]), (parent_entries[0], []))[1].append(
+                    (child, parent, child_entries[0]))
+        problems = []
+        for parent_entry, children in by_parent.values():
+            points = np.array([entry.representative_point() for _, _, entry in children])
+            inside = parent_entry.contains(points)
+            problems.extend((child, parent, entry.path, parent_entry.path)
+                            for (child, parent, entry), ok in zip(children, inside) if not ok)
+        return problems
+
+    def assign(self, files: dict, default: dict = None) -> dict:
+        """{level: {row name: geofence file}} for the state/district/city CSVs in files: a row's own
+        geofence when one is indexed, otherwise its nearest ancestor's, otherwise default[level]"""
+        default = default or {}
+        levels = [level for level in HIERARCHY_LEVELS if level in files]
+        parents, depth = {}, {}
+        for level, name, parent in hierarchy_rows(files):
+            parents.setdefault(name, parent)
+            depth.setdefault(name, levels.index(level) + 1)
+
+        resolved = {}
+
+        def resolve(name, seen=()):
+            if name not in resolved:
+                own = self.file_for(name, depth.get(name))
+                if own is None and name in parents and name not in seen:
+                    own = resolve(parents[name], seen + (name,))
+                resolved[name] = own
+            return resolved[name]
+
+        assignment = {level: {} for level in levels}
+        for name, n in depth.items():
+            level = levels[n - 1]
+            assignment[level][name] = resolve(name) or default.get(level)
+        return assignment
+
+
+def hierarchy_rows(files: dict):
+    """(level, name, parent name) for every row of the state/district/city CSVs in files"""
+    for level in HIERARCHY_LEVELS:
+        if level not in files:
+            continue
+        with open(asset_path(files[level]), newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                yield level, (row.get("Name") or "").strip(), (row.get("ParentName") or "").strip()
+
+
+@lru_cache(maxsize=1)
+def load_geofence_index() -> GeofenceIndex:
+    """The uploads/ geofence index, built once per process"""
+    return GeofenceIndex()
@@ -0,0 +1,388 @@
+import json
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from config import GEOFENCE_DIR
+from utils.assets import asset_path
+
+KML_NS = "http://www.opengis.net/kml/2.2"
+_KML_INTS = ("int", "uint", "short", "ushort")
+
+
+@dataclass
+class Feature:
+    """One GeoJSON feature / KML placemark: polygons as lists of (N, 2) lon/lat rings, outer ring first"""
+
+    properties: dict = field(default_factory=dict)
+    polygons: list = field(default_factory=list)
+    name: str = ""
+    id: object = None
+
+
+@dataclass
+class GeoFence:
+    features: list = field(default_factory=list)
+    source: str = ""
+
+    @property
+    def rings(self):
+        return [ring for feature in self.features for polygon in feature.polygons for ring in polygon]
+
+    def stats(self) -> dict:
+        rings = self.rings
+        points = np.concatenate(rings) if rings else np.empty((0, 2))
+        bbox = tuple(float(v) for v in np.concatenate([points.min(axis=0), points.max(axis=0)])) if len(points) else None
+        return {
+            "features": len(self.features),
+            "polygons": sum(len(f.polygons) for f in self.features),
+            "rings": len(rings),
+            "vertices": int(sum(len(r) for r in rings)),
+            "bbox": bbox,   # (min lon, min lat, max lon, max lat)
+        }
+
+
+# ----------------- Parsing -----------------
+GEOFENCE_FORMATS = {"kml": ".kml", "geojson": ".geojson"}
+
+
+def geofence_format(path: str) -> str:
+    return "kml" if path.lower().endswith(".kml") else "geojson"
+
+
+def load_geofence(path: str) -> GeoFence:
+    """Parse a .geojson/.json or .kml geofence (an uploads/ asset name or a path)"""
+    path = asset_path(path)
+    return GeoFence(list(iter_features(path)), path)
+
+
+def iter_features(path: str):
+    """Stream the features of a .kml or .geojson file one at a time"""
+    return iter_kml_features(path) if geofence_format(path) == "kml" else iter_geojson_features(path)
+
+
+def _ring(coords):
+    return np.asarray(coords, dtype=float)[:, :2]
+
+
+def _geojson_feature(feature):
+    geometry = feature.get("geometry") if feature.get("type") == "Feature" else feature
+    geometry = geometry or {}
+    if geometry.get("type") == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        polygons = []
+    properties = dict(feature.get("properties") or {})
+    return Feature(properties, [[_ring(r) for r in polygon] for polygon in polygons],
+                   str(properties.get("name", "")), feature.get("id"))
+
+
+class _JsonStream:
+    """Just enough of an incremental JSON reader to walk a FeatureCollection: the buffer only
+    ever holds the value being decoded plus one read chunk"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in GeoJSON stream, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number cut at the chunk boundary decodes "successfully"; make sure it ended
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_geojson_features(path: str, chunk_size: int = 1 << 16):
+    """Yield one Feature at a time from a FeatureCollection (or a bare Feature/geometry);
+    only the "features" array is streamed, other top-level members are decoded and dropped"""
+    with open(path, encoding="utf-8-sig") as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("{")
+        members = {}
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key == "features" and stream.peek() == "[":
+                stream.expect("[")
+                while stream.peek() != "]":
+                    yield _geojson_feature(stream.value())
+                    if stream.peek() == ",":
+                        stream.expect(",")
+                stream.expect("]")
+                members["type"] = members.get("type", "FeatureCollection")
+            else:
+                members[key] = stream.value()
+            if stream.peek() != "}":
+                stream.expect(",")
+        if members.get("type") != "FeatureCollection":
+            yield _geojson_feature(members)
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _kml_ring(element):
+    text = next((e.text for e in element.iter() if _local(e.tag) == "coordinates"), "") or ""
+    return _ring([[float(v) for v in point.split(",")] for point in text.split()])
+
+
+def _kml_value(text, kml_type: str):
+    """A SimpleData value as the Python type its SimpleField declares (text when it does not parse)"""
+    text = (text or "").strip()
+    try:
+        if kml_type in _KML_INTS:
+            return int(text)
+        if kml_type in ("float", "double"):
+            return float(text)
+    except ValueError:
+        return text
+    if kml_type == "bool":
+        return text.lower() in ("1", "true")
+    return text
+
+
+def iter_kml_features(path: str):
+    """Yield one Feature per Placemark and drop it from the tree, so memory stays at one placemark.
+    Typed Schema fields come back as int/float/bool; Data values and Placemark ids stay text."""
+    parents, schemas = [], {}
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        if _local(element.tag) == "Schema":
+            schemas["#" + (element.get("id") or "")] = {
+                field.get("name"): field.get("type", "string") for field in element if _local(field.tag) == "SimpleField"}
+            continue
+        if _local(element.tag) != "Placemark":
+            continue
+        properties, name, polygons, types = {}, "", [], {}
+        for child in element.iter():
+            tag = _local(child.tag)
+            if tag == "name" and not name:
+                name = (child.text or "").strip()
+            elif tag == "SchemaData":
+                types = schemas.get(child.get("schemaUrl"), {})
+                properties.update(dict.fromkeys(types))   # fields without SimpleData were null
+            elif tag == "SimpleData":
+                properties[child.get("name")] = _kml_value(child.text, types.get(child.get("name"), "string"))
+            elif tag == "Data":
+                value = next((v.text for v in child if _local(v.tag) == "value"), None)
+                properties[child.get("name")] = (value or "").strip()
+            elif tag == "Polygon":
+                rings = []
+                for boundary in child:
+                    if _local(boundary.tag) in ("outerBoundaryIs", "innerBoundaryIs"):
+                        ring = _kml_ring(boundary)
+                        if _local(boundary.tag) == "outerBoundaryIs":
+                            rings.insert(0, ring)
+                        else:
+                            rings.append(ring)
+                polygons.append(rings)
+        yield Feature(properties, polygons, name, element.get("id"))
+        if parents:
+            parents[-1].remove(element)
+
+
+# ----------------- Simplification -----------------
+def simplify_ring(ring: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker with the per-segment distance scan vectorized; closed rings stay closed
+    and never drop below a triangle"""
+    if tolerance <= 0 or len(ring) <= 4:
+        return ring
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = ring[start], ring[end]
+        inner = ring[start + 1:end]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:   # closed ring: first and last point coincide, measure from the point
+            distances = np.hypot(*(inner - a).T)
+        else:
+            distances = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    simplified = ring[keep]
+    return simplified if len(simplified) >= 4 else ring
+
+
+def simplify(geofence: GeoFence, tolerance: float) -> GeoFence:
+    features = [
+        Feature(f.properties, [[simplify_ring(r, tolerance) for r in polygon] for polygon in f.polygons], f.name, f.id)
+        for f in geofence.features
+    ]
+    return GeoFence(features, geofence.source)
+
+
+# ----------------- Writing -----------------
+def _coords(ring):
+    return [[round(float(x), 7), round(float(y), 7)] for x, y in ring]
+
+
+def write_geojson(features, path: str):
+    """Write features (any iterable, consumed once) as a FeatureCollection, one feature per line"""
+    with open(path, "w", encoding="utf-8") as out:
+        out.write('{"type": "FeatureCollection", "features": [\n')
+        for i, f in enumerate(features):
+            polygons = [[_coords(r) for r in polygon] for polygon in f.polygons]
+            geometry = ({"type": "Polygon", "coordinates": polygons[0]} if len(polygons) == 1
+                        else {"type": "MultiPolygon", "coordinates": polygons})
+            properties = dict(f.properties)
+            if f.name:
+                properties.setdefault("name", f.name)
+            feature = {"type": "Feature", "properties": properties, "geometry": geometry}
+            if f.id is not None:
+                feature["id"] = f.id
+            out.write((",\n" if i else "") + json.dumps(feature))
+        out.write("\n]}\n")
+
+
+def _kml_type(value) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    return "double" if isinstance(value, float) else "string"
+
+
+def _attr(value) -> str:
+    return escape(str(value), {'"': "&quot;"})
+
+
+def write_kml(features, path: str):
+    """Write features (any iterable, consumed once) as KML placemarks, properties as typed
+    SchemaData. A Schema is written the first time a set of property names and types shows up,
+    so ints, floats and bools read back as such; nulls are left out of the SchemaData. Placemark
+    ids are XML attributes, so numeric feature ids read back as strings."""
+    schemas = {}   # ((name, type), ...) -> schema id
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(f'<kml xmlns="{KML_NS}"><Document>\n')
+        for f in features:
+            fields = tuple((str(key), _kml_type(value)) for key, value in f.properties.items())
+            if fields and fields not in schemas:
+                schemas[fields] = f"schema{len(schemas)}"
+                out.write(f'<Schema name="{schemas[fields]}" id="{schemas[fields]}">'
+                          + "".join(f'<SimpleField name="{_attr(key)}" type="{kml_type}"/>' for key, kml_type in fields)
+                          + "</Schema>\n")
+            out.write(f'<Placemark id="{_attr(f.id)}">\n' if f.id is not None else "<Placemark>\n")
+            if f.name:
+                out.write(f"<name>{escape(f.name)}</name>\n")
+            if fields:
+                out.write(f'<ExtendedData><SchemaData schemaUrl="#{schemas[fields]}">')
+                for key, value in f.properties.items():
+                    if value is None:
+                        continue
+                    text = str(value).lower() if isinstance(value, bool) else str(value)
+                    out.write(f'<SimpleData name="{_attr(key)}">{escape(text)}</SimpleData>')
+                out.write("</SchemaData></ExtendedData>\n")
+            out.write("<MultiGeometry>\n")
+            for polygon in f.polygons:
+                out.write("<Polygon>")
+                for i, ring in enumerate(polygon):
+                    boundary = "outerBoundaryIs" if i == 0 else "innerBoundaryIs"
+                    points = "\n".join(f"{x},{y}" for x, y in _coords(ring))
+                    out.write(f"<{boundary}><LinearRing><coordinates>{points}</coordinates></LinearRing></{boundary}>")
+                out.write("</Polygon>\n")
+            out.write("</MultiGeometry>\n</Placemark>\n")
+        out.write("</Document></kml>\n")
+
+
+def write_geofence(features, path: str):
+    """Write a GeoFence or a feature iterable, in the format the extension names"""
+    features = features.features if isinstance(features, GeoFence) else features
+    (write_kml if geofence_format(path) == "kml" else write_geojson)(features, path)
+
+
+def convert(source: str, target: str) -> str:
+    """Stream a geofence from one format into the other (or the same), a feature at a time"""
+    source = asset_path(source)
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    root, ext = os.path.splitext(target)
+    tmp = f"{root}.part{ext}"   # keeps the extension that picks the writer
+    write_geofence(iter_features(source), tmp)
+    os.replace(tmp, target)
+    return target
+
+
+def format_variant(name: str, fmt: str, out_dir: str = GEOFENCE_DIR) -> str:
+    """One geofence asset in fmt ("kml" / "geojson"): the asset itself when it already is,
+    otherwise a converted copy under <out_dir>/<fmt>/ with the same stem"""
+    if fmt not in GEOFENCE_FORMATS:
+        raise ValueError(f"Unknown geofence format {fmt!r}, expected one of {tuple(GEOFENCE_FORMATS)}")
+    source = asset_path(name)
+    if geofence_format(source) == fmt:
+        return source
+    stem = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(out_dir, fmt, stem + GEOFENCE_FORMATS[fmt])
+    if not (os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source)):
+        convert(source, target)
+    return target
+
+
+def complexity_ladder(name: str, tolerances, out_dir: str = GEOFENCE_DIR):
+    """Simplified copies of one geofence asset, one per tolerance (degrees), as
+    [(tolerance, path, stats)]. Each copy keeps the original file name, in a tol_<t>/ folder,
+    so the wizard rows that show the file name still match."""
+    source = load_geofence(name)
+    ladder = []
+    for tolerance in tolerances:
+        if tolerance <= 0:
+            ladder.append((0, source.source, source.stats()))
+            continue
+        path = os.path.join(out_dir, f"tol_{tolerance:g}", os.path.basename(source.source))
+        variant = simplify(source, tolerance)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_geofence(variant, path)
+        ladder.append((tolerance, path, variant.stats()))
+    return ladder
@@ -0,0 +1,109 @@
+import csv
+import os
+
+from config import GENERATED_DIR
+from utils.hierarchy_generator import _mix
+
+MINISTRY_HEADER = ("Name", "ParentName", "Institution")
+ROLES_HEADER = ("Name", "ParentName")
+OFFICERS_HEADER = ("empId", "firstName", "lastName", "mobile", "email", "address", "gender")
+
+INSTITUTIONS = ("Telangana Traffic Police", "Greater Hyderabad Municipal Corporation", "Pune Municipal Corporation",
+                "State Water Board", "Public Health Department", "Revenue Department")
+PORTFOLIOS = ("Home", "Municipal", "Finance", "Health", "Revenue", "Transport", "Education", "Water", "Housing",
+              "Agriculture", "Energy", "Tourism", "Labour", "Forest", "Industries", "Welfare")
+FIRST_NAMES = ("Rajendra", "Swati", "Anil", "Milind", "Priya", "Suresh", "Kavita", "Ramesh", "Anjali", "Vikram",
+               "Meena", "Arjun", "Lakshmi", "Sanjay", "Deepa", "Harish")
+LAST_NAMES = ("Bhosale", "Wadke", "Muley", "Sabnis", "Reddy", "Patil", "Sharma", "Naidu", "Kulkarni", "Rao",
+              "Deshmukh", "Iyer", "Joshi", "Pawar", "Menon", "Gupta")
+_MOBILE_SPAN = 10 ** 9
+_MOBILE_STEP = 387_420_489   # coprime with 10**9, so index -> mobile is a bijection
+
+
+class GovernanceGenerator:
+    """Seeded ministry tree, role tree and officer roster in the governanceV5 upload formats.
+
+    Row i of each file is a pure function of (seed, i); parents are found by integer division, so
+    files stream out in constant memory. Ministry, role and person names carry their index, which
+    keeps them (and every email and mobile) unique at any size.
+    """
+
+    def __init__(self, rows: int = 10, fan_out: int = 4, seed: int = 0, domain: str = "punecorporation.org"):
+        self.rows = rows
+        self.fan_out = fan_out
+        self.seed = seed
+        self.domain = domain
+
+    def _bits(self, kind: int, index: int) -> int:
+        return _mix((self.seed << 40) ^ (kind << 36) ^ index)
+
+    def parent(self, index: int):
+        """Index of a row's parent in the ministry/role trees (None for the root)"""
+        return None if index == 0 else (index - 1) // self.fan_out
+
+    def ministry(self, index: int) -> str:
+        if index == 0:
+            return "ChiefMinister"
+        return f"{PORTFOLIOS[self._bits(0, index) % len(PORTFOLIOS)]}Ministry{index}"
+
+    def role(self, index: int) -> str:
+        if index == 0:
+            return "Chief Minister"
+        return f"{PORTFOLIOS[self._bits(1, index) % len(PORTFOLIOS)]} Minister {index}"
+
+    def officer(self, index: int):
+        """(empId, firstName, lastName, mobile, email, address, gender)"""
+        bits = self._bits(2, index)
+        first = FIRST_NAMES[bits % len(FIRST_NAMES)]
+        last = f"{LAST_NAMES[(bits >> 8) % len(LAST_NAMES)]}{index + 1}"
+        mobile = f"9{(index * _MOBILE_STEP + self.seed) % _MOBILE_SPAN:09d}"
+        email = f"{first.lower()}.{last.lower()}@{self.domain}"
+        gender = "Female" if first in ("Swati", "Priya", "Kavita", "Anjali", "Meena", "Lakshmi", "Deepa") else "Male"
+        return f"EMP_{index + 1:06d}", first, last, mobile, email, "Pune,PMC", gender
+
+    def person(self, index: int) -> str:
+        """The name the mapping dropdown shows for an officer"""
+        _, first, last, *_ = self.officer(index)
+        return f"{first} {last}"
+
+    def ministry_rows(self):
+        for index in range(self.rows):
+            parent = self.parent(index)
+            bits = self._bits(3, index)
+            institutions = {INSTITUTIONS[bits % len(INSTITUTIONS)], INSTITUTIONS[(bits >> 8) % len(INSTITUTIONS)]}
+            yield self.ministry(index), "" if parent is None else self.ministry(parent), ",".join(sorted(institutions))
+
+    def role_rows(self):
+        for index in range(self.rows):
+            parent = self.parent(index)
+            yield self.role(index), "" if parent is None else self.role(parent)
+
+    def officer_rows(self):
+        return (self.officer(index) for index in range(self.rows))
+
+    def assignments(self, count: int = None) -> str:
+        """RolesAssignments string "Role|Person;..." pairing role i with officer i"""
+        count = self.rows if count is None else min(count, self.rows)
+        return ";".join(f"{self.role(i)}|{self.person(i)}" for i in range(count))
+
+    def write(self, out_dir: str = None):
+        """Stream ministry, roles and officers CSVs to out_dir; return {template: path}.
+        An existing complete set for the same parameters is reused."""
+        out_dir = out_dir or os.path.join(GENERATED_DIR, f"governance_s{self.seed}_{self.rows}x{self.fan_out}")
+        files = {
+            "ministry": (MINISTRY_HEADER, self.ministry_rows),
+            "roles": (ROLES_HEADER, self.role_rows),
+            "officers": (OFFICERS_HEADER, self.officer_rows),
+        }
+        paths = {kind: os.path.join(out_dir, f"{kind}.csv") for kind in files}
+        if all(os.path.exists(p) for p in paths.values()):
+            return paths
+        os.makedirs(out_dir, exist_ok=True)
+        for kind, (header, rows) in files.items():
+            tmp = paths[kind] + ".part"
+            with open(tmp, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows())
+            os.replace(tmp, paths[kind])
+        return paths
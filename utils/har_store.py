@@ -0,0 +1,72 @@
+import json
+import os
+import time
+
+from config import BASE_URL, HAR_DIR, HAR_MAX_AGE
+from utils.tc_data import tc_id_for_item
+
+HAR_MODES = ("off", "record", "replay", "refresh")
+
+
+class HarStore:
+    """Per-TC-ID HAR files: record once against the real app, replay with route_from_har"""
+
+    def __init__(self, mode: str = "off", har_dir: str = HAR_DIR, max_age: int = HAR_MAX_AGE):
+        if mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode {mode!r}, expected one of {HAR_MODES}")
+        self.mode = mode
+        self.har_dir = har_dir
+        self.max_age = max_age
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    def tc_id(self, item) -> str:
+        return tc_id_for_item(item)
+
+    def har_path(self, tc_id: str) -> str:
+        return os.path.join(self.har_dir, f"{tc_id}.har")
+
+    def meta_path(self, tc_id: str) -> str:
+        return os.path.join(self.har_dir, f"{tc_id}.meta.json")
+
+    def is_fresh(self, tc_id: str) -> bool:
+        """True if a complete recording exists for this BASE_URL and is younger than max_age"""
+        try:
+            with open(self.meta_path(tc_id), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if meta.get("base_url") != BASE_URL or not os.path.exists(self.har_path(tc_id)):
+            return False
+        return time.time() - meta.get("recorded_at", 0) <= self.max_age
+
+    def action(self, tc_id: str) -> str:
+        """'record', 'replay' or 'live' for one test under the current mode"""
+        if self.mode == "record":
+            return "record"
+        if self.is_fresh(tc_id):
+            return "replay"
+        return "record" if self.mode == "refresh" else "live"
+
+    def attach(self, context, tc_id: str, action: str):
+        """Install route_from_har on the context for a record or replay pass"""
+        url = BASE_URL.rstrip("/") + "/**"
+        if action == "record":
+            os.makedirs(self.har_dir, exist_ok=True)
+            context.route_from_har(self.har_path(tc_id), url=url, update=True, update_content="embed")
+        elif action == "replay":
+            context.route_from_har(self.har_path(tc_id), url=url, not_found="fallback")
+
+    def mark_recorded(self, tc_id: str, nodeid: str):
+        # HAR itself is flushed when the context closes; the meta marks the recording usable
+        with open(self.meta_path(tc_id), "w", encoding="utf-8") as f:
+            json.dump({"base_url": BASE_URL, "recorded_at": time.time(), "nodeid": nodeid}, f)
+
+    def mark_stale(self, tc_id: str):
+        """Forget a recording so the next 'refresh' run records it again"""
+        try:
+            os.remove(self.meta_path(tc_id))
+        except FileNotFoundError:
+            pass
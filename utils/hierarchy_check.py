@@ -0,0 +1,114 @@
+import csv
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from utils.assets import asset_path
+
+MAX_LISTED = 5  # examples listed per problem kind; the counts are always exact
+
+
+@dataclass
+class HierarchyReport:
+    """Problems found across one set of hierarchy CSVs; empty lists mean the set is uploadable"""
+
+    rows: dict = field(default_factory=dict)              # level -> row count
+    missing_levels: list = field(default_factory=list)
+    orphans: list = field(default_factory=list)           # (level, name, parent)
+    duplicate_names: list = field(default_factory=list)   # (level, name)
+    duplicate_abbrs: list = field(default_factory=list)   # (level, abbr, first name, second name)
+    cycles: list = field(default_factory=list)            # [name, parent, ..., name]
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing_levels or self.orphans or self.duplicate_names
+                    or self.duplicate_abbrs or self.cycles)
+
+    def errors(self):
+        problems = []
+        if self.missing_levels:
+            problems.append(f"no file for level(s) {', '.join(self.missing_levels)}")
+        for label, items, fmt in (
+            ("orphan", self.orphans, lambda o: f"{o[0]} {o[1]!r} -> missing parent {o[2]!r}"),
+            ("duplicate name", self.duplicate_names, lambda d: f"{d[0]} {d[1]!r}"),
+            ("duplicate Abbr", self.duplicate_abbrs, lambda d: f"{d[0]} {d[1]!r} ({d[2]!r}, {d[3]!r})"),
+            ("cycle", self.cycles, lambda c: " -> ".join(c)),
+        ):
+            if items:
+                listed = "; ".join(fmt(item) for item in items[:MAX_LISTED])
+                more = f" (+{len(items) - MAX_LISTED} more)" if len(items) > MAX_LISTED else ""
+                problems.append(f"{len(items)} {label}(s): {listed}{more}")
+        return problems
+
+
+def _levels(definition_file):
+    """Level names below the country, in order, from the ProblemBolo_hierarchy.csv 'Name' column"""
+    with open(definition_file, newline="", encoding="utf-8-sig") as f:
+        return [row["Name"].strip().lower() for row in csv.DictReader(f) if row.get("Name", "").strip()]
+
+
+def check_hierarchy(files: dict) -> HierarchyReport:
+    """Join {'hierarchy': ..., 'state': ..., 'district': ..., 'city': ...} CSVs and report orphans,
+    duplicate names/Abbr codes per level and parent cycles"""
+    paths = {step: asset_path(path) for step, path in files.items()}
+    signature = tuple(sorted((step, path, os.stat(path).st_mtime_ns, os.stat(path).st_size)
+                             for step, path in paths.items()))
+    return _check(signature)
+
+
+@lru_cache(maxsize=32)
+def _check(signature) -> HierarchyReport:
+    paths = {step: path for step, path, _, _ in signature}
+    report = HierarchyReport()
+    levels = _levels(paths["hierarchy"]) if "hierarchy" in paths else [s for s in ("state", "district", "city") if s in paths]
+    report.missing_levels = [level for level in levels if level not in paths]
+
+    parents = {}        # name -> parent name, over every level (for the cycle walk)
+    above = None        # name index of the previous level
+    for level in levels:
+        if level not in paths:
+            above = None
+            continue
+        names, abbrs, count = set(), {}, 0
+        with open(paths[level], newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = [h.strip() for h in next(reader, [])]
+            columns = [header.index(c) if c in header else None for c in ("Name", "ParentName", "Abbr")]
+            for row in reader:
+                if not any(cell.strip() for cell in row):
+                    continue   # blank line
+                count += 1
+                name, parent, abbr = (row[i].strip() if i is not None and i < len(row) else "" for i in columns)
+                if name in names:
+                    report.duplicate_names.append((level, name))
+                names.add(name)
+                if abbr:
+                    first = abbrs.setdefault(abbr, name)
+                    if first != name:
+                        report.duplicate_abbrs.append((level, abbr, first, name))
+                # the top level hangs off the country, which is not in any file
+                if above is not None and parent not in above:
+                    report.orphans.append((level, name, parent))
+                parents.setdefault(name, parent)
+        report.rows[level] = count
+        above = names
+
+    report.cycles = _cycles(parents)
+    return report
+
+
+def _cycles(parents):
+    """Every parent chain that returns to one of its own names, each reported once"""
+    done, cycles = set(), []
+    for start in parents:
+        path, on_path = [], {}
+        node = start
+        while node in parents and node not in done:
+            if node in on_path:
+                cycles.append(path[on_path[node]:] + [node])
+                break
+            on_path[node] = len(path)
+            path.append(node)
+            node = parents[node]
+        done.update(path)
+    return cycles
@@ -0,0 +1,98 @@
+import csv
+import math
+import os
+
+from config import GENERATED_DIR
+
+HEADER = ("Name", "ParentName", "Abbr")
+LEVELS = ("state", "district", "city")
+_SYLLABLES = ("ka", "ra", "na", "pur", "gar", "ban", "lo", "vi", "ja", "del", "man", "tu", "sha", "go", "ri")
+
+
+class HierarchyGenerator:
+    """Seeded state/district/city rows in the Name,ParentName,Abbr upload format.
+
+    Every name is a pure function of (seed, level, index) and parents are found by integer
+    division, so rows stream out in constant memory and always reference an existing parent.
+    """
+
+    def __init__(self, country: str = "India", states: int = 10, districts_per_state: int = 10,
+                 cities_per_district: int = 10, seed: int = 0):
+        self.country = country
+        self.seed = seed
+        self.counts = {
+            "state": states,
+            "district": states * districts_per_state,
+            "city": states * districts_per_state * cities_per_district,
+        }
+        self.fan_out = {"district": districts_per_state, "city": cities_per_district}
+
+    @classmethod
+    def for_rows(cls, total_rows: int, states: int = 36, seed: int = 0, country: str = "India"):
+        """Pick an even district/city fan-out so the three files hold about total_rows rows"""
+        # states * (1 + f + f^2) = total_rows
+        per_state = max(total_rows / states - 1, 0)
+        fan_out = max(1, round((-1 + math.sqrt(1 + 4 * per_state)) / 2))
+        return cls(country, states, fan_out, fan_out, seed)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.counts.values())
+
+    def name(self, level: str, index: int) -> str:
+        if level == "country":
+            return self.country
+        bits = _mix((self.seed << 40) ^ (LEVELS.index(level) << 36) ^ index)
+        count = 2 + (bits & 1)
+        word = "".join(_SYLLABLES[(bits >> (4 + 8 * i)) % len(_SYLLABLES)] for i in range(count))
+        return f"{word.capitalize()}{index + 1}"   # the index suffix keeps names unique per level
+
+    def abbr(self, level: str, index: int) -> str:
+        return f"{self.name(level, index)[:2].upper()}{level[0].upper()}{index + 1}"
+
+    def parent(self, level: str, index: int):
+        """(parent level, parent index) of a row"""
+        if level == "state":
+            return "country", 0
+        parent_level = LEVELS[LEVELS.index(level) - 1]
+        return parent_level, index // self.fan_out[level]
+
+    def rows(self, level: str):
+        """Yield (Name, ParentName, Abbr) for one level, in index order"""
+        parent, parent_name = None, None
+        for index in range(self.counts[level]):
+            if self.parent(level, index) != parent:   # siblings are consecutive
+                parent = self.parent(level, index)
+                parent_name = self.name(*parent)
+            name = self.name(level, index)
+            yield name, parent_name, self.abbr(level, index)
+
+    def write(self, out_dir: str = None):
+        """Stream the hierarchy, state, district and city CSVs to out_dir; return {step: path}.
+        An existing complete set for the same parameters is reused."""
+        out_dir = out_dir or os.path.join(
+            GENERATED_DIR,
+            f"{self.country}_s{self.seed}_{self.counts['state']}x{self.fan_out['district']}x{self.fan_out['city']}",
+        )
+        paths = {step: os.path.join(out_dir, f"{step}.csv") for step in ("hierarchy",) + LEVELS}
+        if all(os.path.exists(p) for p in paths.values()):
+            return paths
+        os.makedirs(out_dir, exist_ok=True)
+        with open(paths["hierarchy"], "w", newline="", encoding="utf-8") as f:
+            f.write("Name\nState\nDistrict\nCity\n")
+        for level in LEVELS:
+            tmp = paths[level] + ".part"
+            with open(tmp, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(HEADER)
+                writer.writerows(self.rows(level))
+            os.replace(tmp, paths[level])
+        return paths
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finaliser: cheap, well-spread bits from an integer key"""
+    x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
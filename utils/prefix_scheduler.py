@@ -0,0 +1,79 @@
+from collections import Counter
+
+# what a test does at the step it starts from, in the order tests sharing a step are run
+EFFECTS = ("read", "write", "leave")
+
+
+class PrefixScheduler:
+    """Walks one long-lived page through a page object's PREFIX_STEPS for a run of tests.
+
+    PREFIX_STEPS lists (step, open method, reopen method, parameter names) in flow order: open
+    goes from the previous step to this one, reopen from this step back to a fresh copy of it.
+    A test asks reach() for its step and says what it does there: "read" leaves it as found,
+    "write" changes it (the next test reopens only that step) and "leave" moves off it (the next
+    test rebuilds from navigate()). Without a browser every reach() rebuilds on the test's own page.
+    """
+
+    def __init__(self, browser=None, context_args: dict = None):
+        self.browser = browser
+        self.context_args = dict(context_args or {})
+        self.context = None
+        self.page = None
+        self.path = []        # [(step, params)] the shared page has walked, in order
+        self.dirty = False
+        self.stats = Counter()
+
+    def open(self):
+        """The shared page, opened on first use (or again after it was closed)"""
+        if self.page is None or self.page.is_closed():
+            self.close()
+            self.context = self.browser.new_context(**self.context_args)
+            self.page = self.context.new_page()
+        return self.page
+
+    def reach(self, page_obj, step: str, **params) -> str:
+        """Bring page_obj to step with the least replay; return how: shared, reopened, extended or built"""
+        steps = page_obj.PREFIX_STEPS
+        depth = [name for name, *_ in steps].index(step) + 1
+        target = [(name, tuple((p, params.get(p)) for p in argnames)) for name, _, _, argnames in steps[:depth]]
+        path = self.path if page_obj.page is self.page else []
+
+        how = "built"
+        if path and path == target[:len(path)]:
+            if path == target and not self.dirty:
+                how = "shared"
+            else:
+                how = "reopened" if self.dirty else "extended"
+                try:
+                    if self.dirty:
+                        self._run(page_obj, steps[len(path) - 1][2], path[-1][1])
+                    for index in range(len(path), depth):
+                        self._run(page_obj, steps[index][1], target[index][1])
+                except Exception:
+                    how = "built"   # the page was not where the path said; start over
+        if how == "built":
+            for index in range(depth):
+                self._run(page_obj, steps[index][1], target[index][1])
+
+        self.path, self.dirty = target, False
+        self.stats[how] += 1
+        return how
+
+    def _run(self, page_obj, method: str, params):
+        getattr(page_obj, method)(**dict(params))
+
+    def finish(self, effect: str, failed: bool = False):
+        """Record what the test did to the step reach() gave it"""
+        if failed or effect == "leave":
+            self.path = []
+        elif effect == "write":
+            self.dirty = True
+
+    def close(self):
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+        self.context = self.page = None
+        self.path = []
@@ -1,9 +1,120 @@
-# config.py
+import json
+import os
+import time
+import zlib
 
-BASE_URL = "http://192.168.1.8:5173/"
-BROWSER = "chromium"      # chromium | firefox | webkit
-TIMEOUT = 10000           # ms
+from config import IDENTITY_DIR, IDENTITY_EPOCH, IDENTITY_MAX_WORKERS, IDENTITY_PER_WORKER
 
-CSV_FILE = "testdata/testdata.csv"  # ✅ CSV with credentials
-ARTIFACTS_DIR = "artifacts"
-REPORTS_DIR = "reports"
+RUN_ENV = "PB_IDENTITY_RUN"
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+class IdentityBudgetExceeded(RuntimeError):
+    """A worker asked for more ids of one kind than its block in this run holds"""
+
+
+def _worker_index() -> int:
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker[2:] or 0) if worker.startswith("gw") else 0
+
+
+def _base36(n: int) -> str:
+    digits = ""
+    while True:
+        n, r = divmod(n, 36)
+        digits = _ALPHABET[r] + digits
+        if not n:
+            return digits
+
+
+class IdentityService:
+    """Unique party codes, emails, phones and emp IDs for records the tests create.
+
+    Every id is a pure function of (run, worker, kind, counter): the run number is the number of
+    seconds from IDENTITY_EPOCH to the session start, taken once by the controller (pass it back
+    as --identity-seed to replay a run's ids), each worker owns its own block of
+    IDENTITY_PER_WORKER slots per kind inside a run, and only the worker's own counter moves on
+    the hot path, so workers never share a lock or a file. Codes, emails and emp IDs embed the
+    whole slot (in decimal or base 36), so they never repeat across runs either, as long as two
+    sessions against one server do not start in the same second. Phones must stay ten digits:
+    they scramble the slot with an affine bijection mod 10**9, collision-free within a run only.
+    """
+
+    def __init__(self, run: int = None, worker: int = None, log_dir: str = IDENTITY_DIR):
+        self._run = run
+        self.worker = _worker_index() if worker is None else worker
+        self.log_dir = log_dir
+        self.counters = {}
+        self._log = None
+        if self.worker >= IDENTITY_MAX_WORKERS:
+            raise IdentityBudgetExceeded(f"Worker {self.worker} is beyond IDENTITY_MAX_WORKERS={IDENTITY_MAX_WORKERS}")
+
+    @property
+    def run(self) -> int:
+        if self._run is None:
+            self._run = int(os.environ.get(RUN_ENV, "0"))
+        return self._run
+
+    # ----------------- Runs -----------------
+    def start_run(self, seed: int = None) -> int:
+        """Controller only: take the session's run number (or seed, to replay an earlier run's ids)
+        and publish it to the workers through the environment"""
+        if seed is None:
+            # the clock rather than a counter under artifacts/, so fresh checkouts and CI runners
+            # sharing one server never hand out an earlier run's ids again
+            seed = int(time.time()) - IDENTITY_EPOCH
+        os.environ[RUN_ENV] = str(seed)
+        self._run = seed
+        self.counters.clear()
+        return seed
+
+    # ----------------- Allocation -----------------
+    def slot(self, kind: str) -> int:
+        """Next globally unique slot number for kind"""
+        counter = self.counters.get(kind, 0)
+        if counter >= IDENTITY_PER_WORKER:
+            raise IdentityBudgetExceeded(
+                f"Worker {self.worker} used all {IDENTITY_PER_WORKER} {kind} ids of run {self.run}")
+        self.counters[kind] = counter + 1
+        return (self.run * IDENTITY_MAX_WORKERS + self.worker) * IDENTITY_PER_WORKER + counter
+
+    def _fixed(self, kind: str, width: int) -> str:
+        space = 10 ** width
+        # 7**k is coprime with 10**width, so slot -> value is a bijection mod space
+        value = (self.slot(kind) * 7 ** 9 + zlib.crc32(kind.encode())) % space
+        return f"{value:0{width}d}"
+
+    def code(self, kind: str = "code") -> str:
+        """Decimal slot number: digits only, about eleven of them"""
+        return self._record(kind, str(self.slot(kind)))
+
+    def phone(self, prefix: str = "+91") -> str:
+        """Ten-digit mobile starting with 9"""
+        return self._record("phone", f"{prefix}9{self._fixed('phone', 9)}")
+
+    def token(self, kind: str) -> str:
+        return _base36(self.slot(kind))
+
+    def email(self, local: str = "user", domain: str = "example.com") -> str:
+        return self._record("email", f"{local.lower()}.{self.token('email')}@{domain}")
+
+    def emp_id(self, prefix: str = "EMP") -> str:
+        return self._record("emp_id", f"{prefix}{self.token('emp_id').upper()}")
+
+    # ----------------- Log -----------------
+    def _record(self, kind: str, value: str) -> str:
+        """One short line per id in this worker's log (run, kind, counter, value)"""
+        if self._log is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._log = open(os.path.join(self.log_dir, f"gw{self.worker}.jsonl"), "a", encoding="utf-8")
+        self._log.write(json.dumps([self.run, kind, self.counters[kind] - 1, value]) + "\n")
+        self._log.flush()
+        return value
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+identities = IdentityService()
@@ -0,0 +1,129 @@
+import json
+import os
+import re
+
+from config import RESOURCE_BLOCK_PROFILES, RESOURCE_SIZES_FILE
+
+_LEARNED_TYPES = frozenset(t for settings in RESOURCE_BLOCK_PROFILES.values() for t in settings["types"])
+
+
+def _glob(pattern: str):
+    """Playwright-style URL glob ('**' any path, '*' one segment, '{a,b}' alternatives) as a regex"""
+    alternatives = re.findall(r"\{([^}]*)\}", pattern)
+    parts = re.split(r"\{[^}]*\}", pattern)
+    regex = ""
+    for i, part in enumerate(parts):
+        regex += re.escape(part).replace(r"\*\*", ".*").replace(r"\*", "[^/]*")
+        if i < len(alternatives):
+            regex += "(?:" + "|".join(re.escape(a) for a in alternatives[i].split(",")) + ")"
+    return re.compile(regex + r"(?:[?#].*)?$", re.IGNORECASE)
+
+
+class ResourceSizes:
+    """Bytes per URL, learned from Content-Length of responses that were not blocked, so a
+    blocked request can be credited with what it would have cost"""
+
+    def __init__(self, path: str = RESOURCE_SIZES_FILE):
+        self.path = path
+        self._sizes = None
+        self._learned = {}   # sizes this process learned since its last save
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._learned)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @property
+    def sizes(self):
+        if self._sizes is None:
+            self._sizes = self._read()
+        return self._sizes
+
+    def learn(self, response):
+        if response.request.resource_type not in _LEARNED_TYPES:
+            return
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and self.sizes.get(response.url) != int(length):
+            self.sizes[response.url] = self._learned[response.url] = int(length)
+
+    def get(self, url: str) -> int:
+        return self.sizes.get(url, 0)
+
+    def save(self):
+        """Merge what this process learned into the file as it is now: every xdist worker saves
+        at its session end, and replacing the file with one worker's view would drop the others'"""
+        if not self._learned:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        merged = self._read()
+        merged.update(self._learned)
+        tmp = f"{self.path}.{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(merged, f)
+        os.replace(tmp, self.path)
+        self._sizes = merged
+        self._learned = {}
+
+
+resource_sizes = ResourceSizes()
+
+
+class ResourceBlocker:
+    """Aborts requests of the profile's resource types / URL globs on one context, except allowlisted URLs"""
+
+    def __init__(self, profile: str = "fast", types=None, patterns=None, allow=()):
+        if profile not in RESOURCE_BLOCK_PROFILES:
+            raise ValueError(f"Unknown resource block profile {profile!r}, expected one of {tuple(RESOURCE_BLOCK_PROFILES)}")
+        settings = RESOURCE_BLOCK_PROFILES[profile]
+        self.profile = profile
+        self.types = frozenset(settings["types"] if types is None else types)
+        self.patterns = [_glob(p) for p in (settings["patterns"] if patterns is None else patterns)]
+        self.allow = [_glob(p) for p in (*settings["allow"], *allow)]
+        self.blocked = 0
+        self.blocked_bytes = 0
+        self._context = None
+
+    def targets(self, url: str, resource_type: str) -> bool:
+        return resource_type in self.types or any(p.match(url) for p in self.patterns)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if url.startswith(("data:", "blob:")) or any(p.match(url) for p in self.allow):
+            return False
+        return self.targets(url, resource_type)
+
+    def _route(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked += 1
+            self.blocked_bytes += resource_sizes.get(request.url)
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def attach(self, context):
+        """Route last, so blocking runs before the stand-in backend or HAR routes see a request"""
+        self._context = context
+        context.on("response", resource_sizes.learn)   # allowlisted loads still teach their cost
+        context.route("**/*", self._route)
+
+    def detach(self):
+        if self._context is None:
+            return
+        self._context.remove_listener("response", resource_sizes.learn)
+        try:
+            self._context.unroute("**/*", self._route)
+        except Exception:
+            pass   # context already closed
+        self._context = None
+
+
+def learn_sizes(context):
+    """Listen for sizes on a context that blocks nothing, so later blocked runs can report savings"""
+    context.on("response", resource_sizes.learn)
+    return lambda: context.remove_listener("response", resource_sizes.learn)
@@ -0,0 +1,133 @@
+import glob
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from config import CSV_FILE, RESULTS_DIR
+
+
+class ResultJournal:
+    """Append-only per-worker log of TC outcomes, merged into the data files once per session"""
+
+    def __init__(self, journal_dir: str = RESULTS_DIR):
+        self.journal_dir = journal_dir
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        self._file = None
+
+    @property
+    def path(self):
+        return os.path.join(self.journal_dir, f"{self.worker}.jsonl")
+
+    def record(self, tcid: str, status: str, remarks: str, source: str = CSV_FILE, sheet: str = None):
+        """Append one outcome; the last record for a (source, sheet, TC ID) wins at merge time"""
+        if self._file is None:
+            os.makedirs(self.journal_dir, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        entry = {"ts": time.time(), "tcid": str(tcid).strip(), "status": str(status),
+                 "remarks": str(remarks), "source": source, "sheet": sheet}
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def reset(self):
+        """Drop journals left over from an earlier (possibly interrupted) session"""
+        for path in glob.glob(os.path.join(self.journal_dir, "*.jsonl")):
+            os.remove(path)
+
+    def entries(self):
+        rows = []
+        for path in glob.glob(os.path.join(self.journal_dir, "*.jsonl")):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        continue  # torn final line from a killed worker
+        rows.sort(key=lambda r: r["ts"])
+        latest = {}
+        for row in rows:
+            latest[(row["source"], row.get("sheet"), row["tcid"])] = row
+        return list(latest.values())
+
+    def merge(self):
+        """Write every journaled outcome into its CSV/XLSX source with one atomic replace per file"""
+        self.close()
+        by_target = {}
+        for row in self.entries():
+            by_target.setdefault((row["source"], row.get("sheet")), {})[row["tcid"]] = row
+        written = []
+        for (source, sheet), results in by_target.items():
+            if source.endswith(".xlsx"):
+                written.append(_merge_xlsx(source, sheet, results))
+            else:
+                written.append(_merge_csv(source, results))
+        self.reset()
+        return written
+
+
+def _apply(df, results):
+    for col in ("Status", "Remarks"):
+        if col not in df.columns:
+            df[col] = ""
+        df[col] = df[col].astype(object)
+    ids = df["TC ID"].astype(str).str.strip()
+    for tcid, row in results.items():
+        mask = ids == tcid
+        df.loc[mask, "Status"] = row["status"]
+        df.loc[mask, "Remarks"] = row["remarks"]
+    return df
+
+
+def _replace_atomically(target, write):
+    """write(tmp_path) then os.replace onto target; fall back to <name>_temp.<ext> if target is locked"""
+    directory = os.path.dirname(os.path.abspath(target))
+    root, suffix = os.path.splitext(target)
+    fd, tmp = tempfile.mkstemp(prefix=".merge_", suffix=suffix, dir=directory)
+    os.close(fd)
+    try:
+        write(tmp)
+        try:
+            os.replace(tmp, target)
+            return target
+        except PermissionError:
+            fallback = f"{root}_temp{suffix}"
+            os.replace(tmp, fallback)
+            return fallback
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _merge_csv(source, results):
+    df = _apply(pd.read_csv(source, engine="python"), results)
+    return _replace_atomically(source, lambda tmp: df.to_csv(tmp, index=False))
+
+
+def _merge_xlsx(source, sheet, results):
+    # openpyxl in place, so the other sheets and the workbook formatting survive the merge
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source)
+    worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+    header = [str(c.value).strip() if c.value is not None else "" for c in worksheet[1]]
+    for col in ("Status", "Remarks"):
+        if col not in header:
+            header.append(col)
+            worksheet.cell(row=1, column=len(header), value=col)
+    id_col, status_col, remarks_col = (header.index(c) + 1 for c in ("TC ID", "Status", "Remarks"))
+    for row in range(2, worksheet.max_row + 1):
+        result = results.get(str(worksheet.cell(row=row, column=id_col).value or "").strip())
+        if result:
+            worksheet.cell(row=row, column=status_col, value=result["status"])
+            worksheet.cell(row=row, column=remarks_col, value=result["remarks"])
+    return _replace_atomically(source, workbook.save)
+
+
+result_journal = ResultJournal()
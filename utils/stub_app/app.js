@@ -0,0 +1,816 @@
+// Stand-in SPA for the offline Problem Bolo backend (utils/stub_backend.py).
+// It only mirrors the roles, labels and selectors the page objects in pages/ rely on.
+(() => {
+  const root = document.getElementById('root');
+  const modalRoot = document.getElementById('modal-root');
+  const TOKEN_KEY = 'pb_token';
+
+  // ----------------- DOM helpers -----------------
+  function h(tag, attrs, ...children) {
+    const el = document.createElement(tag);
+    for (const [key, value] of Object.entries(attrs || {})) {
+      if (value === undefined || value === null || value === false) continue;
+      if (key.startsWith('on')) el.addEventListener(key.slice(2).toLowerCase(), value);
+      else if (key === 'class') el.className = value;
+      else el.setAttribute(key, value === true ? '' : value);
+    }
+    for (const child of children.flat()) {
+      if (child === null || child === undefined || child === false) continue;
+      el.append(child instanceof Node ? child : document.createTextNode(String(child)));
+    }
+    return el;
+  }
+
+  function icon(testId, extraClass) {
+    const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
+    svg.setAttribute('data-testid', testId);
+    svg.setAttribute('class', `MuiSvgIcon-root ${extraClass || ''}`.trim());
+    svg.setAttribute('width', '18');
+    svg.setAttribute('height', '18');
+    svg.setAttribute('aria-hidden', 'true');
+    svg.append(document.createElementNS('http://www.w3.org/2000/svg', 'circle'));
+    svg.lastChild.setAttribute('cx', '9');
+    svg.lastChild.setAttribute('cy', '9');
+    svg.lastChild.setAttribute('r', '6');
+    return svg;
+  }
+
+  const button = (label, onclick, attrs) => h('button', { type: 'button', onclick, ...(attrs || {}) }, label);
+  const iconButton = (name, onclick) => h('button', { type: 'button', 'aria-label': name, onclick }, icon(name));
+
+  function openModal(content, opts) {
+    const backdrop = h('div', { class: 'backdrop' },
+      h('div', { class: 'paper', role: 'dialog', 'aria-modal': 'true', 'aria-label': opts && opts.label }, content));
+    modalRoot.append(backdrop);
+    root.setAttribute('aria-hidden', 'true');
+    return () => {
+      backdrop.remove();
+      if (!modalRoot.children.length) root.removeAttribute('aria-hidden');
+    };
+  }
+
+  function closeAllModals() {
+    modalRoot.replaceChildren();
+    root.removeAttribute('aria-hidden');
+  }
+
+  // Single open listbox, attached to <body> like a MUI popper
+  let openListbox = null;
+  function showOptions(anchor, options, onSelect) {
+    if (openListbox) openListbox.remove();
+    const rect = anchor.getBoundingClientRect();
+    openListbox = h('div', {
+      role: 'listbox', class: 'listbox',
+      style: `position:fixed;left:${rect.left}px;top:${rect.bottom}px;z-index:10;max-height:240px;overflow:auto`,
+    }, options.map(option => h('div', {
+      role: 'option', tabindex: '-1',
+      onclick: () => { closeOptions(); onSelect(option); },
+    }, option)));
+    document.body.append(openListbox);
+  }
+
+  function closeOptions() {
+    if (openListbox) openListbox.remove();
+    openListbox = null;
+  }
+
+  // MUI-like Select rendered as div[role=combobox]
+  function combobox(label, getOptions, onSelect, attrs) {
+    const box = h('div', { role: 'combobox', tabindex: '0', 'aria-expanded': 'false', 'aria-label': label, ...(attrs || {}) }, label);
+    box.value = '';
+    box.addEventListener('click', () => showOptions(box, getOptions(), option => {
+      box.value = option;
+      box.textContent = option;
+      onSelect && onSelect(option);
+    }));
+    return box;
+  }
+
+  // MUI-like Autocomplete with a popup indicator button
+  function autocomplete(placeholder, getOptions, onSelect) {
+    const input = h('input', { type: 'text', placeholder, readonly: true });
+    const wrapper = h('div', { class: 'MuiAutocomplete-root' }, input);
+    const indicator = h('button', {
+      type: 'button', class: 'MuiAutocomplete-popupIndicator', 'aria-label': 'Open', tabindex: '-1',
+      onclick: () => showOptions(wrapper, getOptions(), option => { input.value = option; onSelect(option); }),
+    }, icon('ArrowDropDownIcon'));
+    wrapper.append(indicator);
+    return wrapper;
+  }
+
+  function download(name) {
+    const link = h('a', { href: `/api/templates/${name}`, download: `${name}_template.csv` });
+    document.body.append(link);
+    link.click();
+    link.remove();
+  }
+
+  // ----------------- API -----------------
+  async function api(method, path, body, extraHeaders) {
+    const headers = { ...(extraHeaders || {}) };
+    const token = localStorage.getItem(TOKEN_KEY);
+    if (token) headers.Authorization = `Bearer ${token}`;
+    let payload = body;
+    if (body !== undefined && !(body instanceof Blob)) {
+      headers['Content-Type'] = 'application/json';
+      payload = JSON.stringify(body);
+    }
+    const res = await fetch(path, { method, headers, body: payload });
+    const data = await res.json().catch(() => ({}));
+    if (res.status === 401 && !path.startsWith('/api/auth/')) {
+      localStorage.removeItem(TOKEN_KEY);
+      renderLanding();
+    }
+    if (!res.ok) throw Object.assign(new Error(data.message || res.statusText), { status: res.status });
+    return data;
+  }
+
+  const uploadFile = (path, file) => api('POST', path, file, { 'X-File-Name': encodeURIComponent(file.name) });
+
+  let locations = {};
+  const children = (...path) => {
+    let node = locations;
+    for (const key of path) node = (node || {})[key];
+    return Array.isArray(node) ? node : Object.keys(node || {});
+  };
+
+  // ----------------- OTP widgets -----------------
+  function otpInputs(values, onChange) {
+    const inputs = [];
+    for (let i = 0; i < 4; i++) {
+      const input = h('input', { type: 'text', maxlength: '1', 'aria-label': `OTP ${i + 1}`, size: '1' });
+      input.value = values[i] || '';
+      input.addEventListener('input', () => {
+        input.value = input.value.replace(/[^A-Za-z0-9]/g, '').slice(-1);
+        if (input.value && i < 3) inputs[i + 1].focus();
+        onChange();
+      });
+      input.addEventListener('keydown', event => {
+        if (event.key === 'Backspace' && !input.value && i > 0) {
+          event.preventDefault();
+          inputs[i - 1].focus();
+        }
+      });
+      inputs.push(input);
+    }
+    return inputs;
+  }
+
+  function countdown(seconds, onResend) {
+    const label = h('p', { class: 'MuiTypography-body1 field-link' });
+    const resend = button('Resend OTP', async () => { await onResend(); start(); }, { disabled: true });
+    let left = seconds;
+    let timer = null;
+    const tick = () => {
+      label.textContent = left > 0 ? `Resend OTP in 00:${String(left).padStart(2, '0')}` : "Didn't receive the code?";
+      resend.disabled = left > 0;
+    };
+    const start = () => {
+      clearInterval(timer);
+      left = seconds;
+      tick();
+      timer = setInterval(() => {
+        left -= 1;
+        tick();
+        if (left <= 0) clearInterval(timer);
+      }, 1000);
+    };
+    start();
+    return { label, resend };
+  }
+
+  // ----------------- Landing / login -----------------
+  function renderLanding() {
+    closeAllModals();
+    const panel = h('div', { id: 'login-panel' });
+    root.replaceChildren(
+      h('h1', {}, 'Problem Bolo'),
+      h('div', { role: 'tablist' }, h('button', {
+        type: 'button', role: 'tab', 'aria-selected': 'true', onclick: () => showLoginForm(panel),
+      }, 'Login/Signin')),
+      panel,
+    );
+    showLoginForm(panel);
+  }
+
+  function showLoginForm(panel) {
+    const email = h('input', { type: 'text', placeholder: 'Enter Email Address', 'aria-label': 'Enter Email Address' });
+    const password = h('input', { type: 'password', placeholder: 'Enter Password', 'aria-label': 'Enter Password' });
+    const toggle = h('button', {
+      type: 'button', 'aria-label': 'toggle password visibility',
+      onclick: () => { password.type = password.type === 'password' ? 'text' : 'password'; },
+    }, icon('VisibilityOffIcon'));
+    const error = h('div', { class: 'MuiAlert-message', role: 'alert', hidden: true });
+    const method = h('div');
+    const next = button('Next', () => submit(), { disabled: true });
+    let stage = 'credentials';
+    let login = null;
+
+    const sync = () => { next.disabled = !(email.value.trim() && password.value); };
+    email.addEventListener('input', sync);
+    password.addEventListener('input', sync);
+    password.addEventListener('keydown', event => { if (event.key === 'Enter') submit(); });
+
+    async function submit() {
+      if (next.disabled) return;
+      if (stage === 'method') return showLoginOtp(panel, email.value.trim(), password.value, login);
+      next.disabled = true;
+      try {
+        login = await api('POST', '/api/auth/login', { email: email.value.trim(), password: password.value });
+        error.hidden = true;
+        stage = 'method';
+        method.replaceChildren(h('label', {},
+          h('input', { type: 'radio', name: 'otp-method', checked: true }),
+          h('span', { class: 'MuiFormControlLabel-label' }, `Email: ${login.maskedEmail}`)));
+      } catch (err) {
+        error.textContent = err.message;
+        error.hidden = false;
+      }
+      sync();
+    }
+
+    panel.replaceChildren(
+      h('div', {}, email),
+      h('div', {}, password, toggle),
+      error,
+      method,
+      h('div', {}, button('Forgot Password?', () => openForgotPassword(panel))),
+      h('div', {}, next),
+    );
+  }
+
+  function showLoginOtp(panel, email, password, login) {
+    const message = h('p', { class: 'MuiTypography-body1' }, `OTP: ${login.otp}`);
+    const loginButton = button('Log-in', async () => {
+      try {
+        const session = await api('POST', '/api/auth/verify-otp', { email, otp: inputs.map(i => i.value).join('') });
+        localStorage.setItem(TOKEN_KEY, session.token);
+        renderDashboard();
+      } catch (err) {
+        message.textContent = err.message;
+      }
+    });
+    const inputs = otpInputs([], () => {});
+    const timer = countdown(login.countdown, async () => {
+      login = await api('POST', '/api/auth/login', { email, password });
+      message.textContent = `OTP: ${login.otp}`;
+    });
+    panel.replaceChildren(
+      h('span', { class: 'MuiFormControlLabel-label' }, `Email: ${login.maskedEmail}`),
+      message,
+      h('div', {}, inputs),
+      timer.label,
+      timer.resend,
+      h('div', {}, loginButton),
+    );
+  }
+
+  // ----------------- Forgot password modal -----------------
+  function openForgotPassword(panel) {
+    panel.replaceChildren();  // the login form leaves the DOM while the modal is open
+    const body = h('div');
+    let close = null;
+    const closeButton = h('button', {
+      type: 'button', 'aria-label': 'close',
+      onclick: () => { close(); showLoginForm(panel); },
+    }, icon('CloseIcon'));
+    modalRoot.replaceChildren();
+    close = openModal([closeButton, h('h2', {}, 'Forgot Password'), body], { label: 'Forgot Password' });
+    forgotEmailStep(body, {}, () => { close(); showLoginForm(panel); });
+  }
+
+  function forgotEmailStep(body, ctx, done) {
+    const mobile = h('input', { type: 'tel', placeholder: '1 (702) 123-4567', 'aria-label': 'Mobile Number' });
+    const email = h('input', { type: 'text', placeholder: 'Enter Registered Email Address', 'aria-label': 'Email Address' });
+    mobile.value = ctx.mobile || '';
+    email.value = ctx.email || '';
+    const next = button('Next', async () => {
+      Object.assign(ctx, { mobile: mobile.value.trim(), email: email.value.trim() });
+      Object.assign(ctx, await api('POST', '/api/auth/forgot-password', { mobile: ctx.mobile, email: ctx.email }));
+      forgotOtpStep(body, ctx, done);
+    });
+    const sync = () => { next.disabled = !(mobile.value.trim() || email.value.trim()); };
+    mobile.addEventListener('input', sync);
+    email.addEventListener('input', sync);
+    sync();
+    body.replaceChildren(h('div', {}, mobile), h('p', {}, 'Or'), h('div', {}, email), h('div', {}, next));
+  }
+
+  function forgotOtpStep(body, ctx, done) {
+    const next = button('Next', () => forgotPasswordStep(body, ctx, done));
+    const sync = () => { next.disabled = inputs.some(input => !input.value); };
+    const inputs = otpInputs(ctx.otp.split(''), sync);
+    const timer = countdown(ctx.countdown, async () => {
+      Object.assign(ctx, await api('POST', '/api/auth/forgot-password', { mobile: ctx.mobile, email: ctx.email }));
+      ctx.otp.split('').forEach((char, i) => { inputs[i].value = char; });
+      sync();
+    });
+    sync();
+    body.replaceChildren(
+      h('div', { class: 'field-lbl' }, `Enter OTP sent to ${ctx.maskedEmail}`),
+      h('div', {}, inputs),
+      timer.label,
+      timer.resend,
+      h('div', {}, button('Back', () => forgotEmailStep(body, ctx, done)), next),
+    );
+  }
+
+  function forgotPasswordStep(body, ctx, done) {
+    const password = h('input', { type: 'password', placeholder: 'Enter New Password' });
+    const confirm = h('input', { type: 'password', placeholder: 'Re-Enter Password' });
+    const eye = input => h('button', {
+      type: 'button', class: 'MuiIconButton-root', 'aria-label': 'toggle password visibility',
+      onclick: () => { input.type = input.type === 'password' ? 'text' : 'password'; },
+    }, icon('VisibilityIcon'));
+    const register = button('Register', async () => {
+      await api('POST', '/api/auth/reset-password', { email: ctx.email, mobile: ctx.mobile, password: password.value });
+      body.replaceChildren(h('p', {}, 'Password updated successfully'), button('Back to Home', done));
+    }, { disabled: true });
+    const sync = () => { register.disabled = !(password.value && password.value === confirm.value); };
+    password.addEventListener('input', sync);
+    confirm.addEventListener('input', sync);
+    body.replaceChildren(
+      h('p', {}, 'Enter New Password'),
+      h('div', {}, password, eye(password)),
+      h('div', {}, confirm, eye(confirm)),
+      h('div', {}, button('Back', () => forgotOtpStep(body, ctx, done)), register),
+    );
+  }
+
+  // ----------------- Dashboard -----------------
+  function header() {
+    const menu = h('div');
+    const logout = async () => {
+      await api('POST', '/api/auth/logout', {}).catch(() => {});
+      localStorage.removeItem(TOKEN_KEY);
+      renderLanding();
+    };
+    const admin = button('Admin', () => {
+      const tabs = h('div', { role: 'tablist' });
+      const content = h('div');
+      tabs.append(h('button', {
+        type: 'button', role: 'tab',
+        onclick: () => {
+          if (tabs.children.length > 1) return;
+          tabs.append(h('button', {
+            type: 'button', role: 'tab',
+            onclick: () => content.replaceChildren(button('Click here to Logout', logout)),
+          }, 'Account Settings'));
+        },
+      }, 'Settings'));
+      menu.replaceChildren(tabs, content);
+    });
+    return h('header', {}, h('strong', {}, 'Problem Bolo'), admin, menu);
+  }
+
+  function renderDashboard() {
+    closeAllModals();
+    root.replaceChildren(header(), h('main', {},
+      h('h2', {}, 'Welcome to Problem Bolo'),
+      button('Get Started', renderWorkspace)));
+  }
+
+  async function renderWorkspace() {
+    locations = await api('GET', '/api/locations');
+    const content = h('section');
+    const views = { Country: countryView, Party: partyView, Personnel: personnelView, Governance: governanceView };
+    const nav = h('nav', {}, Object.entries(views).map(([name, view]) => button(name, () => view(content))));
+    root.replaceChildren(header(), nav, content);
+    countryView(content);
+  }
+
+  // ----------------- Country -----------------
+  async function countryView(content, status) {
+    const data = await api('GET', '/api/countries' + (status ? `?status=${status}` : ''));
+    const count = key => data.counts[key] || 0;
+    const PAGE_SIZE = 10;
+    let pageIndex = 0;
+    const tbody = h('tbody');
+    const prev = iconButton('Go to previous page', () => { pageIndex -= 1; draw(); });
+    const next = iconButton('Go to next page', () => { pageIndex += 1; draw(); });
+
+    function draw() {
+      const rows = data.countries.slice(pageIndex * PAGE_SIZE, (pageIndex + 1) * PAGE_SIZE);
+      tbody.replaceChildren(...rows.map(country => h('tr', {},
+        h('td', {}, country.status), h('td', {}, country.name), h('td', {}, country.code), h('td', {}, country.created),
+        h('td', {},
+          iconButton('primaryEyeIcon', () => viewCountry(country)),
+          iconButton('primaryEditIcon', () => countryWizard(content, country))))));
+      prev.disabled = pageIndex === 0;
+      next.disabled = (pageIndex + 1) * PAGE_SIZE >= data.countries.length;
+    }
+    draw();
+
+    content.replaceChildren(
+      h('div', {},
+        button(`Active (${count('ACTIVE')})`, () => countryView(content, 'ACTIVE')),
+        button(`In-Active (${count('INACTIVE')})`, () => countryView(content, 'INACTIVE')),
+        button(`Draft (${count('DRAFT')})`, () => countryView(content, 'DRAFT')),
+        button(`Archive (${count('ARCHIVE')})`, () => countryView(content, 'ARCHIVE')),
+        button('+ Add Country', () => countryWizard(content, null))),
+      h('table', {}, h('thead', {}, h('tr', {}, ['Status', 'Name', 'Code', 'Created', 'Actions'].map(t => h('th', {}, t)))), tbody),
+      h('div', {}, prev, next),
+    );
+  }
+
+  function viewCountry(country) {
+    const actions = h('div');
+    let close = null;
+    const details = h('div', {}, h('h3', {}, `${country.name} (${country.code})`), h('p', {}, `Status: ${country.status}`));
+    actions.append(button('View', () => details.append(h('p', {}, `Created: ${country.created}`))), button('Close', () => close()));
+    close = openModal([details, actions], { label: 'Country details' });
+  }
+
+  const WIZARD_STEPS = ['Name', 'Hierarchy', 'State', 'District', 'City', 'GeoFence', 'Media', 'Summary'];
+
+  function countryWizard(listContent, existing) {
+    const editing = Boolean(existing);
+    const wizard = { country: existing, rows: {}, step: 0 };
+    if (existing) for (const [step, upload] of Object.entries(existing.uploads || {})) wizard.rows[step] = upload.rows;
+    const stepper = h('div', { class: 'stepper' });
+    const body = h('div');
+    const backBox = h('div');
+    const nextBox = h('div', { class: 'actions' });
+    const after = h('div');
+    let close = null;
+
+    const go = step => {
+      wizard.step = step;
+      stepper.replaceChildren(...WIZARD_STEPS.map((name, i) => h('span', { class: i === step ? 'active' : '' }, name)));
+      backBox.replaceChildren(step > 0 ? button('Back', () => go(step - 1)) : '');
+      after.replaceChildren();
+      [nameStep, csvStep('hierarchy'), csvStep('state'), csvStep('district'), csvStep('city'), geofenceStep, mediaStep, summaryStep][step]();
+    };
+
+    const nextButton = (onNext, enabled) => {
+      const next = button('Next', onNext, { disabled: !enabled });
+      nextBox.replaceChildren(next);
+      return next;
+    };
+
+    function nameStep() {
+      const name = h('input', { type: 'text', placeholder: 'Enter Country Name', 'aria-label': 'Enter Country Name' });
+      const code = h('input', { type: 'text', placeholder: 'Enter Country Code', 'aria-label': 'Enter Country Code' });
+      if (wizard.country) { name.value = wizard.country.name; code.value = wizard.country.code; }
+      const next = nextButton(async () => {
+        if (!wizard.country) wizard.country = await api('POST', '/api/countries', { name: name.value.trim(), code: code.value.trim() });
+        go(1);
+      }, name.value && code.value);
+      const sync = () => { next.disabled = !(name.value.trim() && code.value.trim()); };
+      name.addEventListener('input', sync);
+      code.addEventListener('input', sync);
+      body.replaceChildren(h('div', {}, h('label', {}, 'Country Name'), name, h('label', {}, 'Country Code'), code));
+    }
+
+    function csvStep(step) {
+      return () => {
+        const input = h('input', { type: 'file', id: 'csv-upload', accept: '.csv', class: 'hidden-input' });
+        const status = h('p', {}, wizard.rows[step] ? `${wizard.rows[step].length} rows uploaded` : 'No file uploaded');
+        const preview = h('table');
+        const next = nextButton(() => go(wizard.step + 1), editing || wizard.rows[step]);
+        const showPreview = rows => {
+          const PAGE_SIZE = 10;
+          preview.replaceChildren(...rows.slice(0, PAGE_SIZE).map(row => h('tr', {}, Object.values(row).map(v => h('td', {}, v)))));
+          after.replaceChildren(rows.length > PAGE_SIZE ? iconButton('Go to next page', () => {}) : '');
+        };
+        input.addEventListener('change', async () => {
+          const file = input.files[0];
+          if (!file) return;
+          status.textContent = `Uploading ${file.name}...`;
+          try {
+            const result = await uploadFile(`/api/countries/${wizard.country.id}/uploads/${step}`, file);
+            wizard.rows[step] = result.rows;
+            status.textContent = `${file.name} uploaded (${result.rows.length} rows)`;
+            showPreview(result.rows);
+            next.disabled = false;
+          } catch (err) {
+            status.textContent = err.message;
+          }
+        });
+        body.replaceChildren(
+          h('p', {}, `Download the ${step} template, fill it in and upload it.`),
+          button('Download', () => download(step)),
+          h('label', { for: 'csv-upload' }, 'Upload'),
+          input, status, preview,
+        );
+        if (wizard.rows[step]) showPreview(wizard.rows[step]);
+      };
+    }
+
+    const entities = () => {
+      const name = wizard.country.name;
+      const list = [{ name, parent: '' }];
+      for (const row of wizard.rows.state || []) list.push({ name: row.Name, parent: name });
+      for (const step of ['district', 'city']) {
+        for (const row of wizard.rows[step] || []) list.push({ name: row.Name, parent: row.ParentName });
+      }
+      return list;
+    };
+
+    function geofenceStep() {
+      const geofences = { ...(wizard.country.geofences || {}) };
+      let target = null;
+      const input = h('input', { type: 'file', accept: '.kml,.geojson,.json', class: 'hidden-input' });
+      const tbody = h('tbody');
+      const menu = h('div');
+      const drawRows = () => tbody.replaceChildren(...entities().map(entity => {
+        const fence = geofences[entity.name];
+        const actions = fence
+          ? [fence.file, button('Replace', () => { target = entity.name; }), button('Remove', () => { delete geofences[entity.name]; drawRows(); }),
+             iconButton('More options', () => menu.replaceChildren(button('View', () => previewGeofence(entity.name, fence))))]
+          : [button('Add GeoFence', () => { target = entity.name; }), button('Draw on Map', () => {})];
+        return h('tr', {}, h('td', {}, entity.name), h('td', {}, entity.parent), h('td', {}, actions));
+      }));
+      input.addEventListener('change', async () => {
+        const file = input.files[0];
+        if (!file || !target) return;
+        const result = await uploadFile(`/api/countries/${wizard.country.id}/geofences?target=${encodeURIComponent(target)}`, file);
+        geofences[target] = { file: result.file, size: result.size };
+        input.value = '';
+        drawRows();
+      });
+      drawRows();
+      nextButton(() => go(6), true);
+      body.replaceChildren(h('table', {}, tbody), menu, input);
+    }
+
+    function previewGeofence(name, fence) {
+      let closePreview = null;
+      closePreview = openModal([h('h3', {}, `${name} geofence`), h('p', {}, `${fence.file} (${fence.size} bytes)`),
+        button('Close', () => closePreview())], { label: 'GeoFence preview' });
+    }
+
+    function mediaStep() {
+      const table = h('table', { hidden: true });
+      const upload = (target, kind) => async event => {
+        const file = event.target.files[0];
+        if (!file) return;
+        await uploadFile(`/api/countries/${wizard.country.id}/media?target=${encodeURIComponent(target)}&kind=${kind}`, file);
+        event.target.closest('tr').lastChild.textContent = `${kind} uploaded`;
+      };
+      table.append(...entities().map(entity => h('tr', {},
+        h('td', {}, entity.name),
+        h('td', {}, h('input', { type: 'file', accept: 'image/*', onchange: upload(entity.name, 'image') })),
+        h('td', {}, h('input', { type: 'file', accept: 'video/mp4', onchange: upload(entity.name, 'video') })),
+        h('td', {}, ''))));
+      const expand = h('span', { onclick: () => { table.hidden = !table.hidden; } }, icon('ExpandMoreIcon', 'MuiSvgIcon-fontSizeLarge'));
+      nextButton(() => go(7), true);
+      body.replaceChildren(h('p', {}, 'Upload logos and media for every jurisdiction'), expand, table);
+    }
+
+    function summaryStep() {
+      nextBox.replaceChildren(button('Submit', async () => {
+        await api('POST', `/api/countries/${wizard.country.id}/submit`, {});
+        close();
+        countryView(listContent);
+      }));
+      body.replaceChildren(h('table', {}, ['hierarchy', 'state', 'district', 'city'].map(step =>
+        h('tr', {}, h('td', {}, step), h('td', {}, String((wizard.rows[step] || []).length))))));
+    }
+
+    close = openModal([
+      h('h2', {}, editing ? 'Edit Country' : 'Add Country'),
+      stepper, body, h('div', {}, backBox), nextBox, after,
+    ], { label: 'Add Country' });
+    go(0);
+  }
+
+  // ----------------- Party -----------------
+  async function partyView(content) {
+    const filters = ['Country', 'State', 'District', 'City'].map((label, i) => combobox(label,
+      () => children(...filters.slice(0, i).map(f => f.value))));
+    const search = h('input', { type: 'text', placeholder: 'Search Party', 'aria-label': 'Search Party' });
+    const tbody = h('tbody');
+    const load = async () => {
+      const data = await api('GET', `/api/parties?search=${encodeURIComponent(search.value)}`);
+      tbody.replaceChildren(...data.parties.map(party => h('tr', {},
+        h('td', {}, party.name), h('td', {}, party.code),
+        h('td', {},
+          iconButton('primaryMoreOption', () => {}),
+          iconButton('primaryEditIcon', () => editParty(content, party)),
+          iconButton('primaryEyeIcon', () => viewRecord(`${party.name} (${party.code})`, party.location.filter(Boolean).join(' / ')))))));
+    };
+    search.addEventListener('input', load);
+    content.replaceChildren(
+      h('div', {}, filters, button('Apply', load)),
+      h('div', {}, button('+ Add Party', () => addParty(content)), search),
+      h('table', {}, tbody),
+    );
+    await load();
+  }
+
+  function addParty(content) {
+    const logo = h('input', { type: 'file', accept: 'image/*' });
+    const name = h('input', { type: 'text', placeholder: 'Party Name' });
+    const code = h('input', { type: 'text', placeholder: 'Party Code' });
+    const party = {};
+    content.replaceChildren(h('h3', {}, 'Add Party'), logo, name, code, button('Next', () => {
+      Object.assign(party, { name: name.value.trim(), code: code.value.trim(), logo: logo.files[0] ? logo.files[0].name : '' });
+      const location = [];
+      const boxes = h('div');
+      const reveal = level => {
+        if (level > 3) return;
+        boxes.append(combobox(['Country', 'State', 'District', 'City'][level], () => children(...location.slice(0, level)), option => {
+          location.length = level;
+          location.push(option);
+          while (boxes.children.length > level + 1) boxes.lastChild.remove();
+          reveal(level + 1);
+        }));
+      };
+      reveal(0);
+      content.replaceChildren(h('h3', {}, 'Party Location'), boxes, button('Next', () => {
+        party.location = [...location];
+        content.replaceChildren(h('h3', {}, 'Review'), h('p', {}, `${party.name} (${party.code})`), button('Next', async () => {
+          await api('POST', '/api/parties', party);
+          content.replaceChildren(h('p', {}, 'Party created successfully'), button('Back to Home', () => partyView(content)));
+        }));
+      }));
+    }));
+  }
+
+  function editParty(content, party) {
+    const name = h('input', { type: 'text', placeholder: 'Party Name' });
+    const code = h('input', { type: 'text', placeholder: 'Party Code' });
+    name.value = party.name;
+    code.value = party.code;
+    content.replaceChildren(h('h3', {}, 'Edit Party'), name, code, button('Edit Party', async () => {
+      await api('PUT', `/api/parties/${party.id}`, { name: name.value.trim(), code: code.value.trim() });
+      partyView(content);
+    }));
+  }
+
+  function viewRecord(title, detail) {
+    let close = null;
+    close = openModal([h('h3', {}, title), h('p', {}, detail), button('Close', () => close())], { label: title });
+  }
+
+  // ----------------- Personnel -----------------
+  async function personnelView(content) {
+    const search = h('input', { type: 'text', placeholder: 'Search Personnel', 'aria-label': 'Search Personnel' });
+    const tbody = h('tbody');
+    const load = async () => {
+      const data = await api('GET', '/api/personnel');
+      const term = search.value.trim().toLowerCase();
+      const matches = data.personnel.filter(p => {
+        const full = `${p.firstName} ${p.lastName}`.toLowerCase();
+        return !term || full === term || full.split(/\s+/).includes(term);
+      });
+      tbody.replaceChildren(...matches.map(person => h('tr', {},
+        h('td', {}, `${person.firstName} ${person.lastName}`), h('td', {}, person.email),
+        h('td', {},
+          iconButton('primaryEditIcon', () => editPersonnel(content, person)),
+          iconButton('primaryEyeIcon', () => viewRecord(`${person.firstName} ${person.lastName}`, person.email))))));
+    };
+    search.addEventListener('input', load);
+    content.replaceChildren(h('div', {}, button('+ Add Personnel', () => addPersonnel(content)), search), h('table', {}, tbody));
+    await load();
+  }
+
+  function addPersonnel(content) {
+    const person = {};
+    const profile = h('div');
+    const orgType = combobox('', () => ['Governance', 'Administrator'], option => {
+      person.orgType = option;
+      profile.replaceChildren(option === 'Administrator'
+        ? h('div', { onclick: () => { person.profile = 'Administrator'; } }, h('span', {}, 'Profile'), h('span', {}, 'Administrator'))
+        : '');
+    }, { 'aria-label': null, 'aria-labelledby': 'org-type-label' });
+    content.replaceChildren(h('h3', {}, 'Add Personnel'), h('span', { id: 'org-type-label' }), orgType, profile,
+      button('Next', () => (person.orgType === 'Administrator' ? institutionStep() : locationStep())));
+
+    function locationStep() {
+      const boxes = ['Country', 'State', 'District', 'City'].map((label, i) => combobox(label,
+        () => children(...boxes.slice(0, i).map(b => b.value))));
+      content.replaceChildren(h('h3', {}, 'Location'), boxes, button('Next', () => {
+        person.location = boxes.map(b => b.value);
+        detailsStep();
+      }));
+    }
+
+    function institutionStep() {
+      const institution = combobox('Institution', () => ['Telangana Traffic Police', 'Greater Hyderabad Municipal Corporation'],
+        option => { person.institution = option; });
+      content.replaceChildren(h('h3', {}, 'Institution'), institution, button('Next', detailsStep));
+    }
+
+    function detailsStep() {
+      const field = (placeholder, type) => h('input', { type: type || 'text', placeholder, 'aria-label': placeholder });
+      const inputs = {
+        firstName: field('Enter First Name'), lastName: field('Enter Last Name'), phone: field('Enter Phone', 'tel'),
+        email: field('Enter Email'), empId: field('Enter Emp-id'), address: field('Enter Address'),
+      };
+      content.replaceChildren(h('h3', {}, 'Personnel Details'), Object.values(inputs), button('Next', () => {
+        for (const [key, input] of Object.entries(inputs)) person[key] = input.value.trim();
+        content.replaceChildren(h('h3', {}, 'Review'), h('p', {}, `${person.firstName} ${person.lastName}`), button('Next', async () => {
+          const error = h('p');
+          try {
+            await api('POST', '/api/personnel', person);
+            error.textContent = 'Personnel added successfully';
+          } catch (err) {
+            error.textContent = err.message;
+          }
+          content.replaceChildren(error, button('Done', () => personnelView(content)));
+        }));
+      }));
+    }
+  }
+
+  function editPersonnel(content, person) {
+    const first = h('input', { type: 'text', placeholder: 'First Name' });
+    const last = h('input', { type: 'text', placeholder: 'Last Name' });
+    first.value = person.firstName;
+    last.value = person.lastName;
+    content.replaceChildren(
+      h('div', {}, h('h3', {}, 'Edit Personnel'), h('span', {}, 'Auto Saved To Draft')),
+      first, last,
+      button('Edit Personnel', async () => {
+        await api('PUT', `/api/personnel/${person.id}`, { firstName: first.value.trim(), lastName: last.value.trim() });
+        personnelView(content);
+      }),
+    );
+  }
+
+  // ----------------- Governance -----------------
+  async function governanceView(content) {
+    const filters = ['Country', 'State', 'District', 'City'].map((label, i) => combobox(label,
+      () => children(...filters.slice(0, i).map(f => f.value))));
+    const location = () => filters.map(f => f.value).join('/');
+    const list = h('div');
+    const apply = async () => {
+      const body = await api('GET', `/api/governance?location=${encodeURIComponent(location())}`);
+      list.replaceChildren(h('table', {}, body.ministry.length ? h('tr', {},
+        h('td', {}, location()), h('td', {}, `${body.ministry.length} ministries, ${body.roles.length} roles`),
+        h('td', {},
+          iconButton('primaryEditIcon', () => governanceWizard(list, location(), body, true)),
+          iconButton('primaryEyeIcon', () => viewRecord(location(), body.ministry.map(m => m.Name).join(', '))))) : ''));
+    };
+    content.replaceChildren(
+      h('div', {}, filters, button('Apply', apply)),
+      button('+ Upload Governance Data', () => governanceWizard(list, location(), null, false)),
+      list,
+    );
+  }
+
+  function governanceWizard(container, location, existing, editing) {
+    const data = { ministry: [], roles: [], officers: [], ...(existing || {}) };
+    const query = `?location=${encodeURIComponent(location)}`;
+    const steps = ['ministry', 'roles', 'officers'];
+
+    const uploadStep = index => {
+      const kind = steps[index];
+      const input = h('input', { type: 'file', id: 'csv-upload', accept: '.csv', class: 'hidden-input' });
+      const status = h('p', {}, data[kind].length ? `${data[kind].length} rows` : 'No file uploaded');
+      const next = button('Next', () => (index + 1 < steps.length ? uploadStep(index + 1) : mappingStep()),
+        { disabled: !(editing || data[kind].length) });
+      input.addEventListener('change', async () => {
+        const file = input.files[0];
+        if (!file) return;
+        try {
+          data[kind] = (await uploadFile(`/api/governance/uploads/${kind}${query}`, file)).rows;
+          status.textContent = `${file.name} uploaded (${data[kind].length} rows)`;
+          next.disabled = false;
+        } catch (err) {
+          status.textContent = err.message;
+        }
+      });
+      container.replaceChildren(h('h3', {}, `Upload ${kind}`), button('Download', () => download(kind)),
+        h('label', { for: 'csv-upload' }, 'Upload'), input, status, next);
+    };
+
+    const mappingStep = () => {
+      const mappings = data.roles.map(() => ({}));
+      const roleNames = () => data.roles.map(r => r.Name);
+      const people = () => data.officers.map(o => `${o.firstName} ${o.lastName}`);
+      const rows = data.roles.map((_, i) => h('div', {},
+        autocomplete('Select Role', roleNames, option => { mappings[i].role = option; }),
+        autocomplete('Select Person', people, option => { mappings[i].person = option; })));
+      container.replaceChildren(h('h3', {}, 'Map roles to personnel'), rows, button('Next', async () => {
+        await api('POST', `/api/governance/mappings${query}`, { mappings: mappings.filter(m => m.role) });
+        container.replaceChildren(h('h3', {}, 'Summary'), h('p', {}, `${data.ministry.length} ministries, ${data.roles.length} roles, ${data.officers.length} officers`),
+          button('Submit', async () => {
+            await api('POST', `/api/governance/submit${query}`, {});
+            container.replaceChildren(h('p', {}, 'Governance body saved'));
+          }));
+      }));
+    };
+
+    uploadStep(0);
+  }
+
+  // ----------------- Boot -----------------
+  async function boot() {
+    if (!localStorage.getItem(TOKEN_KEY)) return renderLanding();
+    try {
+      await api('GET', '/api/auth/me');
+      renderDashboard();
+    } catch (err) {
+      localStorage.removeItem(TOKEN_KEY);
+      renderLanding();
+    }
+  }
+
+  document.addEventListener('click', event => {
+    if (openListbox && !openListbox.contains(event.target) && !event.target.closest('[role=combobox], .MuiAutocomplete-root')) closeOptions();
+  });
+  boot();
+})();
@@ -0,0 +1,485 @@
+import csv
+import io
+import json
+import mimetypes
+import os
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from config import UPLOADS_DIR
+
+STUB_APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_app")
+
+# Template headers served by the "Download" buttons of the country and governance wizards
+TEMPLATES = {
+    "hierarchy": "Name\n",
+    "state": "Name,ParentName,Abbr\n",
+    "district": "Name,ParentName,Abbr\n",
+    "city": "Name,ParentName,Abbr\n",
+    "ministry": "Name,ParentName,Institution\n",
+    "roles": "Name,ParentName\n",
+    "officers": "empId,firstName,lastName,mobile,email,address,gender\n",
+}
+
+INVALID_CREDENTIALS = "Invalid Credentials, Please Check Email or Password"
+
+
+class StubBackend:
+    """In-memory stand-in for the Problem Bolo API plus the SPA shell in utils/stub_app"""
+
+    def __init__(self, uploads_dir: str = UPLOADS_DIR, otp_countdown: int = 20):
+        self.uploads_dir = uploads_dir
+        self.otp_countdown = otp_countdown
+        self.lock = threading.Lock()
+        self.users = {"admin@email.com": "password"}
+        self.sessions = {}      # token -> email
+        self.pending_otp = {}   # email -> otp
+        self.locations = self._seed_locations()
+        self.countries = self._seed_countries()
+        self.parties = [
+            {"id": 1, "name": "telugu desham party", "code": "TDP", "logo": "tdp.jpg",
+             "location": ["India", "AndhraPradesh", "Kurnool", ""]},
+        ]
+        self.personnel = [
+            {"id": 1, "firstName": "John", "lastName": "Doe", "phone": "+918765987654",
+             "email": "john123456@email.com", "empId": "johns123456", "address": "hyderabad",
+             "orgType": "Governance", "location": ["India", "Telangana", "Hyderabad", "HyderabadCity"]},
+        ]
+        self.governance = {}    # "country/state/district/city" -> body
+        self.requests_served = 0
+        self.routes = [
+            ("POST", r"/api/auth/login", self.auth_login),
+            ("POST", r"/api/auth/verify-otp", self.auth_verify_otp),
+            ("POST", r"/api/auth/forgot-password", self.auth_forgot_password),
+            ("POST", r"/api/auth/reset-password", self.auth_reset_password),
+            ("POST", r"/api/auth/logout", self.auth_logout),
+            ("GET", r"/api/auth/me", self.auth_me),
+            ("GET", r"/api/locations", self.get_locations),
+            ("GET", r"/api/templates/(?P<name>\w+)", self.get_template),
+            ("GET", r"/api/countries", self.list_countries),
+            ("POST", r"/api/countries", self.create_country),
+            ("GET", r"/api/countries/(?P<cid>\d+)", self.get_country),
+            ("POST", r"/api/countries/(?P<cid>\d+)/uploads/(?P<step>\w+)", self.upload_country_csv),
+            ("POST", r"/api/countries/(?P<cid>\d+)/geofences", self.upload_geofence),
+            ("POST", r"/api/countries/(?P<cid>\d+)/media", self.upload_media),
+            ("POST", r"/api/countries/(?P<cid>\d+)/submit", self.submit_country),
+            ("GET", r"/api/parties", self.list_parties),
+            ("POST", r"/api/parties", self.create_party),
+            ("PUT", r"/api/parties/(?P<pid>\d+)", self.update_party),
+            ("GET", r"/api/personnel", self.list_personnel),
+            ("POST", r"/api/personnel", self.create_personnel),
+            ("PUT", r"/api/personnel/(?P<pid>\d+)", self.update_personnel),
+            ("GET", r"/api/governance", self.get_governance),
+            ("POST", r"/api/governance/uploads/(?P<kind>\w+)", self.upload_governance_csv),
+            ("POST", r"/api/governance/mappings", self.save_governance_mappings),
+            ("POST", r"/api/governance/submit", self.submit_governance),
+        ]
+
+    # ----------------- Seed data -----------------
+    def _read_fixture(self, name):
+        path = os.path.join(self.uploads_dir, name)
+        if not os.path.exists(path):
+            return []
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def _seed_locations(self):
+        """Country -> state -> district -> [cities], built from the V5 upload fixtures"""
+        tree = {"India": {}}
+        for row in self._read_fixture("stateV5.csv"):
+            tree.setdefault(row["ParentName"], {})[row["Name"]] = {}
+        districts = {}
+        for row in self._read_fixture("districtV5.csv"):
+            for states in tree.values():
+                if row["ParentName"] in states:
+                    states[row["ParentName"]][row["Name"]] = []
+                    districts[row["Name"]] = states[row["ParentName"]][row["Name"]]
+        for row in self._read_fixture("cityV5.csv"):
+            if row["ParentName"] in districts:
+                districts[row["ParentName"]].append(row["Name"])
+        tree["India"]["AndhraPradesh"].setdefault("Kurnool", []).append("KurnoolCity")
+        return tree
+
+    def _seed_countries(self):
+        seed = [
+            ("ACTIVE", "India", "IND", "01/09/2025"),
+            ("INACTIVE", "Nepal", "NPL", "02/09/2025"),
+            ("DRAFT", "Belgium", "BEL", "05/09/2025"),
+            ("DRAFT", "Japan", "JPN", "15/09/2025"),
+            ("ARCHIVE", "Bhutan", "BTN", "20/08/2025"),
+        ]
+        return [
+            {"id": i + 1, "status": status, "name": name, "code": code, "created": created,
+             "uploads": {}, "geofences": {}, "media": {}}
+            for i, (status, name, code, created) in enumerate(seed)
+        ]
+
+    # ----------------- Dispatch -----------------
+    def handle(self, method: str, url: str, body: bytes = b"", headers: dict = None):
+        """Return (status, headers, body) for one request, API or static"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        parsed = urlparse(url)
+        path = unquote(parsed.path)
+        with self.lock:
+            self.requests_served += 1
+
+        if not path.startswith("/api/"):
+            return self._static(path)
+
+        for route_method, pattern, handler in self.routes:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                if not handler.__name__.startswith(("auth_", "get_template")) and not self._session(headers):
+                    return self._json(401, {"message": "Unauthorized"})
+                request = {
+                    "query": {k: v[0] for k, v in parse_qs(parsed.query).items()},
+                    "headers": headers,
+                    "body": body or b"",
+                    "params": match.groupdict(),
+                }
+                with self.lock:
+                    return handler(request)
+        return self._json(404, {"message": f"No stub route for {method} {path}"})
+
+    def _static(self, path):
+        name = path.lstrip("/") or "index.html"
+        file_path = os.path.normpath(os.path.join(STUB_APP_DIR, name))
+        if not file_path.startswith(STUB_APP_DIR) or not os.path.isfile(file_path):
+            file_path = os.path.join(STUB_APP_DIR, "index.html")  # SPA fallback
+        with open(file_path, "rb") as f:
+            content = f.read()
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        return 200, {"Content-Type": content_type, "Cache-Control": "no-cache"}, content
+
+    def _session(self, headers):
+        auth = headers.get("authorization", "")
+        token = auth[len("Bearer "):] if auth.startswith("Bearer ") else ""
+        return self.sessions.get(token)
+
+    @staticmethod
+    def _json(status, payload, extra_headers=None):
+        headers = {"Content-Type": "application/json"}
+        headers.update(extra_headers or {})
+        return status, headers, json.dumps(payload).encode("utf-8")
+
+    @staticmethod
+    def _payload(request):
+        try:
+            return json.loads(request["body"] or b"{}")
+        except ValueError:
+            return {}
+
+    @staticmethod
+    def _file(request):
+        name = unquote(request["headers"].get("x-file-name", "upload"))
+        return name, request["body"]
+
+    @staticmethod
+    def _csv_rows(content: bytes):
+        text = content.decode("utf-8-sig", errors="replace")
+        reader = csv.DictReader(io.StringIO(text))
+        return reader.fieldnames or [], [dict(r) for r in reader]
+
+    @staticmethod
+    def mask_email(email: str, stars: int) -> str:
+        local, _, domain = email.partition("@")
+        return f"{local[:3]}{'*' * stars}@{domain}"
+
+    # ----------------- Auth -----------------
+    def auth_login(self, request):
+        data = self._payload(request)
+        email = data.get("email", "").strip()
+        if self.users.get(email) != data.get("password"):
+            return self._json(401, {"message": INVALID_CREDENTIALS})
+        otp = f"{secrets.randbelow(10000):04d}"
+        self.pending_otp[email] = otp
+        return self._json(200, {
+            "maskedEmail": self.mask_email(email, 9),
+            "otp": otp,
+            "countdown": self.otp_countdown,
+        })
+
+    def auth_verify_otp(self, request):
+        data = self._payload(request)
+        email = data.get("email", "")
+        if not email or self.pending_otp.get(email) != data.get("otp"):
+            return self._json(401, {"message": "Invalid OTP"})
+        del self.pending_otp[email]
+        token = secrets.token_hex(16)
+        self.sessions[token] = email
+        return self._json(200, {"token": token, "email": email},
+                          {"Set-Cookie": f"pb_session={token}; Path=/; SameSite=Lax"})
+
+    def auth_forgot_password(self, request):
+        data = self._payload(request)
+        email = data.get("email", "").strip()
+        otp = "".join(secrets.choice("abcdefghjkmnpqrstuvwxyz23456789") for _ in range(4))
+        if email:
+            self.pending_otp[email] = otp
+        return self._json(200, {
+            "maskedEmail": self.mask_email(email, 8) if email else data.get("mobile", ""),
+            "otp": otp,
+            "countdown": self.otp_countdown,
+        })
+
+    def auth_reset_password(self, request):
+        data = self._payload(request)
+        email = data.get("email", "").strip()
+        if email in self.users and data.get("password"):
+            self.users[email] = data["password"]
+        return self._json(200, {"message": "Password updated"})
+
+    def auth_logout(self, request):
+        self.sessions.pop(self._bearer(request), None)
+        return self._json(200, {"message": "Logged out"})
+
+    def auth_me(self, request):
+        email = self.sessions.get(self._bearer(request))
+        if not email:
+            return self._json(401, {"message": "Unauthorized"})
+        return self._json(200, {"email": email})
+
+    @staticmethod
+    def _bearer(request):
+        auth = request["headers"].get("authorization", "")
+        return auth[len("Bearer "):] if auth.startswith("Bearer ") else ""
+
+    # ----------------- Locations / templates -----------------
+    def get_locations(self, request):
+        return self._json(200, self.locations)
+
+    def get_template(self, request):
+        name = request["params"]["name"]
+        if name not in TEMPLATES:
+            return self._json(404, {"message": f"Unknown template {name}"})
+        return 200, {
+            "Content-Type": "text/csv",
+            "Content-Disposition": f'attachment; filename="{name}_template.csv"',
+        }, TEMPLATES[name].encode("utf-8")
+
+    # ----------------- Country wizard -----------------
+    def _country(self, request):
+        cid = int(request["params"]["cid"])
+        return next((c for c in self.countries if c["id"] == cid), None)
+
+    def list_countries(self, request):
+        status = request["query"].get("status")
+        rows = [c for c in self.countries if not status or c["status"] == status.upper()]
+        counts = {}
+        for c in self.countries:
+            counts[c["status"]] = counts.get(c["status"], 0) + 1
+        return self._json(200, {"countries": rows, "counts": counts})
+
+    def create_country(self, request):
+        data = self._payload(request)
+        country = {
+            "id": max((c["id"] for c in self.countries), default=0) + 1,
+            "status": "DRAFT",
+            "name": data.get("name", ""),
+            "code": data.get("code", ""),
+            "created": time.strftime("%d/%m/%Y"),
+            "uploads": {}, "geofences": {}, "media": {},
+        }
+        self.countries.append(country)
+        return self._json(201, country)
+
+    def get_country(self, request):
+        country = self._country(request)
+        if country is None:
+            return self._json(404, {"message": "Country not found"})
+        return self._json(200, country)
+
+    def upload_country_csv(self, request):
+        country = self._country(request)
+        step = request["params"]["step"]
+        if country is None or step not in ("hierarchy", "state", "district", "city"):
+            return self._json(404, {"message": "Unknown upload step"})
+        name, content = self._file(request)
+        fieldnames, rows = self._csv_rows(content)
+        expected = TEMPLATES[step].strip().split(",")
+        if fieldnames[:len(expected)] != expected:
+            return self._json(422, {"message": f"{name}: expected columns {expected}, got {fieldnames}"})
+        country["uploads"][step] = {"file": name, "rows": rows}
+        return self._json(200, {"file": name, "rows": rows})
+
+    def upload_geofence(self, request):
+        country = self._country(request)
+        name, content = self._file(request)
+        target = request["query"].get("target", "")
+        if country is None or not target:
+            return self._json(404, {"message": "Unknown geofence target"})
+        if not name.lower().endswith((".kml", ".geojson", ".json")):
+            return self._json(422, {"message": f"{name}: unsupported geofence format"})
+        country["geofences"][target] = {"file": name, "size": len(content)}
+        return self._json(200, {"target": target, "file": name, "size": len(content)})
+
+    def upload_media(self, request):
+        country = self._country(request)
+        name, content = self._file(request)
+        target = request["query"].get("target", "")
+        kind = request["query"].get("kind", "image")
+        if country is None:
+            return self._json(404, {"message": "Country not found"})
+        country["media"].setdefault(target, {})[kind] = {"file": name, "size": len(content)}
+        return self._json(200, {"target": target, "kind": kind, "file": name, "size": len(content)})
+
+    def submit_country(self, request):
+        country = self._country(request)
+        if country is None:
+            return self._json(404, {"message": "Country not found"})
+        country["status"] = "ACTIVE"
+        return self._json(200, country)
+
+    # ----------------- Party -----------------
+    def list_parties(self, request):
+        search = request["query"].get("search", "").lower()
+        rows = [p for p in self.parties if search in p["name"].lower()]
+        return self._json(200, {"parties": rows})
+
+    def create_party(self, request):
+        data = self._payload(request)
+        if any(p["code"] == data.get("code") for p in self.parties):
+            return self._json(409, {"message": f"Party code {data.get('code')} already exists"})
+        party = dict(data, id=max((p["id"] for p in self.parties), default=0) + 1)
+        self.parties.append(party)
+        return self._json(201, party)
+
+    def update_party(self, request):
+        pid = int(request["params"]["pid"])
+        party = next((p for p in self.parties if p["id"] == pid), None)
+        if party is None:
+            return self._json(404, {"message": "Party not found"})
+        party.update(self._payload(request))
+        return self._json(200, party)
+
+    # ----------------- Personnel -----------------
+    def list_personnel(self, request):
+        search = request["query"].get("search", "").lower()
+        rows = [p for p in self.personnel
+                if search in f"{p['firstName']} {p['lastName']}".lower()]
+        return self._json(200, {"personnel": rows})
+
+    def create_personnel(self, request):
+        data = self._payload(request)
+        for key in ("email", "empId", "phone"):
+            if data.get(key) and any(p.get(key) == data[key] for p in self.personnel):
+                return self._json(409, {"message": f"Personnel {key} {data[key]} already exists"})
+        person = dict(data, id=max((p["id"] for p in self.personnel), default=0) + 1)
+        self.personnel.append(person)
+        return self._json(201, person)
+
+    def update_personnel(self, request):
+        pid = int(request["params"]["pid"])
+        person = next((p for p in self.personnel if p["id"] == pid), None)
+        if person is None:
+            return self._json(404, {"message": "Personnel not found"})
+        person.update(self._payload(request))
+        return self._json(200, person)
+
+    # ----------------- Governance -----------------
+    def _governance_body(self, request):
+        key = request["query"].get("location", "")
+        if key not in self.governance:
+            # Every jurisdiction starts with the V5 governance fixtures so edit/view flows have data
+            self.governance[key] = {
+                "ministry": self._read_fixture(os.path.join("governanceV5", "ministryV5.csv")),
+                "roles": self._read_fixture(os.path.join("governanceV5", "rolesV5.csv")),
+                "officers": self._read_fixture(os.path.join("governanceV5", "officersV5.csv")),
+                "mappings": [], "submitted": True,
+            }
+        return self.governance[key]
+
+    def get_governance(self, request):
+        return self._json(200, self._governance_body(request))
+
+    def upload_governance_csv(self, request):
+        kind = request["params"]["kind"]
+        if kind not in ("ministry", "roles", "officers"):
+            return self._json(404, {"message": "Unknown governance upload"})
+        name, content = self._file(request)
+        fieldnames, rows = self._csv_rows(content)
+        expected = TEMPLATES[kind].strip().split(",")
+        missing = [c for c in expected if c not in fieldnames and c != "gender"]
+        if missing:
+            return self._json(422, {"message": f"{name}: missing columns {missing}"})
+        self._governance_body(request)[kind] = rows
+        return self._json(200, {"file": name, "rows": rows})
+
+    def save_governance_mappings(self, request):
+        self._governance_body(request)["mappings"] = self._payload(request).get("mappings", [])
+        return self._json(200, {"message": "Mappings saved"})
+
+    def submit_governance(self, request):
+        body = self._governance_body(request)
+        body["submitted"] = True
+        return self._json(200, body)
+
+
+# ----------------- Serving modes -----------------
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    backend = None
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, content = self.backend.handle(self.command, self.path, body, dict(self.headers))
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Serve a StubBackend over HTTP from a daemon thread"""
+
+    def __init__(self, backend: StubBackend, host: str, port: int):
+        handler = type("BoundStubRequestHandler", (_StubRequestHandler,), {"backend": backend})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def install_routes(context, backend: StubBackend, base_url: str):
+    """Answer every request to base_url in-browser via route interception"""
+
+    def handle_route(route):
+        request = route.request
+        status, headers, content = backend.handle(
+            request.method, request.url, request.post_data_buffer or b"", request.headers
+        )
+        route.fulfill(status=status, headers=headers, body=content)
+
+    context.route(base_url.rstrip("/") + "/**", handle_route)
+    return handle_route
+
+
+async def install_routes_async(context, backend: StubBackend, base_url: str):
+    """install_routes for a playwright.async_api context"""
+
+    async def handle_route(route):
+        request = route.request
+        status, headers, content = backend.handle(
+            request.method, request.url, request.post_data_buffer or b"", request.headers
+        )
+        await route.fulfill(status=status, headers=headers, body=content)
+
+    await context.route(base_url.rstrip("/") + "/**", handle_route)
+    return handle_route
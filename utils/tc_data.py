@@ -0,0 +1,168 @@
+import csv
+import os
+import pickle
+import re
+import tempfile
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+from config import ARTIFACTS_DIR, CSV_FILE, EXCEL_FILE
+from utils.tc_params import parse_test_data
+
+TC_INDEX_CACHE = os.path.join(ARTIFACTS_DIR, "tc_index.pickle")
+TC_ID_PATTERN = re.compile(r"[A-Z]+\d+")
+
+
+class TcRecord(Mapping):
+    """Immutable test-case row: column access like a dict plus typed accessors"""
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: dict):
+        object.__setattr__(self, "_row", MappingProxyType(dict(row)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TcRecord is read-only")
+
+    def __getitem__(self, column):
+        return self._row[column]
+
+    def __iter__(self):
+        return iter(self._row)
+
+    def __len__(self):
+        return len(self._row)
+
+    def __reduce__(self):
+        return TcRecord, (dict(self._row),)
+
+    def __repr__(self):
+        return f"TcRecord({self.tc_id!r})"
+
+    @property
+    def tc_id(self) -> str:
+        return self._row.get("TC ID", "")
+
+    @property
+    def module(self) -> str:
+        return self._row.get("Module/Screen", "")
+
+    @property
+    def title(self) -> str:
+        return self._row.get("Title", "")
+
+    @property
+    def test_data(self) -> str:
+        return self._row.get("Test Data", "")
+
+    @property
+    def expected(self) -> str:
+        return self._row.get("Expected Result", "")
+
+    @property
+    def params(self):
+        """Compiled Test Data (utils.tc_params.TcParams), parsed once per distinct cell"""
+        return parse_test_data(self.test_data)
+
+
+class TcRegistry:
+    """TC ID -> TcRecord index over data/testdata.csv plus the xlsx sheets"""
+
+    def __init__(self, records: dict, sheets: dict):
+        self._index = MappingProxyType(records)
+        self._sheets = MappingProxyType({name: tuple(rows) for name, rows in sheets.items()})
+
+    def __reduce__(self):
+        return TcRegistry, (dict(self._index), {name: list(rows) for name, rows in self._sheets.items()})
+
+    def __getitem__(self, tc_id: str) -> TcRecord:
+        try:
+            return self._index[tc_id]
+        except KeyError:
+            raise KeyError(f"{tc_id} not found in {CSV_FILE} or {EXCEL_FILE}") from None
+
+    def __contains__(self, tc_id):
+        return tc_id in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, tc_id: str, default=None):
+        return self._index.get(tc_id, default)
+
+    def ids(self):
+        return tuple(self._index)
+
+    def sheet(self, name: str):
+        """Records of one xlsx sheet, in sheet order"""
+        return self._sheets[name]
+
+    @classmethod
+    def parse(cls, csv_file: str = CSV_FILE, xlsx_file: str = EXCEL_FILE, sheets=("country",)):
+        records, by_sheet = {}, {}
+        with open(csv_file, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                row = {k: v or "" for k, v in row.items()}
+                row["TC ID"] = row.get("TC ID", "").strip()
+                _index(records, TcRecord(row))
+        if sheets and os.path.exists(xlsx_file):
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(xlsx_file, read_only=True, data_only=True)
+            for name in sheets:
+                rows = workbook[name].iter_rows(values_only=True)
+                header = [str(c).strip() if c is not None else "" for c in next(rows, ())]
+                by_sheet[name] = []
+                for values in rows:
+                    row = {h: ("" if v is None else str(v)) for h, v in zip(header, values) if h}
+                    row["TC ID"] = row.get("TC ID", "").strip()
+                    if TC_ID_PATTERN.fullmatch(row["TC ID"]):
+                        by_sheet[name].append(_index(records, TcRecord(row)))
+            workbook.close()
+        return cls(records, by_sheet)
+
+
+def tc_id_for_item(item, registry=None) -> str:
+    """TC ID of a collected test: the 'tc' row for parametrized tests, else the test name"""
+    params = getattr(getattr(item, "callspec", None), "params", {})
+    tc = params.get("tc")
+    if isinstance(tc, Mapping) and str(tc.get("TC ID", "")).strip():
+        return str(tc["TC ID"]).strip()
+    match = re.match(r"test_([a-z]+\d+)_", item.name)
+    if match and match.group(1).upper() in (registry or load_tc_data()):
+        return match.group(1).upper()
+    return re.sub(r"[^\w.-]", "_", item.name)
+
+
+def _index(records, record):
+    """Index record under its TC ID; blank, NaN and section-header rows are not test cases"""
+    if TC_ID_PATTERN.fullmatch(record.tc_id):
+        records.setdefault(record.tc_id, record)
+    return record
+
+
+def _signature(*paths):
+    return tuple((p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths if os.path.exists(p))
+
+
+@lru_cache(maxsize=None)
+def load_tc_data() -> TcRegistry:
+    """Parse the test-data files once per process; xdist workers reuse the pickled index"""
+    # the pattern is part of the key so an index built under other rules is not reused
+    signature = (TC_ID_PATTERN.pattern,) + _signature(CSV_FILE, EXCEL_FILE)
+    try:
+        with open(TC_INDEX_CACHE, "rb") as f:
+            cached_signature, registry = pickle.load(f)
+        if cached_signature == signature:
+            return registry
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+        pass
+
+    registry = TcRegistry.parse()
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tc_index_", dir=ARTIFACTS_DIR)
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump((signature, registry), f)
+    os.replace(tmp, TC_INDEX_CACHE)
+    return registry
@@ -0,0 +1,146 @@
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+
+from utils.assets import load_assets
+
+LOCATION_KEYS = ("country", "state", "district", "city")
+_EMAIL = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_QUOTES_ONLY = re.compile(r"""^["']*$""")
+
+
+@dataclass(frozen=True)
+class TcParams(Mapping):
+    """Compiled "Test Data" cell: raw key/value pairs plus typed fields"""
+
+    pairs: Mapping = field(default_factory=dict)   # key (original case) -> value, first occurrence wins
+    text: str = ""                                  # free text when the cell is not key/value (e.g. FPASS02)
+    errors: tuple = ()
+
+    # Mapping access keeps the old data_map.get("MinistryFile") call sites working
+    def __getitem__(self, key):
+        if key in self.pairs:
+            return self.pairs[key]
+        value = self.first(key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def first(self, name: str, default: str = "") -> str:
+        """Value of the first key matching name case-insensitively, in cell order"""
+        lowered = name.lower()
+        return next((v for k, v in self.pairs.items() if k.lower() == lowered), default)
+
+    @property
+    def email(self) -> str:
+        return self.first("email")
+
+    @property
+    def password(self) -> str:
+        return self.first("password")
+
+    @property
+    def confirm_password(self) -> str:
+        return self.first("confirmpassword")
+
+    @property
+    def mobile(self) -> str:
+        return self.first("mobile")
+
+    @property
+    def otp(self) -> str:
+        return self.first("otp")
+
+    @property
+    def masked_email(self) -> str:
+        return self.first("masked_email")
+
+    @property
+    def location(self):
+        """(country, state, district, city), or None if the row names no location"""
+        if not any(self.first(k, None) is not None for k in LOCATION_KEYS):
+            return None
+        return tuple(self.first(k) for k in LOCATION_KEYS)
+
+    @property
+    def files(self):
+        """Repo-relative upload paths, keyed as in the cell (MinistryFile, partylogo, ...)"""
+        return {k: v for k, v in self.pairs.items() if "/" in v and _is_file_key(k)}
+
+    @property
+    def role_mappings(self):
+        """RolesAssignments "Role|Person;Role|Person" as ((role, person), ...)"""
+        value = self.first("RolesAssignments")
+        return tuple(tuple(p.strip() for p in item.split("|", 1))
+                     for item in value.split(";") if item.strip())
+
+
+def _is_file_key(key):
+    key = key.lower()
+    return key.endswith(("file", "files", "logo"))
+
+
+def _clean(value):
+    value = value.strip()
+    return "" if _QUOTES_ONLY.match(value) else value
+
+
+def _segments(text):
+    """Split a cell into key/value pairs: newline or comma separated "k:v", or ';' separated "k=v" """
+    pairs, free = [], []
+    for line in text.splitlines():
+        for segment in line.split(","):
+            if not segment.strip():
+                continue
+            colon, equals = segment.find(":"), segment.find("=")
+            if colon != -1 and (equals == -1 or colon < equals):
+                key, value = segment.split(":", 1)
+                pairs.append([key.strip(), value])
+            elif equals != -1:
+                for part in segment.split(";"):
+                    if "=" in part:
+                        key, value = part.split("=", 1)
+                        pairs.append([key.strip(), value])
+            elif pairs:
+                pairs[-1][1] += "," + segment    # value that itself contains a comma
+            else:
+                free.append(segment.strip())
+    return pairs, ", ".join(free)
+
+
+@lru_cache(maxsize=None)
+def parse_test_data(text: str) -> TcParams:
+    """Compile one Test Data cell; cached per distinct cell text for the whole session"""
+    text = (text or "").strip()
+    if not text or text.upper() == "N/A":
+        return TcParams()
+    pairs, free = _segments(text)
+    values = {}
+    for key, value in pairs:
+        values.setdefault(key, _clean(value))
+    params = TcParams(pairs=MappingProxyType(values), text=free)
+    return TcParams(pairs=params.pairs, text=free, errors=tuple(_validate(params)))
+
+
+def _validate(params):
+    for key, value in params.pairs.items():
+        if key.lower() in ("email", "masked_email") and value and "*" not in value and not _EMAIL.fullmatch(value):
+            yield f"{key}: {value!r} is not an email address"
+    location = params.location
+    if location and not all(location):
+        missing = [k for k, v in zip(LOCATION_KEYS, location) if not v]
+        yield f"location is missing {', '.join(missing)}"
+    for key, path in params.files.items():
+        if path not in load_assets():
+            yield f"{key}: {path} does not exist"
+    for mapping in params.role_mappings:
+        if len(mapping) != 2 or not all(mapping):
+            yield f"RolesAssignments: {'|'.join(mapping)!r} is not 'Role|Person'"
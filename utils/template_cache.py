@@ -0,0 +1,106 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+
+from config import BASE_URL, TEMPLATE_DIR
+from utils.assets import load_assets
+
+TEMPLATE_MODES = ("once", "always", "skip")
+
+
+class TemplateMismatch(AssertionError):
+    """Downloaded template header no longer matches the fixture we upload for it"""
+
+
+class TemplateCache:
+    """Wizard CSV templates stored by checksum; the Download round-trip runs once per session"""
+
+    def __init__(self, mode: str = "once", cache_dir: str = TEMPLATE_DIR):
+        if mode not in TEMPLATE_MODES:
+            raise ValueError(f"Unknown template mode {mode!r}, expected one of {TEMPLATE_MODES}")
+        self.mode = mode
+        self.cache_dir = cache_dir
+        self._fetched = {}   # key -> sha1, templates downloaded (or trusted) this session
+
+    def manifest_path(self, key: str) -> str:
+        """One manifest entry per (BASE_URL, key): workers that fetch concurrently each replace only
+        their own file, so no entry is lost to another worker's read-modify-write"""
+        name = hashlib.sha1(f"{BASE_URL}|{key}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, "manifest", f"{name}.json")
+
+    def _manifest(self, key: str):
+        try:
+            with open(self.manifest_path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _remember(self, key, sha1):
+        path = self.manifest_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"base_url": BASE_URL, "key": key, "sha1": sha1, "fetched_at": time.time()}, f, indent=1)
+        os.replace(tmp, path)
+
+    def path(self, sha1: str) -> str:
+        return os.path.join(self.cache_dir, f"{sha1}.csv")
+
+    def needs_download(self, key: str) -> bool:
+        if self.mode == "always" or key is None:
+            return True
+        if key in self._fetched:
+            return False
+        # skip mode trusts a template an earlier session already checked
+        return not (self.mode == "skip" and self._manifest(key) is not None)
+
+    def fetch(self, page, download_button, key: str = None, fixture: str = None):
+        """Click Download unless this template was already fetched; check its header against fixture"""
+        if not self.needs_download(key):
+            return self._fetched.get(key)
+        with page.expect_download() as download_info:
+            download_button.click()
+        return self._store(download_info.value.path(), key, fixture)
+
+    async def fetch_async(self, page, download_button, key: str = None, fixture: str = None):
+        """fetch() for playwright.async_api pages"""
+        if not self.needs_download(key):
+            return self._fetched.get(key)
+        async with page.expect_download() as download_info:
+            await download_button.click()
+        download = await download_info.value
+        return self._store(await download.path(), key, fixture)
+
+    def _store(self, download_path, key, fixture):
+        with open(download_path, "rb") as f:
+            content = f.read()
+        sha1 = hashlib.sha1(content).hexdigest()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if not os.path.exists(self.path(sha1)):
+            if fixture:
+                check_header(content, fixture)
+            with open(self.path(sha1), "wb") as f:
+                f.write(content)
+        if key is not None:
+            self._fetched[key] = sha1
+            self._remember(key, sha1)
+        return sha1
+
+
+def _header(content: bytes):
+    text = content.decode("utf-8-sig", errors="replace")
+    row = next(csv.reader(io.StringIO(text)), [])
+    return [cell.strip().lower() for cell in row if cell.strip()]
+
+
+def check_header(content: bytes, fixture: str):
+    expected = _header(load_assets().read(fixture))
+    actual = _header(content)
+    if actual != expected:
+        raise TemplateMismatch(f"Template header {actual} does not match fixture {fixture} header {expected}")
+
+
+template_cache = TemplateCache()
@@ -0,0 +1,86 @@
+import contextvars
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+
+
+class WaitTelemetry:
+    """Seconds the current test spent in BasePage waits, per wait kind"""
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.calls = Counter()
+
+    def reset(self):
+        self.seconds.clear()
+        self.calls.clear()
+
+    @property
+    def waited(self) -> float:
+        return sum(self.seconds.values())
+
+    def add(self, kind: str, seconds: float):
+        self.seconds[kind] += seconds
+        self.calls[kind] += 1
+
+    @contextmanager
+    def timed(self, kind: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(kind, time.monotonic() - started)
+
+
+class NetworkTracker:
+    """In-flight request count of one page, fed by its request events"""
+
+    def __init__(self, page):
+        self.inflight = 0
+        self.last_change = time.monotonic()
+        page.on("request", self._started)
+        page.on("requestfinished", self._settled)
+        page.on("requestfailed", self._settled)
+
+    def _started(self, request):
+        self.inflight += 1
+        self.last_change = time.monotonic()
+
+    def _settled(self, request):
+        self.inflight = max(0, self.inflight - 1)
+        self.last_change = time.monotonic()
+
+    def quiet_for(self) -> float:
+        """Seconds since the last request started or settled, 0 while any is in flight"""
+        return 0.0 if self.inflight else time.monotonic() - self.last_change
+
+
+_trackers = weakref.WeakKeyDictionary()
+
+
+def network_tracker(page) -> NetworkTracker:
+    """One tracker per page, shared by every page object wrapping it"""
+    tracker = _trackers.get(page)
+    if tracker is None:
+        tracker = _trackers[page] = NetworkTracker(page)
+    return tracker
+
+
+wait_telemetry = WaitTelemetry()
+
+# utils.async_runner flows overlap on another thread; each asyncio task gets its own telemetry
+# so their waits never feed (and overcount) the per-test wait_telemetry
+_flow_telemetry = contextvars.ContextVar("flow_telemetry", default=None)
+
+
+def start_flow_telemetry() -> WaitTelemetry:
+    """Fresh telemetry for the calling asyncio task (one async_runner flow)"""
+    telemetry = WaitTelemetry()
+    _flow_telemetry.set(telemetry)
+    return telemetry
+
+
+def flow_telemetry() -> WaitTelemetry:
+    """The running flow's telemetry (AsyncBasePage waits), started on first use outside a flow"""
+    return _flow_telemetry.get() or start_flow_telemetry()
@@ -0,0 +1,53 @@
+import time
+from dataclasses import dataclass, field
+
+from config import BASE_URL, CHECKPOINT_TTL
+
+
+@dataclass
+class Checkpoint:
+    """A wizard run parked server-side as a draft, plus the browser storage it was saved with"""
+
+    draft: str            # name of the server-side draft (e.g. the country name)
+    code: str
+    step: str             # first step the draft has not completed yet
+    storage_state: dict = field(default_factory=dict)
+    saved_at: float = field(default_factory=time.time)
+
+
+class CheckpointStore:
+    """Per-worker checkpoints keyed by wizard name ("country"), valid for one BASE_URL and CHECKPOINT_TTL.
+
+    Later-step tests resume the draft instead of replaying the wizard's shared prefix; the store
+    lives in memory for the session only, because the drafts it points at belong to this run and
+    the storage state it holds carries the login.
+    """
+
+    def __init__(self, ttl: int = CHECKPOINT_TTL):
+        self.ttl = ttl
+        self._checkpoints = {}
+
+    def get(self, key: str):
+        checkpoint = self._checkpoints.get((BASE_URL, key))
+        if checkpoint is not None and time.time() - checkpoint.saved_at > self.ttl:
+            self.invalidate(key)
+            return None
+        return checkpoint
+
+    def save(self, key: str, page, draft: str, code: str, step: str) -> Checkpoint:
+        """Snapshot the page's context storage next to the draft it has open"""
+        checkpoint = Checkpoint(draft, code, step, page.context.storage_state())
+        self._checkpoints[(BASE_URL, key)] = checkpoint
+        return checkpoint
+
+    def advance(self, key: str, step: str):
+        """Record that the draft has moved on to step"""
+        checkpoint = self._checkpoints.get((BASE_URL, key))
+        if checkpoint is not None:
+            checkpoint.step = step
+
+    def invalidate(self, key: str):
+        self._checkpoints.pop((BASE_URL, key), None)
+
+
+wizard_checkpoints = CheckpointStore()